@@ -1,4 +1,5 @@
 import asyncio
+from collections.abc import Coroutine
 from pathlib import Path
 from typing import Annotated, Any
 
@@ -18,6 +19,19 @@ from rich.table import Table
 from .chat.session import ChatSession
 from .utils import RichWorkflowRenderer
 
+try:
+    # Pulled in by uvicorn[standard]; not available on Windows
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
+def run_async(main: Coroutine[Any, Any, Any]) -> Any:
+    """Run a coroutine on uvloop when installed, the default asyncio loop otherwise."""
+    if uvloop is not None:
+        return uvloop.run(main)
+    return asyncio.run(main)
+
 
 class GenesisCLI:
     def __init__(
@@ -124,7 +138,7 @@ class GenesisCLI:
             # Validation and TypeAdapter conversion happen inside engine.run()
             print(f"Starting workflow: {manifest.name}")
             try:
-                asyncio.run(self.engine.run(manifest, final_inputs, [renderer]))
+                run_async(self.engine.run(manifest, final_inputs, [renderer]))
             except Exception as e:
                 print(f"Execution failed: {e}")
                 raise typer.Exit(1) from e
@@ -177,7 +191,7 @@ class GenesisCLI:
 
             session = ChatSession(agent, self._console)
 
-            asyncio.run(session.start())
+            run_async(session.start())
 
     def _print_workflow_help(self, manifest):
         """Standard output for workflow-specific options."""
@@ -6,7 +6,7 @@ from pathlib import Path
 from typing import Any, Literal
 from zoneinfo import ZoneInfo
 
-from myproject_tools.pdf import convert_pdf_to_markdown
+from myproject_tools.pdf import convert_pdf_to_markdown_async
 from myproject_tools.registry import tool_registry
 from myproject_tools.schema import ToolResult
 
@@ -422,8 +422,7 @@ class Agent:
 
         # 1. Handle Known Non-Text Formats first
         if extension == ".pdf":
-            return await asyncio.to_thread(
-                convert_pdf_to_markdown,
+            return await convert_pdf_to_markdown_async(
                 pdf_path=logical_path,
                 prune_references=True,
             )
@@ -20,6 +20,7 @@ class AgentRegistry:
         self.agent_search_paths = settings.path.agent_search_paths
         # Store CONFIGS (blueprints), not INSTANCES
         self.blueprints: dict[str, AgentConfig] = {}
+        self._agent_types: frozenset[str] = frozenset()
         self.load_all()
 
     def load_all(self):
@@ -47,6 +48,8 @@ class AgentRegistry:
                     logger.error("Error loading %s: %s", md_file.name, e, exc_info=True)
                     continue  # Continue so that it does not break init step if user accidentally write a bad agent
 
+        self._agent_types = frozenset(self.blueprints)
+
     def add_agent(self, agent_data: dict) -> str:
         """Persists a new agent to the user's local agent directory.
         Returns the agent_id (filename stem).
@@ -183,8 +186,9 @@ class AgentRegistry:
             clipboard_item_ttl=clipboard_item_ttl,
         )
 
-    def get_all_agent_types(self):
-        return self.blueprints.keys()
+    def get_all_agent_types(self) -> frozenset[str]:
+        """Agent ids of all loaded blueprints, rebuilt whenever the registry reloads."""
+        return self._agent_types
 
     def _get_llm_model_config(self, model_name: str | None = None) -> tuple[LLMModelConfig, LLMProvider]:
         if not model_name or model_name not in self.settings.models.keys():
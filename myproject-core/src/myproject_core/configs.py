@@ -69,6 +69,8 @@ class ServerConfig(BaseModel):
     admin_username: str | None = None
     admin_password: str | None = None
     admin_email: str | None = None
+    # Max buffered SSE events per workflow job; the oldest are dropped beyond this
+    job_stream_maxsize: int = 256
 
 
 class DatabaseConfig(BaseModel):
@@ -76,6 +78,11 @@ class DatabaseConfig(BaseModel):
     db_name: str = "myproject.db"
     echo_sql: bool = False
     db_directory: Path = Field(default_factory=lambda: Path.cwd() / ".myproject" / "database")
+    # Connection pool sizing for the server engine
+    pool_size: int = 20
+    max_overflow: int = 10
+    pool_pre_ping: bool = True
+    pool_recycle: int = 3600
 
     @computed_field
     @property
@@ -1,4 +1,9 @@
+import atexit
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+LOG_FORMAT = "[%(name)s] %(levelname)s: %(message)s"
 
 NOISY_LOGGERS = [
     "uvicorn",
@@ -18,11 +23,18 @@ def setup_logging(log_level="warning"):
         logging.getLogger(noisy_logger).setLevel(logging.WARNING)
 
     root_logger = logging.getLogger()
-    # Ensure basicConfig runs once (creates handler if missing)
+    # Ensure the handler is only installed once
     if not root_logger.handlers:
-        logging.basicConfig(
-            format="[%(name)s] %(levelname)s: %(message)s",
-        )
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+        # Log calls only enqueue the record; a listener thread writes to the stream
+        # so that logging from the event loop never blocks on terminal I/O
+        log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        root_logger.addHandler(QueueHandler(log_queue))
+        listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+        listener.start()
+        atexit.register(listener.stop)
 
     # Apply level to root
     root_logger.setLevel(log_level)
@@ -305,12 +305,11 @@ class LocalSandboxFilesystem(SandboxFilesystem):
         if not target.is_dir():
             return []
 
-        subdirs: set[str] = set()
-        for entry in target.iterdir():
-            if entry.is_dir():
-                rel = entry.relative_to(self._root)
-                subdirs.add(str(rel))
-        return sorted(subdirs)
+        # scandir's DirEntry.is_dir() reuses the d_type from the directory read,
+        # so no per-entry stat or Path construction is needed
+        prefix = "" if target == self._root else f"{target.relative_to(self._root)}{os.sep}"
+        with os.scandir(target) as entries:
+            return sorted(prefix + entry.name for entry in entries if entry.is_dir())
 
     def delete_directory(self, relative_path: str) -> None:
         path = self._resolve(relative_path)
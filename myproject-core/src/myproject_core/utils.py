@@ -1,3 +1,4 @@
+import functools
 import re
 import unicodedata
 from pathlib import Path
@@ -64,15 +65,21 @@ def evaluate_condition(condition_str: str, state: dict) -> bool:
         return False  # Fail safe: skip the step if the condition is broken
 
 
+_SLUG_STRIP_RE = re.compile(r"[^\w\s-]")
+_SLUG_HYPHENATE_RE = re.compile(r"[-\s]+")
+
+
+@functools.lru_cache(maxsize=1024)
 def slugify(text: str) -> str:
     """Transforms user input into a filesystem-safe string.
     'My Project!!' -> 'my-project'
+    Memoized because schedulers re-fire the same workflow names repeatedly.
     """
     # Normalize unicode (removes accents)
     text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii")
     # Remove non-word characters and replace spaces/underscores with hyphens
-    text = re.sub(r"[^\w\s-]", "", text).lower()
-    text = re.sub(r"[-\s]+", "-", text).strip("-")
+    text = _SLUG_STRIP_RE.sub("", text).lower()
+    text = _SLUG_HYPHENATE_RE.sub("-", text).strip("-")
     # Limit length to keep paths manageable
     return text[:64] or "untitled-job"
 
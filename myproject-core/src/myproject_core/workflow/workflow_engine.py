@@ -1,5 +1,6 @@
 import asyncio
 import inspect
+from collections.abc import Sequence
 from pathlib import Path
 from typing import Any
 
@@ -31,14 +32,14 @@ class WorkflowEngine:
         self,
         manifest: WorkflowManifest,
         user_inputs: dict[str, Any],
-        step_callbacks: list[WorkflowCallback] | None = None,
+        step_callbacks: Sequence[WorkflowCallback] | None = None,
     ) -> WorkflowOutput:
         """Executes a validated workflow manifest."""
         # Validate runtime input from user. Throw if validation fails
         validated_inputs = manifest.validate_runtime_inputs(user_inputs)
 
         # Initialize Workspace/Job
-        job_context = self.workspace_manager.create_job(manifest.name)
+        job_context = await self.workspace_manager.create_job_async(manifest.name)
 
         # Initialize the "Blackboard" State
         state = {"inputs": validated_inputs, "steps": {}}
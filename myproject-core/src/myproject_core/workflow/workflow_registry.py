@@ -1,3 +1,5 @@
+from pathlib import Path
+
 import jinja2
 
 from ..configs import Config, get_config
@@ -5,6 +7,10 @@ from ..schemas import WorkflowManifest
 from ..utils import resolve_placeholders
 from ..workflow_tasks.registry import TASK_LIBRARY
 
+# Validated manifests keyed by file path, reused while the file's (mtime_ns, size) is unchanged.
+# The server builds a registry per request, so this skips re-parsing and re-validating every YAML.
+_manifest_cache: dict[Path, tuple[int, int, WorkflowManifest]] = {}
+
 
 class WorkflowRegistry:
     def __init__(self, settings: Config):
@@ -20,11 +26,17 @@ class WorkflowRegistry:
 
             for yaml_file in workflow_dir.glob("*.yaml"):
                 try:
-                    # 1. Basic Pydantic validation
-                    manifest = WorkflowManifest.from_yaml(yaml_file)
-
-                    # 2. Step Type validation
-                    self._verify_logic(manifest)
+                    stat = yaml_file.stat()
+                    cached = _manifest_cache.get(yaml_file)
+                    if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+                        manifest = cached[2]
+                    else:
+                        # 1. Basic Pydantic validation
+                        manifest = WorkflowManifest.from_yaml(yaml_file)
+
+                        # 2. Step Type validation
+                        self._verify_logic(manifest)
+                        _manifest_cache[yaml_file] = (stat.st_mtime_ns, stat.st_size, manifest)
 
                     # 3. Register using the filename (stem) as the ID
                     self.workflows[yaml_file.stem] = manifest
@@ -1,3 +1,4 @@
+import asyncio
 from datetime import datetime
 from pathlib import Path
 
@@ -40,11 +41,19 @@ class WorkspaceManager:
         (job_path / "output").mkdir()
 
         # Optional: Save original name to internal metadata for UI display
-        with open(job_path / "internal" / "meta.txt", "w") as f:
-            f.write(f"Original Name: {name}\nCreated: {datetime.now().isoformat()}")
+        (job_path / "internal" / "meta.txt").write_text(
+            f"Original Name: {name}\nCreated: {datetime.now().isoformat()}",
+        )
 
         return JobContext(job_path)
 
+    async def create_job_async(self, name: str) -> JobContext:
+        """Async variant of create_job for callers running on the event loop.
+        The mkdir/write syscalls run in a worker thread so that a burst of job
+        creations (e.g. scheduler fan-out) does not stall other coroutines.
+        """
+        return await asyncio.to_thread(self.create_job, name)
+
 
 def main():
     settings = get_config()
@@ -1,9 +1,8 @@
-import asyncio
 import shutil
 from pathlib import Path
 
 # Assuming the utility is located here based on your description
-from myproject_tools.pdf import convert_pdf_to_markdown
+from myproject_tools.pdf import convert_pdf_to_markdown_async
 
 from ..agent.agent_registry import AgentRegistry
 from ..schemas import JobContext
@@ -77,14 +76,11 @@ class IngestTask(BaseTask[IngestTaskParams, IngestTaskOutput]):
                     readable_paths.append(dest_path)
 
                 elif suffix == ".pdf":
-                    # Run PDF conversion in a thread to avoid blocking the event loop
+                    # Run PDF conversion in a worker process to avoid blocking the event loop
                     md_filename = dest_path.stem + ".md"
                     md_dest_path = target_dir / md_filename
 
-                    # Call your conversion utility
-                    # We wrap it in to_thread because pymupdf is synchronous
-                    await asyncio.to_thread(
-                        convert_pdf_to_markdown,
+                    await convert_pdf_to_markdown_async(
                         pdf_path=dest_path,
                         output_dir=target_dir,
                         prune_references=args.prune_references,
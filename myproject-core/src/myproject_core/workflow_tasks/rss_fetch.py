@@ -1,9 +1,8 @@
-import asyncio
 import re
 from pathlib import Path
 from typing import Any
 
-from myproject_tools.rss_utils import fetch_single_rss
+from myproject_tools.rss_utils import fetch_many_rss
 
 from ..agent.agent_registry import AgentRegistry
 from ..schemas import JobContext
@@ -25,12 +24,7 @@ class RSSFetchTask(BaseTask[RSSFetchTaskParams, TaskOutput]):
         args = self.params_model.model_validate(params)
 
         # 1. Fetch entries in parallel
-        fetch_tasks = [asyncio.to_thread(fetch_single_rss, url, args.since_days) for url in args.feed_urls]
-
-        results: list[list[dict[str, Any]] | BaseException] = await asyncio.gather(
-            *fetch_tasks,
-            return_exceptions=True,
-        )
+        results = await fetch_many_rss(args.feed_urls, since_days=args.since_days)
 
         all_entries: list[dict[str, Any]] = []
         for i, result in enumerate(results):
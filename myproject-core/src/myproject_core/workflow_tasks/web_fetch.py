@@ -23,7 +23,7 @@ class WebFetchTask(BaseTask[WebFetchTaskParams, TaskOutput]):
         args = self.params_model.model_validate(params)
 
         # 1. Fetch all pages in parallel
-        # This uses the fetch_page utility which already handles to_thread
+        # The fetches share the module's client and its connection pool
         fetch_tasks = [fetch_page(url) for url in args.urls]
         results = await asyncio.gather(*fetch_tasks)
 
@@ -1,4 +1,5 @@
 import asyncio
+import logging
 from typing import Any
 
 from myproject_tools.web_search import search_web
@@ -7,6 +8,11 @@ from ..agent.agent_registry import AgentRegistry
 from ..schemas import JobContext
 from .base_task import BaseTask, TaskOutput, TaskParams
 
+logger = logging.getLogger(__name__)
+
+# Markdown block written for each search result
+MD_ENTRY_TEMPLATE = "# {title}\n**Source URL:** {url}\n**Search Query:** {query}\n\n{body}\n\n---\n"
+
 
 class WebSearchTaskParams(TaskParams):
     query: list[str]
@@ -49,7 +55,7 @@ class WebSearchTask(BaseTask[WebSearchTaskParams, WebSearchTaskOutput]):
 
         for i, result in enumerate(search_results_lists):
             if isinstance(result, BaseException):
-                print(f"Error searching for query '{args.query[i]}': {result}")
+                logger.warning("Search failed for query '%s': %s", args.query[i], result)
                 continue
 
             for res in result:
@@ -58,16 +64,12 @@ class WebSearchTask(BaseTask[WebSearchTaskParams, WebSearchTaskOutput]):
                     continue
                 seen_urls.add(res.url)
 
-                # Extract content (Prefer full content over snippet)
-                main_body = res.full_content or res.snippet
-
-                # Create a clean Markdown block
-                md_entry = (
-                    f"# {res.title}\n"
-                    f"**Source URL:** {res.url}\n"
-                    f"**Search Query:** {args.query[i]}\n\n"
-                    f"{main_body}\n\n"
-                    f"---\n"
+                # Create a clean Markdown block (prefer full content over snippet)
+                md_entry = MD_ENTRY_TEMPLATE.format(
+                    title=res.title,
+                    url=res.url,
+                    query=args.query[i],
+                    body=res.full_content or res.snippet,
                 )
                 formatted_contents.append(md_entry)
 
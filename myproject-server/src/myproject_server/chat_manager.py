@@ -1,4 +1,5 @@
 import asyncio
+import json
 from typing import Any
 
 
@@ -8,6 +9,8 @@ class ActiveRun:
         # Index 0 is always the User input
         self.messages: list[dict[str, Any]] = [{"role": "user", "content": user_input}]
         self.clients: list[asyncio.Queue] = []
+        # Serialized catchup frame, reset whenever messages change
+        self._catchup_message: str | None = None
 
     def _get_or_create_assistant_message_index(self) -> int:
         """Returns the index of the current assistant message.
@@ -22,29 +25,33 @@ class ActiveRun:
 
     async def _broadcast(self, event: str, data: Any, index: int | None = None):
         payload = {
-            "event": event,
             "data": data,
             "index": index,  # The frontend uses this to target the right message
         }
+        # Serialize once into a ready-to-send SSE frame shared by every client
+        message = f"event: {event}\ndata: {json.dumps(payload)}\n\n"
         for q in self.clients:
-            await q.put(payload)
+            await q.put(message)
 
     # --- Callbacks ---
 
     async def handle_reasoning(self, chunk: str):
         idx = self._get_or_create_assistant_message_index()
         self.messages[idx]["reasoning_content"] += chunk
+        self._catchup_message = None
         await self._broadcast("reasoning", chunk, index=idx)
 
     async def handle_content(self, chunk: str):
         idx = self._get_or_create_assistant_message_index()
         self.messages[idx]["content"] += chunk
+        self._catchup_message = None
         await self._broadcast("content", chunk, index=idx)
 
     async def handle_tool_start(self, name: str, args: dict):
         idx = self._get_or_create_assistant_message_index()
         tool_call = {"name": name, "args": args, "status": "running"}
         self.messages[idx]["tool_calls"].append(tool_call)
+        self._catchup_message = None
 
         # We broadcast the tool_start for the UI to show a "Loading" state
         # We include the index of the assistant message that owns this tool call
@@ -64,6 +71,7 @@ class ActiveRun:
         tool_msg = {"role": "tool", "name": name, "content": args.get("result", "")}
         self.messages.append(tool_msg)
         new_idx = len(self.messages) - 1
+        self._catchup_message = None
 
         # 3. Broadcast. The frontend sees a new index and knows it's a tool result message.
         await self._broadcast("tool_result", tool_msg, index=new_idx)
@@ -76,8 +84,16 @@ class ActiveRun:
         """Broadcast clipboard markdown snapshot to all SSE clients after agent step."""
         await self._broadcast("clipboard", {"clipboard_md": clipboard_md})
 
-    def add_client(self) -> asyncio.Queue:
-        q = asyncio.Queue()
+    def catchup_message(self) -> str:
+        """SSE frame with all interim messages, serialized once per change rather than per client."""
+        if self._catchup_message is None:
+            self._catchup_message = (
+                f"event: catchup\ndata: {json.dumps({'interim_messages': self.messages})}\n\n"
+            )
+        return self._catchup_message
+
+    def add_client(self) -> asyncio.Queue[str | None]:
+        q: asyncio.Queue[str | None] = asyncio.Queue()
         self.clients.append(q)
         return q
 
@@ -1,21 +1,47 @@
+import logging
 from contextlib import contextmanager
 
 from myproject_core.configs import get_config
+from sqlalchemy import JSON, column, event, inspect, update
+from sqlalchemy import table as table_clause
 from sqlmodel import Session, SQLModel, create_engine, select
 
 from .models.user import User
+from .models.workflow_job import WorkflowStepEvent
+
+logger = logging.getLogger(__name__)
 
 # We can use this settings object because it is the server-wide config
 settings = get_config()
 
 # SQLite specific: check_same_thread=False is needed for FastAPI's concurrency
-connect_args = {"check_same_thread": False} if "sqlite" in str(settings.db.connection_string) else {}
+is_sqlite = "sqlite" in str(settings.db.connection_string)
+connect_args = {"check_same_thread": False} if is_sqlite else {}
 
 engine = create_engine(
-    str(settings.db.connection_string), echo=settings.db.echo_sql, connect_args=connect_args,
+    str(settings.db.connection_string),
+    echo=settings.db.echo_sql,
+    connect_args=connect_args,
+    pool_size=settings.db.pool_size,
+    max_overflow=settings.db.max_overflow,
+    pool_pre_ping=settings.db.pool_pre_ping,
+    pool_recycle=settings.db.pool_recycle,
 )
 
 
+if is_sqlite:
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        """WAL lets the scheduler and background jobs commit without blocking request readers.
+        With WAL, synchronous=NORMAL is still safe against corruption and skips an fsync per commit.
+        """
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.close()
+
+
 def seed_admin_user(session: Session):
     """Injects the initial admin user if configured and missing."""
     admin_username = settings.server.admin_username
@@ -30,7 +56,7 @@ def seed_admin_user(session: Session):
     existing_admin = session.exec(statement).first()
 
     if not existing_admin:
-        print(f"Creating initial admin account: {admin_username}...")
+        logger.info("Creating initial admin account: %s", admin_username)
 
         # Import here to avoid top-level circular dependency
         from myproject_server.auth.security import get_password_hash
@@ -43,16 +69,58 @@ def seed_admin_user(session: Session):
         )
         session.add(new_admin)
         session.commit()
-        print("Admin account created successfully.")
+        logger.info("Admin account created successfully")
     else:
         # Account exists, do nothing
         pass
 
 
+# The step_status JSON column that WorkflowJob used before step events got their own table.
+# Databases created back then still have it, so it is declared here for the one-off backfill
+_legacy_job_table = table_clause(
+    "workflowjob",
+    column("id"),
+    column("step_status", JSON(none_as_null=True)),
+)
+
+
+def backfill_step_events(session: Session) -> None:
+    """Copies step statuses from the legacy step_status column into WorkflowStepEvent rows.
+    The column is cleared in the same transaction, so each job is copied exactly once.
+    """
+    columns = inspect(session.connection()).get_columns("workflowjob")
+    if not any(c["name"] == "step_status" for c in columns):
+        return
+
+    rows = session.exec(
+        select(_legacy_job_table.c.id, _legacy_job_table.c.step_status).where(
+            _legacy_job_table.c.step_status.is_not(None),
+        ),
+    ).all()
+    if not rows:
+        return
+
+    events = [
+        WorkflowStepEvent(job_id=job_id, step_id=step_id, status=status)
+        for job_id, step_status in rows
+        for step_id, status in (step_status or {}).items()
+    ]
+
+    logger.info("Backfilling %d step events from %d legacy jobs", len(events), len(rows))
+    session.add_all(events)
+    session.exec(
+        update(_legacy_job_table)
+        .where(_legacy_job_table.c.id.in_([job_id for job_id, _ in rows]))
+        .values(step_status=None),
+    )
+    session.commit()
+
+
 def init_db():
     """Initializes the database.
     1. Validates connection (especially for Postgres).
     2. Creates tables if they don't exist (SQLite).
+    3. Copies step statuses from the legacy step_status column into the event table.
     """
     try:
         # Double-check directory existence here just in case settings were changed
@@ -61,24 +129,34 @@ def init_db():
         # This creates the .db file and tables if missing
         SQLModel.metadata.create_all(engine)
 
-        # Seed admin user
+        # create_all skips tables that already exist, so add indexes introduced since
+        for table in SQLModel.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(engine, checkfirst=True)
+
         with Session(engine) as session:
+            backfill_step_events(session)
+            # Seed admin user
             seed_admin_user(session)
 
-        print("Database initialized successfully.")
+        logger.info("Database initialized successfully")
     except Exception as e:
-        print(f"Database initialization failed: {e}")
+        logger.error("Database initialization failed: %s", e, exc_info=True)
         raise e
 
 
 @contextmanager
 def get_session_context():
     """Context manager for background tasks or scripts."""
-    with Session(engine) as session:
+    with Session(engine, expire_on_commit=False) as session:
         yield session
 
 
 def get_session():
-    """Dependency for FastAPI routes"""
-    with Session(engine) as session:
+    """Dependency for FastAPI routes.
+
+    Objects keep their loaded state after commit, so returning a just-written row does not
+    trigger a reload SELECT. All column defaults are set client-side, so nothing goes stale.
+    """
+    with Session(engine, expire_on_commit=False) as session:
         yield session
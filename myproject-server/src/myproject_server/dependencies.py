@@ -1,7 +1,7 @@
+from collections import OrderedDict
 from pathlib import Path
 from typing import Annotated
 
-import jwt
 from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from jwt.exceptions import InvalidTokenError
@@ -14,10 +14,12 @@ from myproject_core.workflow.workflow_registry import WorkflowRegistry
 from myproject_core.workflow.workflow_workspace import WorkspaceManager
 from sqlmodel import Session, select
 
+from .auth.security import decode_token
 from .database import get_session
 from .models.user import User
 from .scheduler import SchedulerManager
 from .schemas.auth import TokenData
+from .sse_channel import SSEChannel
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
 
@@ -31,7 +33,6 @@ async def get_server_settings() -> Config:
 async def get_current_user(
     session: Annotated[Session, Depends(get_session)],
     token: Annotated[str, Depends(oauth2_scheme)],
-    settings: Annotated[Config, Depends(get_server_settings)],
 ) -> User:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -39,16 +40,12 @@ async def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
     try:
-        print(token)
-        print(settings.server.jwt_secret_key)
-        print(settings.server.algorithm)
-        payload = jwt.decode(token, settings.server.jwt_secret_key, algorithms=[settings.server.algorithm])
+        payload = decode_token(token)
         if not payload.get("sub"):
             raise credentials_exception
         username: str = str(payload.get("sub"))
         token_data = TokenData(username=username)
     except InvalidTokenError as exc:
-        print("InvalidTokenError encountered")
         raise credentials_exception from exc
 
     # Query the actual database
@@ -71,6 +68,29 @@ async def get_current_active_user(
 # --- User Isolation Logic ---
 
 
+# Per-user directories this process has created, most recently used last. Bounded so a server
+# with many users does not keep one entry per user forever
+KNOWN_DIRS_MAXSIZE = 1024
+_known_dirs: OrderedDict[Path, None] = OrderedDict()
+
+
+def _ensure_dir(path: Path) -> Path:
+    """Create a per-user directory, skipping mkdir for one this process already created.
+    A known directory is still stat'ed, so one removed since is created again.
+    """
+    if path in _known_dirs:
+        if path.is_dir():
+            _known_dirs.move_to_end(path)
+            return path
+        # The directory was removed since; create it again
+        del _known_dirs[path]
+    path.mkdir(parents=True, exist_ok=True)
+    _known_dirs[path] = None
+    if len(_known_dirs) > KNOWN_DIRS_MAXSIZE:
+        _known_dirs.popitem(last=False)
+    return path
+
+
 async def get_user_workdir(
     current_user: Annotated[User, Depends(get_current_active_user)],
     settings: Annotated[Config, Depends(get_server_settings)],
@@ -82,9 +102,7 @@ async def get_user_workdir(
     base_user_dir = settings.path.server_users_directory
 
     # We use user.id (or username) to create a unique sub-folder
-    user_path = base_user_dir / str(current_user.id)
-    user_path.mkdir(parents=True, exist_ok=True)
-    return user_path
+    return _ensure_dir(base_user_dir / str(current_user.id))
 
 
 async def get_user_config(
@@ -110,9 +128,7 @@ async def get_user_inbox_path(
     """
     # Use user working directory as the inbox
     # The reason I did not rename get_user_inbox_path is because I don't want to deal with random breaking across the server code
-    inbox_path = user_config.path.working_directory
-    inbox_path.mkdir(parents=True, exist_ok=True)
-    return inbox_path
+    return _ensure_dir(user_config.path.working_directory)
 
 
 def get_productivity_session(
@@ -165,6 +181,17 @@ async def get_scheduler_manager(request: Request) -> SchedulerManager:
     return request.app.state.scheduler
 
 
+# SSE channels of running workflow jobs: {(user_id, job_id): SSEChannel}
+JobStreams = dict[tuple[int, int], SSEChannel]
+
+
+async def get_job_streams(request: Request) -> JobStreams:
+    """SSE channels live in app.state, so they are scoped to this worker process.
+    A stream can only be read from the worker that accepted the job submission.
+    """
+    return request.app.state.job_streams
+
+
 # --- Updated Type Aliases for Clean Routers ---
 
 # Use these in your path operations for cleaner signatures
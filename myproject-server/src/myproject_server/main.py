@@ -43,6 +43,7 @@ async def lifespan(app: FastAPI):
 
     # Initialize other global state
     app.state.chat_manager = ChatManager()
+    app.state.job_streams = {}
 
     yield
 
@@ -1,7 +1,7 @@
 from datetime import UTC, datetime
 from typing import Any
 
-from sqlmodel import JSON, Column, Field, SQLModel
+from sqlmodel import JSON, Column, Field, Index, SQLModel
 
 
 class ChatSession(SQLModel, table=True):
@@ -21,6 +21,9 @@ class ChatSession(SQLModel, table=True):
 
 
 class ChatMessage(SQLModel, table=True):
+    # Serves chat history reads (WHERE session_id ORDER BY id)
+    __table_args__ = (Index("ix_chatmessage_session_id_id", "session_id", "id"),)
+
     id: int | None = Field(default=None, primary_key=True)
     session_id: int = Field(foreign_key="chatsession.id", index=True)
 
@@ -2,7 +2,7 @@ from datetime import UTC, datetime
 from enum import StrEnum
 from typing import TYPE_CHECKING, Any, Optional
 
-from sqlmodel import JSON, Column, Field, Relationship, SQLModel
+from sqlmodel import JSON, Column, Field, Index, Relationship, SQLModel
 
 if TYPE_CHECKING:
     from .user import User
@@ -24,9 +24,6 @@ class WorkflowJobBase(SQLModel):
     inputs: dict[str, Any] = Field(default_factory=dict, sa_column=Column(JSON))
     result: dict[str, Any] | None = Field(default=None, sa_column=Column(JSON))
 
-    # Keep the progress of steps
-    step_status: dict[str, str] = Field(default_factory=dict, sa_column=Column(JSON))
-
     error_message: str | None = None
     workspace_path: str | None = None  # Path provided by WorkspaceManager
 
@@ -35,9 +32,30 @@ class WorkflowJobBase(SQLModel):
 
 
 class WorkflowJob(WorkflowJobBase, table=True):
+    # Serves list_jobs (WHERE user_id ORDER BY created_at DESC); the index is scanned backwards
+    __table_args__ = (Index("ix_job_user_created", "user_id", "created_at"),)
+
     id: int | None = Field(default=None, primary_key=True)
 
     user_id: int = Field(foreign_key="user.id", index=True)
     user: "User" = Relationship()
-    schedule_id: int | None = Field(default=None, foreign_key="workflowschedule.id", nullable=True)
+    schedule_id: int | None = Field(
+        default=None,
+        foreign_key="workflowschedule.id",
+        nullable=True,
+        index=True,
+    )
     schedule: Optional["WorkflowSchedule"] = Relationship(back_populates="jobs")
+
+
+class WorkflowStepEvent(SQLModel, table=True):
+    """Append-only log of step status changes. The newest row of a step is its current status."""
+
+    # Serves reading a job's events in insertion order
+    __table_args__ = (Index("ix_stepevent_job_id_id", "job_id", "id"),)
+
+    id: int | None = Field(default=None, primary_key=True)
+    job_id: int = Field(foreign_key="workflowjob.id")
+    step_id: str
+    status: str
+    created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
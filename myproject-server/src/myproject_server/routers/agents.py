@@ -3,6 +3,7 @@ from typing import Annotated
 from fastapi import APIRouter, Depends, HTTPException, status
 from myproject_core.agent.agent_registry import AgentRegistry
 from myproject_core.configs import Config
+from myproject_core.schemas import AgentConfig
 
 from ..dependencies import get_agent_registry, get_user_config
 from ..schemas.agent import AgentCreate, AgentEdit, AgentRead
@@ -10,26 +11,28 @@ from ..schemas.agent import AgentCreate, AgentEdit, AgentRead
 router = APIRouter(prefix="/agents", tags=["agents"])
 
 
+def _to_agent_read(agent_id: str, blueprint: AgentConfig) -> AgentRead:
+    """Project a loaded blueprint onto the public AgentRead schema.
+    The blueprint was already validated as AgentConfig, so skip re-validating the same values.
+    """
+    return AgentRead.model_construct(
+        id=agent_id,
+        name=blueprint.name,
+        description=blueprint.description,
+        interactive=blueprint.interactive,
+        read_only=blueprint.read_only,
+        allowed_tools=blueprint.allowed_tools,
+        allowed_agents=blueprint.allowed_agents,
+        system_prompt=blueprint.system_prompt,
+        model_name=blueprint.model_name,
+        is_default=blueprint.is_default,
+    )
+
+
 @router.get("/", response_model=list[AgentRead])
 async def list_agents(agent_reg: Annotated[AgentRegistry, Depends(get_agent_registry)]):
     """Returns a list of all available agents blueprints."""
-    results = []
-    for id, blueprint in agent_reg.blueprints.items():
-        results.append(
-            AgentRead(
-                id=id,
-                name=blueprint.name,
-                description=blueprint.description,
-                interactive=blueprint.interactive,
-                read_only=blueprint.read_only,
-                allowed_tools=blueprint.allowed_tools,
-                allowed_agents=blueprint.allowed_agents,
-                system_prompt=blueprint.system_prompt,
-                model_name=blueprint.model_name,
-                is_default=blueprint.is_default,
-            ),
-        )
-    return results
+    return [_to_agent_read(agent_id, blueprint) for agent_id, blueprint in agent_reg.blueprints.items()]
 
 
 @router.post("/", response_model=AgentRead, status_code=status.HTTP_201_CREATED)
@@ -74,18 +77,7 @@ async def create_agent(
         if not blueprint:
             raise HTTPException(status_code=500, detail="Failed to reload agent after saving.")
 
-        return AgentRead(
-            id=agent_id,
-            name=blueprint.name,
-            description=blueprint.description,
-            interactive=blueprint.interactive,
-            read_only=blueprint.read_only,
-            allowed_tools=blueprint.allowed_tools,
-            allowed_agents=blueprint.allowed_agents,
-            system_prompt=blueprint.system_prompt,
-            model_name=blueprint.model_name,
-            is_default=blueprint.is_default,
-        )
+        return _to_agent_read(agent_id, blueprint)
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Could not create agent: {e!s}") from e
 
@@ -99,18 +91,7 @@ async def get_agent_details(
     if not blueprint:
         raise HTTPException(status_code=404, detail=f"Agent '{agent_id}' not found in registry.")
 
-    return AgentRead(
-        id=agent_id,
-        name=blueprint.name,
-        description=blueprint.description,
-        interactive=blueprint.interactive,
-        read_only=blueprint.read_only,
-        allowed_tools=blueprint.allowed_tools,
-        allowed_agents=blueprint.allowed_agents,
-        system_prompt=blueprint.system_prompt,
-        model_name=blueprint.model_name,
-        is_default=blueprint.is_default,
-    )
+    return _to_agent_read(agent_id, blueprint)
 
 
 @router.delete(
@@ -212,15 +193,4 @@ async def update_agent(
             detail="Failed to reload the updated agent from the registry.",
         )
 
-    return AgentRead(
-        id=agent_id,
-        name=blueprint.name,
-        description=blueprint.description,
-        interactive=blueprint.interactive,
-        read_only=blueprint.read_only,
-        allowed_tools=blueprint.allowed_tools,
-        allowed_agents=blueprint.allowed_agents,
-        system_prompt=blueprint.system_prompt,
-        model_name=blueprint.model_name,
-        is_default=blueprint.is_default,
-    )
+    return _to_agent_read(agent_id, blueprint)
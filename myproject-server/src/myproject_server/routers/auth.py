@@ -8,7 +8,14 @@ from sqlmodel import Session, select
 
 from myproject_server.dependencies import get_server_settings
 
-from ..auth.security import create_access_token, create_refresh_token, decode_token_payload, verify_password
+from ..auth.security import (
+    create_access_token,
+    create_refresh_token,
+    decode_token_payload,
+    get_password_hash,
+    password_needs_rehash,
+    verify_password,
+)
 from ..database import get_session
 from ..models.user import User
 from ..schemas.auth import Token
@@ -17,7 +24,7 @@ router = APIRouter(prefix="/auth", tags=["auth"])
 
 
 @router.post("/login")
-async def login_for_access_token(
+def login_for_access_token(
     form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
     session: Annotated[Session, Depends(get_session)],
     settings: Annotated[Config, Depends(get_server_settings)],
@@ -33,6 +40,12 @@ async def login_for_access_token(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    # Lazily move hashes made with older Argon2 parameters to the current ones
+    if password_needs_rehash(user.hashed_password):
+        user.hashed_password = get_password_hash(form_data.password)
+        session.add(user)
+        session.commit()
+
     access_token_expires = timedelta(minutes=settings.server.access_token_expire_minutes)
     access_token = create_access_token(subject=user.username, expires_delta=access_token_expires)
     refresh_token = create_refresh_token(subject=user.username, expires_delta=access_token_expires)
@@ -45,7 +58,7 @@ async def login_for_access_token(
 
 
 @router.post("/refresh")
-async def refresh_access_token(
+def refresh_access_token(
     session: Annotated[Session, Depends(get_session)],
     settings: Annotated[Config, Depends(get_server_settings)],
     refresh_token: str = Body(..., embed=True),
@@ -1,15 +1,15 @@
-import json
+import asyncio
 import logging
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Annotated
 
-from fastapi import APIRouter, BackgroundTasks, Body, Depends, HTTPException, Request
+from fastapi import APIRouter, BackgroundTasks, Body, Depends, HTTPException, Query, Request
 from fastapi.responses import StreamingResponse
 from myproject_core.agent.agent_memory import AgentMemory
 from myproject_core.agent.agent_registry import AgentRegistry
 from myproject_core.agent.clipboard import AgentClipboard
-from sqlmodel import Session, col, delete, select
+from sqlmodel import Session, col, delete, insert, select, update
 
 from ..chat_manager import ChatManager
 from ..database import get_session, get_session_context
@@ -21,10 +21,13 @@ from ..schemas.chat import ChatHistoryRead, ChatSessionCreate, ChatSessionRead
 router = APIRouter(prefix="/chats", tags=["chats"])
 logger = logging.getLogger(__name__)
 
+# Seconds between SSE comment pings on an idle chat stream
+SSE_KEEPALIVE_INTERVAL = 15.0
+
 
 # GET ALL CHAT SESSIONS
 @router.get("/", response_model=list[ChatSessionRead])
-async def list_sessions(
+def list_sessions(
     db: Annotated[Session, Depends(get_session)],
     user: Annotated[User, Depends(get_current_active_user)],
     agent_reg: Annotated[AgentRegistry, Depends(get_agent_registry)],
@@ -49,7 +52,7 @@ async def list_sessions(
 
 # 2. CREATE NEW SESSION
 @router.post("/", response_model=ChatSessionRead)
-async def create_session(
+def create_session(
     config: ChatSessionCreate,
     db: Annotated[Session, Depends(get_session)],
     user: Annotated[User, Depends(get_current_active_user)],
@@ -86,34 +89,51 @@ async def create_session(
         )
         db.add(db_msg)
 
+    # All columns have client-side defaults and the ID came from the flush, so build the
+    # response now; reading it after commit would reload the expired row with another SELECT
+    session_read = ChatSessionRead.model_validate(new_session)
+
     # 5. Commit all changes at once
     try:
         db.commit()
-        db.refresh(new_session)
     except Exception as e:
         db.rollback()
         raise HTTPException(status_code=500, detail=f"Failed to create session: {e!s}") from e
 
-    return new_session
+    return session_read
 
 
 # 3. GET SESSION HISTORY
 @router.get("/{session_id}", response_model=ChatHistoryRead)
-async def get_chat_history(
+def get_chat_history(
     session_id: int,
     db: Annotated[Session, Depends(get_session)],
     user: Annotated[User, Depends(get_current_active_user)],
     agent_reg: Annotated[AgentRegistry, Depends(get_agent_registry)],
     working_dir: Annotated[Path, Depends(get_user_inbox_path)],
+    offset: Annotated[int, Query(ge=0)] = 0,
+    limit: Annotated[int | None, Query(ge=1)] = None,
 ):
+    """Returns the session, its messages, and the context token usage.
+    Pass offset/limit to page through long histories; by default every message is returned.
+    Token usage covers the whole history, so it is only computed for the unpaged request;
+    a paged client gets it from the first full load and the stream's token_usage events.
+    """
     session = db.get(ChatSession, session_id)
     if not session or session.user_id != user.id:
         raise HTTPException(status_code=404)
 
     messages = db.exec(
-        select(ChatMessage).where(ChatMessage.session_id == session_id).order_by(col(ChatMessage.id).asc()),
+        select(ChatMessage)
+        .where(ChatMessage.session_id == session_id)
+        .order_by(col(ChatMessage.id).asc())
+        .offset(offset)
+        .limit(limit),
     ).all()
 
+    if offset != 0 or limit is not None:
+        return {"session": session, "messages": messages, "context_tokens": None}
+
     # Reconstruct memory to get token counts via agent's public interface
     memory_list = [m.payload for m in messages]
     clipboard = AgentClipboard.model_validate(session.clipboard_state) if session.clipboard_state else None
@@ -163,11 +183,14 @@ async def send_message(
         raise HTTPException(status_code=409, detail="Agent is currently processing a message.")
 
     # 3. Reconstruct AgentMemory
+    # Only the id and payload columns are needed, so skip building full ChatMessage instances
     past_messages = db.exec(
-        select(ChatMessage).where(ChatMessage.session_id == session_id).order_by(col(ChatMessage.id).asc()),
+        select(ChatMessage.id, ChatMessage.payload)
+        .where(ChatMessage.session_id == session_id)
+        .order_by(col(ChatMessage.id).asc()),
     ).all()
 
-    messages_list = [m.payload for m in past_messages]
+    messages_list = [payload for _, payload in past_messages]
     # If editing an existing user message (input_index < 0), truncate history
     if input_index is not None and input_index < 0:
         logger.debug(
@@ -175,18 +198,15 @@ async def send_message(
             session_id,
         )
 
-        # Build list of (index, record) pairs for user messages only
-        user_messages_with_records = [
-            (i, record) for i, record in enumerate(past_messages) if record.payload.get("role") == "user"
-        ]
-        user_indices = [i for i, _ in user_messages_with_records]
+        # Positions of user messages in the history
+        user_indices = [i for i, payload in enumerate(messages_list) if payload.get("role") == "user"]
 
         try:
             target_idx = user_indices[input_index]
         except IndexError:
             raise HTTPException(status_code=400, detail="Cannot edit: message index out of range") from None
 
-        target_record = past_messages[target_idx]
+        target_message_id = past_messages[target_idx][0]
 
         # Remove everything upto and including the user message to be edited
         messages_list = messages_list[:target_idx]
@@ -201,7 +221,7 @@ async def send_message(
         db.exec(
             delete(ChatMessage)
             .where(ChatMessage.session_id == session_id)  # type:ignore
-            .where(ChatMessage.id >= target_record.id)  # type:ignore
+            .where(ChatMessage.id >= target_message_id)  # type:ignore
         )
         db.flush()  # Ensure deletes are executed before continuing
         db.commit()
@@ -256,29 +276,25 @@ async def send_message(
             )
             # We need a fresh DB session for the background task
             with get_session_context() as bg_db:  # Assuming you have a context manager for DB
-                session_to_update = bg_db.get(ChatSession, session_id)
-                if session_to_update:
-                    past_messages = bg_db.exec(
-                        select(ChatMessage)
-                        .where(ChatMessage.session_id == session_id)
-                        .order_by(col(ChatMessage.id).asc()),
-                    ).all()
-
-                    logger.debug(
-                        "(Chat Session %s) Existing messages in database before writing:\n%s",
-                        session_id,
-                        past_messages,
+                now = datetime.now(UTC)
+                # Save clipboard, update timestamp, and unlock without loading the session row
+                result = bg_db.exec(
+                    update(ChatSession)
+                    .where(ChatSession.id == session_id)  # type:ignore
+                    .values(
+                        clipboard_state=agent.memory.agent_clipboard.model_dump(mode="json"),
+                        updated_at=now,
+                        is_running=False,
                     )
-
-                    # Save new messages
-                    for msg in new_messages:
-                        db_msg = ChatMessage(session_id=session_id, payload=msg)
-                        bg_db.add(db_msg)
-
-                    # Save clipboard, update timestamp, and unlock
-                    session_to_update.clipboard_state = agent.memory.agent_clipboard.model_dump(mode="json")
-                    session_to_update.updated_at = datetime.now(UTC)
-                    session_to_update.is_running = False
+                )
+                if result.rowcount:
+                    # Save new messages in a single executemany round trip
+                    if new_messages:
+                        rows = [
+                            {"session_id": session_id, "payload": msg, "created_at": now}
+                            for msg in new_messages
+                        ]
+                        bg_db.exec(insert(ChatMessage), params=rows)
                     bg_db.commit()
 
                     logger.debug(
@@ -338,19 +354,25 @@ async def stream_chat(
         try:
             # 1. Send the CATCHUP payload
             # This contains all messages (User, Assistant, Tool) produced in THIS step
-            yield f"event: catchup\ndata: {json.dumps({'interim_messages': active_run.messages})}\n\n"
+            yield active_run.catchup_message()
 
             # 2. Live stream subsequent chunks
             while True:
                 if await request.is_disconnected():
                     break
 
-                item = await client_queue.get()
-                if item is None:
+                # Wake up periodically even when the run is quiet, so a client that went
+                # away is noticed and its queue released instead of waiting for the next event
+                try:
+                    # Items are SSE frames already serialized by ActiveRun._broadcast
+                    message = await asyncio.wait_for(client_queue.get(), timeout=SSE_KEEPALIVE_INTERVAL)
+                except TimeoutError:
+                    yield ": ping\n\n"
+                    continue
+                if message is None:
                     break
 
-                payload = {"data": item["data"], "index": item.get("index")}
-                yield f"event: {item['event']}\ndata: {json.dumps(payload)}\n\n"
+                yield message
         finally:
             active_run.remove_client(client_queue)
 
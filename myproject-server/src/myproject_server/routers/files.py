@@ -1,12 +1,12 @@
+import asyncio
 import mimetypes
 import os
-import shutil
+import stat
 from base64 import urlsafe_b64decode, urlsafe_b64encode
 from pathlib import Path
-from typing import Annotated
+from typing import Annotated, BinaryIO
 
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, status
-from fastapi.responses import FileResponse
 from myproject_core.sandbox_filesystem.sandbox_filesystem import LocalSandboxFilesystem
 
 from ..dependencies import get_current_active_user, get_user_workdir
@@ -18,9 +18,12 @@ from ..schemas.file_record import (
     FileUploadResponse,
     SandboxFileRead,
 )
+from ..utils.files import DownloadFileResponse
 
 router = APIRouter(prefix="/files", tags=["files"])
 
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
 
 def _encode_file_id(relative_path: str) -> str:
     """Encode a relative path to a URL-safe base64 string."""
@@ -39,6 +42,21 @@ def _get_sandbox_filesystem(user_workdir: Path):
     return LocalSandboxFilesystem(user_workdir)
 
 
+def _write_upload(source: BinaryIO, dest_path: Path) -> tuple[int, float]:
+    """Copy an uploaded file to disk in chunks.
+    Returns the number of bytes written and the file's mtime, read from the open file.
+    """
+    size = 0
+    with dest_path.open("wb") as buffer:
+        while chunk := source.read(UPLOAD_CHUNK_SIZE):
+            buffer.write(chunk)
+            size += len(chunk)
+        # Flush first so the last buffered write is reflected in the mtime
+        buffer.flush()
+        mtime = os.fstat(buffer.fileno()).st_mtime
+    return size, mtime
+
+
 def _file_info_to_read(file_info) -> SandboxFileRead:
     """Convert a SandboxFileInfo dataclass to a SandboxFileRead Pydantic model."""
     return SandboxFileRead(
@@ -74,20 +92,19 @@ async def upload_file(
     logical_folder = Path(subfolder)
     target_dir = (user_workdir / logical_folder).resolve()
 
-    if not str(target_dir).startswith(str(user_workdir.resolve())):
+    # Compare path components, not string prefixes, so /users/1 does not admit /users/10
+    if not target_dir.is_relative_to(user_workdir.resolve()):
         raise HTTPException(status_code=403, detail="Traversal attempt detected")
 
     target_dir.mkdir(parents=True, exist_ok=True)
     safe_filename = os.path.basename(file.filename)
     dest_path = target_dir / safe_filename
 
-    # Write file to disk
-    with dest_path.open("wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
+    # Write file to disk in a worker thread so large uploads don't block the event loop
+    size, mtime = await asyncio.to_thread(_write_upload, file.file, dest_path)
 
     # Calculate relative path for response
     relative_path = str(dest_path.relative_to(user_workdir))
-    stats = dest_path.stat()
 
     from myproject_core.schemas import SandboxFileInfo
 
@@ -95,18 +112,18 @@ async def upload_file(
         relative_path=relative_path,
         name=dest_path.name,
         is_dir=False,
-        size=stats.st_size,
+        size=size,
         mime_type=file.content_type
         or mimetypes.guess_type(dest_path.name)[0]
         or "application/octet-stream",
-        mtime=stats.st_mtime,
+        mtime=mtime,
     )
 
     return FileUploadResponse(message="File uploaded successfully", file=_file_info_to_read(file_info))
 
 
 @router.get("/", response_model=list[FileUploadResponse])
-async def list_files(
+def list_files(
     user: Annotated[User, Depends(get_current_active_user)],
     user_workdir: Annotated[Path, Depends(get_user_workdir)],
     folder: str = ".",
@@ -129,7 +146,7 @@ async def list_files(
 
 
 @router.get("/folders", response_model=list[str])
-async def list_subfolders(
+def list_subfolders(
     user: Annotated[User, Depends(get_current_active_user)],
     user_workdir: Annotated[Path, Depends(get_user_workdir)],
     parent_folder: str = ".",
@@ -144,7 +161,7 @@ async def list_subfolders(
 
 
 @router.post("/folders", response_model=SandboxFileRead)
-async def create_folder(
+def create_folder(
     request: CreateFolderRequest,
     user: Annotated[User, Depends(get_current_active_user)],
     user_workdir: Annotated[Path, Depends(get_user_workdir)],
@@ -165,7 +182,7 @@ async def create_folder(
 
 
 @router.get("/{file_id}", response_model=FileUploadResponse)
-async def get_file(
+def get_file(
     file_id: str,
     user: Annotated[User, Depends(get_current_active_user)],
     user_workdir: Annotated[Path, Depends(get_user_workdir)],
@@ -192,7 +209,7 @@ async def get_file(
 
 
 @router.get("/{file_id}/content")
-async def get_file_content(
+def get_file_content(
     file_id: str,
     user: Annotated[User, Depends(get_current_active_user)],
     user_workdir: Annotated[Path, Depends(get_user_workdir)],
@@ -220,7 +237,7 @@ async def get_file_content(
 
 
 @router.get("/{file_id}/download")
-async def download_file(
+def download_file(
     file_id: str,
     user: Annotated[User, Depends(get_current_active_user)],
     user_workdir: Annotated[Path, Depends(get_user_workdir)],
@@ -240,13 +257,19 @@ async def download_file(
 
     full_path = user_workdir / relative_path
 
-    if not full_path.exists():
+    # One stat serves both the existence check and FileResponse's headers
+    try:
+        stat_result = full_path.stat()
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="File missing on disk") from None
+    if not stat.S_ISREG(stat_result.st_mode):
         raise HTTPException(status_code=404, detail="File missing on disk")
 
-    return FileResponse(
+    return DownloadFileResponse(
         path=full_path,
         filename=file_info.name,
         media_type=file_info.mime_type or "application/octet-stream",
+        stat_result=stat_result,
     )
 
 
@@ -265,7 +288,8 @@ async def delete_file(
     fs = _get_sandbox_filesystem(user_workdir)
 
     try:
-        fs.delete_file(relative_path)
+        # exists/is_file/unlink are blocking syscalls, keep them off the event loop
+        await asyncio.to_thread(fs.delete_file, relative_path)
     except FileNotFoundError:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="File not found") from None
     except ValueError as e:
@@ -273,7 +297,7 @@ async def delete_file(
 
 
 @router.post("/move", response_model=FileMoveResponse)
-async def move_files(
+def move_files(
     request: FileMoveRequest,
     user: Annotated[User, Depends(get_current_active_user)],
     user_workdir: Annotated[Path, Depends(get_user_workdir)],
@@ -1,133 +1,247 @@
 import asyncio
 import json
+import logging
+import os
+import stat
+from collections.abc import Coroutine, Sequence
+from contextvars import ContextVar
 from pathlib import Path
 from typing import Annotated, Any, cast
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, Response
+from myproject_core.configs import settings
 from myproject_core.schemas import WorkflowCallback, WorkflowEvent, WorkflowEventType
 from myproject_core.workflow.workflow_engine import WorkflowEngine
 from myproject_core.workflow.workflow_registry import WorkflowRegistry
-from sqlmodel import Session, desc, select
+from pydantic import TypeAdapter
+from sqlalchemy import lambda_stmt
+from sqlmodel import Session, col, desc, select
 from sse_starlette.sse import EventSourceResponse
 
 from ..database import engine as db_engine
 from ..database import get_session
 from ..dependencies import (
+    JobStreams,
     get_current_active_user,
+    get_job_streams,
     get_user_inbox_path,
     get_workflow_engine,
     get_workflow_registry,
 )
 from ..models.user import User
-from ..models.workflow_job import JobStatus, WorkflowJob
+from ..models.workflow_job import JobStatus, WorkflowJob, WorkflowStepEvent
 from ..schemas.workflow_job import WorkflowJobRead, WorkflowRunResponse
+from ..sse_channel import SSEChannel
+from ..utils.files import DownloadFileResponse
 from ..utils.workflow_job import add_workflow_job, run_workflow_job
 
-# Global store: {user_id: {job_id: asyncio.Queue}}
-job_streams: dict[int, dict[int, asyncio.Queue]] = {}
+logger = logging.getLogger(__name__)
 
+# Upper bound on buffered SSE events per job, so a slow or absent client cannot grow memory unbounded
+JOB_STREAM_MAXSIZE = settings.server.job_stream_maxsize
 
-def get_job_queue(user_id: int, job_id: int) -> asyncio.Queue | None:
-    return job_streams.get(user_id, {}).get(job_id)
+# Seconds a job stream may sit idle before the client connection is checked, also used as SSE ping
+JOB_STREAM_IDLE_CHECK = 15.0
 
 
-def create_job_queue(user_id: int, job_id: int) -> asyncio.Queue:
-    if user_id not in job_streams:
-        job_streams[user_id] = {}
-    queue = asyncio.Queue()
-    job_streams[user_id][job_id] = queue
-    return queue
+# Shared encoder for SSE payloads. They are flat dicts built here, so skip the circular-reference
+# bookkeeping that json.dumps does on every call
+_encode_event_json = json.JSONEncoder(check_circular=False).encode
 
+# Workflow event payloads always have this shape, so they are formatted from the template with
+# individually escaped strings instead of building and encoding a dict per event
+_WORKFLOW_EVENT_JSON = '{"step_id": %s, "message": %s}'
+_encode_json_str = json.encoder.encode_basestring_ascii
 
-class ServerSSERenderer:
-    """Implements the WorkflowCallback interface to push events to SSE."""
+# The job list is built by WorkflowJobRead.from_job from typed rows, so it is dumped straight to
+# JSON bytes instead of being revalidated against response_model and encoded again by json.dumps
+_JOB_LIST_ADAPTER = TypeAdapter(list[WorkflowJobRead])
 
-    def __init__(self, user_id: int, job_id: int):
-        self.user_id = user_id
-        self.job_id = job_id
 
-    async def __call__(self, event: WorkflowEvent) -> None:
-        """The actual callback matching WorkflowCallback type."""
-        queue = get_job_queue(self.user_id, self.job_id)
-        if queue:
-            # Explicitly serialize to JSON string here
-            payload = json.dumps(
-                {
-                    "step_id": event.step_id,
-                    "message": event.message,
-                    # "data": event.data  # Only include if event.data is JSON serializable
-                },
-            )
-
-            await queue.put(
-                {
-                    "event": event.event_type.value,
-                    "data": payload,
-                },
-            )
-
-
-class ConsoleRenderer:
-    """Implements the WorkflowCallback interface to write output to terminal for debugging"""
-
-    def __init__(self, user_id: int, job_id: int):
-        self.user_id = user_id
-        self.job_id = job_id
+# Strong references to fire-and-forget tasks, since the event loop only keeps weak ones
+_background_tasks: set[asyncio.Task] = set()
+
+
+def _on_background_task_done(task: asyncio.Task) -> None:
+    _background_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("Background job task failed", exc_info=task.exception())
+
+
+def _spawn_background_task(coro: Coroutine[Any, Any, None]) -> asyncio.Task:
+    """Start coro as a task that is kept alive until it finishes and whose errors are logged."""
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_on_background_task_done)
+    return task
+
+
+def get_job_channel(job_streams: JobStreams, user_id: int, job_id: int) -> SSEChannel | None:
+    return job_streams.get((user_id, job_id))
+
+
+def create_job_channel(job_streams: JobStreams, user_id: int, job_id: int) -> SSEChannel:
+    channel = SSEChannel(maxlen=JOB_STREAM_MAXSIZE)
+    job_streams[(user_id, job_id)] = channel
+    return channel
+
+
+# Identity of the job whose workflow runs in the current task. run_workflow_background sets these
+# and the engine's callback tasks inherit them, so the renderers below are plain shared functions
+job_streams_ctx: ContextVar[JobStreams] = ContextVar("job_streams")
+user_id_ctx: ContextVar[int] = ContextVar("job_user_id")
+job_id_ctx: ContextVar[int] = ContextVar("job_id")
+
+
+async def sse_renderer(event: WorkflowEvent) -> None:
+    """WorkflowCallback that pushes events to the current job's SSE channel."""
+    channel = get_job_channel(job_streams_ctx.get(), user_id_ctx.get(), job_id_ctx.get())
+    if channel:
+        # Explicitly serialize to JSON string here
+        # event.data is left out, since it is not guaranteed to be JSON serializable
+        payload = _WORKFLOW_EVENT_JSON % (
+            "null" if event.step_id is None else _encode_json_str(event.step_id),
+            _encode_json_str(event.message),
+        )
+
+        channel.put(
+            {
+                "event": event.event_type.value,
+                "data": payload,
+            },
+        )
+
+
+async def console_renderer(event: WorkflowEvent) -> None:
+    """WorkflowCallback that logs workflow events at debug level for debugging"""
+    # Skip formatting entirely unless debug logging is on, which it is not in production
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+    logger.debug(
+        "User %s job %s: %s (step: %s) %s",
+        user_id_ctx.get(),
+        job_id_ctx.get(),
+        event.event_type.value,
+        event.step_id,
+        event.message,
+    )
+
+
+# Step events that change a step's persisted status
+STEP_STATUS_BY_EVENT = {
+    WorkflowEventType.STEP_START: "running",
+    WorkflowEventType.STEP_COMPLETED: "completed",
+    WorkflowEventType.STEP_FAILED: "failed",
+}
+
+
+# How long step status changes are buffered so consecutive events share one commit
+STEP_STATUS_FLUSH_DELAY = 0.5
 
-    async def __call__(self, event: WorkflowEvent) -> None:
-        print(f"UserID: {self.user_id}")
-        print(f"JobID: {self.job_id}")
-        print(f"Workflow Event: {event.event_type.value}")
-        print(f"\tStep: {event.step_id}")
-        print(f"\tStep Message: {event.message}")
+
+def _persist_step_status(job_id: int, updates: dict[str, str]) -> None:
+    """Blocking insert of a batch of step statuses into the append-only event log."""
+    with Session(db_engine) as session:
+        session.add_all(
+            [
+                WorkflowStepEvent(job_id=job_id, step_id=step_id, status=status)
+                for step_id, status in updates.items()
+            ],
+        )
+        session.commit()
+
+
+def _load_step_statuses(session: Session, job_ids: list[int]) -> dict[int, dict[str, str]]:
+    """Current status of every step of the given jobs, i.e. the newest event per step."""
+    statuses: dict[int, dict[str, str]] = {job_id: {} for job_id in job_ids}
+    rows = session.exec(
+        select(WorkflowStepEvent.job_id, WorkflowStepEvent.step_id, WorkflowStepEvent.status)
+        .where(col(WorkflowStepEvent.job_id).in_(job_ids))
+        .order_by(col(WorkflowStepEvent.id)),
+    )
+    # Rows come oldest first, so later events overwrite earlier ones
+    for job_id, step_id, status in rows:
+        statuses[job_id][step_id] = status
+    return statuses
 
 
 class DatabaseProgressRenderer:
-    """Implements the WorkflowCallback interface to update the status of workflow steps in the database"""
+    """Buffers the status of one job's workflow steps and writes them to the database.
+    Status changes are buffered for STEP_STATUS_FLUSH_DELAY and written in one commit;
+    call flush() once the workflow has finished.
+    """
 
     def __init__(self, job_id: int):
         self.job_id = job_id
+        self._pending: dict[str, str] = {}
+        self._flush_task: asyncio.Task | None = None
+        # Serializes writes so batches are inserted in the order they were buffered
+        self._write_lock = asyncio.Lock()
 
     async def __call__(self, event: WorkflowEvent) -> None:
         if not event.step_id:
             return
 
-        with Session(db_engine) as session:
-            job = session.get(WorkflowJob, self.job_id)
-            if job:
-                # Define status mapping
-                mapping = {
-                    WorkflowEventType.STEP_START: "running",
-                    WorkflowEventType.STEP_COMPLETED: "completed",
-                    WorkflowEventType.STEP_FAILED: "failed",
-                }
+        new_status = STEP_STATUS_BY_EVENT.get(event.event_type)
+        if not new_status:
+            return
+
+        self._pending[event.step_id] = new_status
+        if self._flush_task is None:
+            self._flush_task = _spawn_background_task(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(STEP_STATUS_FLUSH_DELAY)
+        # Detach before writing so flush() only ever cancels a task that is still sleeping
+        self._flush_task = None
+        await self._write_pending()
+
+    async def _write_pending(self) -> None:
+        async with self._write_lock:
+            if not self._pending:
+                return
+            updates, self._pending = self._pending, {}
+            # The DB round trip runs in a worker thread so SSE clients are not starved meanwhile
+            await asyncio.to_thread(_persist_step_status, self.job_id, updates)
+
+    async def flush(self) -> None:
+        """Write any buffered step statuses immediately."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        await self._write_pending()
+
+
+# The buffer is the only per-job state, so it lives in the context next to the job identity
+progress_ctx: ContextVar[DatabaseProgressRenderer] = ContextVar("job_progress")
+
 
-                new_status = mapping.get(event.event_type)
-                if not new_status:
-                    return
+async def database_progress_renderer(event: WorkflowEvent) -> None:
+    """WorkflowCallback that records step status changes for the current job."""
+    await progress_ctx.get()(event)
 
-                # Update the step_status dict
-                # Note: We create a new dict so SQLModel detects the change
-                current_status = dict(job.step_status)
-                current_status[event.step_id] = new_status
-                job.step_status = current_status
 
-                session.add(job)
-                session.commit()
+# Callbacks of every submitted job; they read the job from the context, so one tuple serves all
+JOB_CALLBACKS: tuple[WorkflowCallback, ...] = (sse_renderer, console_renderer, database_progress_renderer)
 
 
 async def run_workflow_background(
+    job_streams: JobStreams,
     user_id: int,
     job_id: int,
     engine_instance: WorkflowEngine,
     registry_instance: WorkflowRegistry,
-    workflow_callbacks: list[WorkflowCallback] | None = None,
+    workflow_callbacks: Sequence[WorkflowCallback] = JOB_CALLBACKS,
 ):
-    # Get an SSE queue
-    queue = get_job_queue(user_id, job_id)
+    job_streams_ctx.set(job_streams)
+    user_id_ctx.set(user_id)
+    job_id_ctx.set(job_id)
+    progress = DatabaseProgressRenderer(job_id)
+    progress_ctx.set(progress)
+
+    # Get the SSE channel
+    channel = get_job_channel(job_streams, user_id, job_id)
     try:
-        print("REACH INSIDE TRY")
         # Use util to run workflow job
         job = await run_workflow_job(
             job_id=job_id,
@@ -135,21 +249,23 @@ async def run_workflow_background(
             registry_instance=registry_instance,
             workflow_callbacks=workflow_callbacks,
         )
-        print("REACH AFTER RUN WORKFLOW JOB")
+        # Persist final step statuses before clients are told the job is done
+        await progress.flush()
         # If util function returns None, it means it could not find job.
         # This is an exception
         if not job:
             raise Exception(f"Could not find job {job_id}")
         # Otherwise, job was either completed or failed. Time to return SSE
-        if queue:
+        if channel:
             if job.status == JobStatus.FAILED:
-                await queue.put({"event": "error", "data": job.error_message})
+                channel.put({"event": "error", "data": job.error_message})
             else:
-                await queue.put({"event": "status", "data": "COMPLETED"})
+                channel.put({"event": "status", "data": "COMPLETED"})
     except Exception as e:
-        if queue:
-            await queue.put({"event": "error", "data": json.dumps({"message": str(e)})})
-            await queue.put({"event": "status", "data": "FAILED"})
+        await progress.flush()
+        if channel:
+            channel.put({"event": "error", "data": _encode_event_json({"message": str(e)})})
+            channel.put({"event": "status", "data": "FAILED"})
             await asyncio.sleep(1)
 
 
@@ -166,6 +282,7 @@ async def submit_job(
     session: Annotated[Session, Depends(get_session)],
     registry: Annotated[WorkflowRegistry, Depends(get_workflow_registry)],
     engine: Annotated[WorkflowEngine, Depends(get_workflow_engine)],
+    job_streams: Annotated[JobStreams, Depends(get_job_streams)],
 ):
     # Verify Workflow Exists before doing any work
     manifest = registry.get_workflow(workflow_id)
@@ -187,35 +304,25 @@ async def submit_job(
     # Prepare Types for Background Task
     safe_job_id = cast("int", job.id)
 
-    # Initialize the user-scoped SSE queue
-    create_job_queue(safe_user_id, safe_job_id)
-
-    # Prepare callbacks
-    sse_callback = ServerSSERenderer(safe_user_id, safe_job_id)
-    console_callback = ConsoleRenderer(safe_user_id, safe_job_id)
-    db_callback = DatabaseProgressRenderer(safe_job_id)
-    callbacks = [
-        cast("WorkflowCallback", sse_callback),
-        cast("WorkflowCallback", console_callback),
-        cast("WorkflowCallback", db_callback),
-    ]
+    # Initialize the user-scoped SSE channel
+    create_job_channel(job_streams, safe_user_id, safe_job_id)
 
     # Dispatch Background Task with RESOLVED inputs
     background_tasks.add_task(
         run_workflow_background,
+        job_streams,
         safe_user_id,
         safe_job_id,
         engine,
         registry,
-        callbacks,
     )
 
-    print(f"submitted workflow {workflow_id}")
+    logger.info("Submitted workflow %s as job %d", workflow_id, safe_job_id)
     return {"message": "Job submitted", "job_id": safe_job_id}
 
 
 @router.get("/", response_model=list[WorkflowJobRead])
-async def list_jobs(
+def list_jobs(
     user: Annotated[User, Depends(get_current_active_user)],
     session: Annotated[Session, Depends(get_session)],
     offset: int = 0,
@@ -223,24 +330,30 @@ async def list_jobs(
     schedule_id: int | None = None,
 ):
     """Get all jobs for the current user, ordered by newest first."""
-    statement = (
-        select(WorkflowJob)
-        .where(WorkflowJob.user_id == user.id)
-        .order_by(desc(WorkflowJob.created_at))
-        .offset(offset)
-        .limit(limit)
+    user_id = user.id
+    # lambda_stmt caches the built statement by the lambda's code; only the bound values change
+    statement = lambda_stmt(
+        lambda: (
+            select(WorkflowJob)
+            .where(WorkflowJob.user_id == user_id)
+            .order_by(desc(WorkflowJob.created_at))
+            .offset(offset)
+            .limit(limit)
+        ),
     )
 
     if schedule_id:
-        statement = statement.where(WorkflowJob.schedule_id == schedule_id)
+        statement += lambda s: s.where(WorkflowJob.schedule_id == schedule_id)
 
-    jobs = session.exec(statement).all()
-    return jobs
+    jobs: list[WorkflowJob] = list(session.exec(statement).scalars())
+    statuses = _load_step_statuses(session, [cast("int", job.id) for job in jobs])
+    job_reads = [WorkflowJobRead.from_job(job, statuses[cast("int", job.id)]) for job in jobs]
+    return Response(_JOB_LIST_ADAPTER.dump_json(job_reads), media_type="application/json")
 
 
 # Add a full detail endpoint if the status one is too limited
 @router.get("/{job_id}", response_model=WorkflowJobRead)
-async def get_job_detail(
+def get_job_detail(
     job_id: int,
     user: Annotated[User, Depends(get_current_active_user)],
     session: Annotated[Session, Depends(get_session)],
@@ -250,22 +363,52 @@ async def get_job_detail(
     ).first()
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
-    return job
+    return WorkflowJobRead.from_job(job, _load_step_statuses(session, [job_id])[job_id])
+
+
+def _get_job_outcome(user_id: int, job_id: int) -> tuple[JobStatus, str | None] | None:
+    """Status and error message of a job, read straight from the database."""
+    with Session(db_engine) as session:
+        row = session.exec(
+            select(WorkflowJob.status, WorkflowJob.error_message).where(
+                WorkflowJob.id == job_id,
+                WorkflowJob.user_id == user_id,
+            ),
+        ).first()
+    return (row[0], row[1]) if row else None
 
 
 @router.get("/{job_id}/stream")
-async def stream_job(job_id: int, user: Annotated[User, Depends(get_current_active_user)]):
+async def stream_job(
+    job_id: int,
+    user: Annotated[User, Depends(get_current_active_user)],
+    job_streams: Annotated[JobStreams, Depends(get_job_streams)],
+    request: Request,
+):
     user_id = cast("int", user.id)
 
     async def event_generator():
-        queue = get_job_queue(user_id, job_id)
-        if not queue:
-            yield {"event": "error", "data": "Stream not found or expired"}
+        channel = get_job_channel(job_streams, user_id, job_id)
+        if not channel:
+            # No live channel in this process, but a finished job can still report how it ended
+            outcome = await asyncio.to_thread(_get_job_outcome, user_id, job_id)
+            if outcome and outcome[0] == JobStatus.COMPLETED:
+                yield {"event": "status", "data": "COMPLETED"}
+            elif outcome and outcome[0] == JobStatus.FAILED:
+                yield {"event": "error", "data": outcome[1] or "Job failed"}
+            else:
+                yield {"event": "error", "data": "Stream not found or expired"}
             return
 
         try:
             while True:
-                message = await queue.get()
+                try:
+                    message = await asyncio.wait_for(channel.get(), timeout=JOB_STREAM_IDLE_CHECK)
+                except TimeoutError:
+                    # A quiet job gives no chance to notice a half-open client otherwise
+                    if await request.is_disconnected():
+                        break
+                    continue
                 yield message
 
                 # Check for terminal states to close the SSE connection
@@ -276,16 +419,33 @@ async def stream_job(job_id: int, user: Annotated[User, Depends(get_current_acti
                     break
         finally:
             # Cleanup memory when client disconnects or job finishes
-            if user_id in job_streams and job_id in job_streams[user_id]:
-                del job_streams[user_id][job_id]
-                if not job_streams[user_id]:
-                    del job_streams[user_id]
+            job_streams.pop((user_id, job_id), None)
 
-    return EventSourceResponse(event_generator())
+    return EventSourceResponse(event_generator(), ping=JOB_STREAM_IDLE_CHECK)
+
+
+def _walk_output_files(base: Path) -> list[dict[str, Any]]:
+    """List files under base, using the scandir entry type so each file costs one stat.
+    Walks iteratively and slices relative paths off the root string instead of building Paths.
+    """
+    root = str(base)
+    prefix_len = len(root) + len(os.sep)
+    results = []
+    pending = [root]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                # Follows symlinks: workflow steps link files from internal/ into output/
+                elif entry.is_file():
+                    rel_path = entry.path[prefix_len:].replace(os.sep, "/")
+                    results.append({"name": entry.name, "path": rel_path, "size": entry.stat().st_size})
+    return results
 
 
 @router.get("/{job_id}/output", response_model=list[dict])
-async def list_job_outputs(
+def list_job_outputs(
     job_id: int,
     user: Annotated[User, Depends(get_current_active_user)],
     session: Annotated[Session, Depends(get_session)],
@@ -304,19 +464,11 @@ async def list_job_outputs(
     if not output_dir.exists() or not output_dir.is_dir():
         return []
 
-    results = []
-    # Using rglob("*") is often cleaner than os.walk for simple path filtering
-    for full_path in output_dir.rglob("*"):
-        if full_path.is_file():
-            rel_path = full_path.relative_to(output_dir)
-            results.append(
-                {"name": full_path.name, "path": str(rel_path), "size": full_path.stat().st_size},
-            )
-    return results
+    return _walk_output_files(output_dir)
 
 
 @router.get("/{job_id}/output/download/{file_path:path}")
-async def download_job_output(
+def download_job_output(
     job_id: int,
     file_path: str,
     user: Annotated[User, Depends(get_current_active_user)],
@@ -335,19 +487,24 @@ async def download_job_output(
     # Join the path without resolving yet
     target_file = output_base / file_path
 
-    # Security Check: Use is_relative_to (Python 3.9+)
-    # This checks the logical path. If it's a symlink, it checks the link itself.
+    # Security Check: Use is_relative_to (Python 3.9+) on the resolved path, which compares
+    # whole components (so "output" does not admit "outputa").
     # This is important because we now support workflow steps to symlink from internal to output directory
+    resolved_target = target_file.resolve()
+    # We check if the target is within output_base
+    if not resolved_target.is_relative_to(output_base):
+        # Fallback: if it's a symlink pointing to 'internal', check if it's still in workspace
+        if not resolved_target.is_relative_to(workspace_root):
+            raise HTTPException(status_code=403, detail="Access denied: outside of workspace scope")
+
+    # One stat serves both the existence check and FileResponse's headers.
+    # Use the resolved path so symlinks are not walked again.
     try:
-        # We check if the target is within output_base
-        if not target_file.resolve().is_relative_to(output_base):
-            # Fallback: if it's a symlink pointing to 'internal', check if it's still in workspace
-            if not target_file.resolve().is_relative_to(workspace_root):
-                raise HTTPException(status_code=403, detail="Access denied: outside of workspace scope")
-    except ValueError as exc:
-        raise HTTPException(status_code=403, detail="Access denied: outside of output scope") from exc
-
-    if not target_file.exists() or not target_file.is_file():
+        stat_result = resolved_target.stat()
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="File not found") from None
+    if not stat.S_ISREG(stat_result.st_mode):
         raise HTTPException(status_code=404, detail="File not found")
 
-    return FileResponse(target_file, filename=target_file.name)
+    # Keep the requested name so a symlinked artifact downloads under its output name
+    return DownloadFileResponse(resolved_target, filename=target_file.name, stat_result=stat_result)
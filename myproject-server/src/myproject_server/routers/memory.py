@@ -69,7 +69,7 @@ def _topic_to_read(t: TopicalMemory) -> TopicalMemoryRead:
 
 
 @router.get("/events", response_model=list[EventLogRead])
-async def list_events(
+def list_events(
     session: MemorySessionDep,
     tag: str | None = None,
     importance: int | None = None,
@@ -95,7 +95,7 @@ async def list_events(
 
 
 @router.get("/events/{event_id}", response_model=EventLogRead)
-async def get_event(event_id: int, session: MemorySessionDep):
+def get_event(event_id: int, session: MemorySessionDep):
     """Get a specific event log by ID."""
     event = get_event_log(session, event_id)
     if not event:
@@ -104,7 +104,7 @@ async def get_event(event_id: int, session: MemorySessionDep):
 
 
 @router.post("/events", response_model=EventLogRead, status_code=status.HTTP_201_CREATED)
-async def create_event(payload: EventLogCreate, session: MemorySessionDep):
+def create_event(payload: EventLogCreate, session: MemorySessionDep):
     """Create a new event log entry."""
     data = payload.model_dump()
     data["source"] = MemorySource.USER_MANUAL
@@ -113,7 +113,7 @@ async def create_event(payload: EventLogCreate, session: MemorySessionDep):
 
 
 @router.patch("/events/{event_id}", response_model=EventLogRead)
-async def update_event(event_id: int, payload: EventLogUpdate, session: MemorySessionDep):
+def update_event(event_id: int, payload: EventLogUpdate, session: MemorySessionDep):
     """Update an event log entry."""
     data = payload.model_dump(exclude_unset=True)
     event = get_event_log(session, event_id)
@@ -129,7 +129,7 @@ async def update_event(event_id: int, payload: EventLogUpdate, session: MemorySe
 
 
 @router.delete("/events/{event_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_event(event_id: int, session: MemorySessionDep):
+def delete_event(event_id: int, session: MemorySessionDep):
     """Delete an event log entry."""
     deleted = delete_event_log(session, event_id)
     if not deleted:
@@ -141,7 +141,7 @@ async def delete_event(event_id: int, session: MemorySessionDep):
 
 
 @router.get("/topics", response_model=list[TopicalMemoryRead])
-async def list_topics(
+def list_topics(
     session: MemorySessionDep,
     superseded: bool = False,
     tag: str | None = None,
@@ -169,7 +169,7 @@ async def list_topics(
 
 
 @router.get("/topics/{topic_id}", response_model=TopicalMemoryRead)
-async def get_topic(topic_id: int, session: MemorySessionDep):
+def get_topic(topic_id: int, session: MemorySessionDep):
     """Get a specific topical memory by ID."""
     topic = get_topical_memory(session, topic_id)
     if not topic:
@@ -178,7 +178,7 @@ async def get_topic(topic_id: int, session: MemorySessionDep):
 
 
 @router.get("/topics/{topic_id}/chain", response_model=TopicalMemoryRevisionChain)
-async def get_topic_chain(topic_id: int, session: MemorySessionDep):
+def get_topic_chain(topic_id: int, session: MemorySessionDep):
     """Get a topical memory with its full revision chain."""
     current = get_topical_memory(session, topic_id)
     if not current:
@@ -191,7 +191,7 @@ async def get_topic_chain(topic_id: int, session: MemorySessionDep):
 
 
 @router.post("/topics", response_model=TopicalMemoryRead, status_code=status.HTTP_201_CREATED)
-async def create_topic(payload: TopicalMemoryCreate, session: MemorySessionDep):
+def create_topic(payload: TopicalMemoryCreate, session: MemorySessionDep):
     """Create a new topical memory entry."""
     data = payload.model_dump()
     data["source"] = MemorySource.USER_MANUAL
@@ -200,7 +200,7 @@ async def create_topic(payload: TopicalMemoryCreate, session: MemorySessionDep):
 
 
 @router.patch("/topics/{topic_id}", response_model=TopicalMemoryRead)
-async def update_topic(topic_id: int, payload: TopicalMemoryUpdate, session: MemorySessionDep):
+def update_topic(topic_id: int, payload: TopicalMemoryUpdate, session: MemorySessionDep):
     """Update a topical memory entry in-place (for minor changes)."""
     data = payload.model_dump(exclude_unset=True)
     topic = update_topical_memory(session, topic_id, data)
@@ -210,7 +210,7 @@ async def update_topic(topic_id: int, payload: TopicalMemoryUpdate, session: Mem
 
 
 @router.post("/topics/{topic_id}/supersede", response_model=TopicalMemoryRead)
-async def supersede_topic(
+def supersede_topic(
     topic_id: int,
     session: MemorySessionDep,
     content: str = Body(..., embed=True),
@@ -227,7 +227,7 @@ async def supersede_topic(
 
 
 @router.delete("/topics/{topic_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_topic(topic_id: int, session: MemorySessionDep):
+def delete_topic(topic_id: int, session: MemorySessionDep):
     """Delete a topical memory entry."""
     deleted = delete_topical_memory(session, topic_id)
     if not deleted:
@@ -239,7 +239,7 @@ async def delete_topic(topic_id: int, session: MemorySessionDep):
 
 
 @router.get("/", response_model=MemoryListResponse)
-async def list_memories(
+def list_memories(
     session: MemorySessionDep,
     memory_type: Literal["event", "topic", "all"] = "all",
     tag: str | None = None,
@@ -289,14 +289,14 @@ async def list_memories(
 
 
 @router.get("/tags", response_model=TagCountResponse)
-async def get_tags(session: MemorySessionDep):
+def get_tags(session: MemorySessionDep):
     """Get tag counts across all current memories."""
     counts = get_memory_tag_counts(session)
     return TagCountResponse(tag_counts=counts)
 
 
 @router.get("/search", response_model=MemoryListResponse)
-async def search_memory(
+def search_memory(
     session: MemorySessionDep,
     q: str,
     memory_type: Literal["event", "topic", "all"] = "all",
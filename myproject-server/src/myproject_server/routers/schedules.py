@@ -1,3 +1,10 @@
+"""Workflow schedule endpoints.
+
+The handlers are plain functions so their blocking database calls run in the threadpool.
+SchedulerManager is safe to call from there: the scheduler locks its job store and hands
+wakeups back to the event loop with call_soon_threadsafe.
+"""
+
 from pathlib import Path
 from typing import Annotated, cast
 
@@ -13,9 +20,11 @@ from ..schemas.workflow_schedule import WorkflowScheduleCreate, WorkflowSchedule
 
 router = APIRouter(prefix="/schedules", tags=["schedules"])
 
+# Schedule fields that the registered scheduler job depends on
+SCHEDULER_FIELDS = frozenset({"cron_expression", "timezone", "enabled"})
 
 @router.post("/", response_model=WorkflowScheduleRead)
-async def create_schedule(
+def create_schedule(
     payload: WorkflowScheduleCreate,
     user: Annotated[User, Depends(get_current_active_user)],
     user_inbox: Annotated[Path, Depends(get_user_inbox_path)],
@@ -29,7 +38,6 @@ async def create_schedule(
 
     session.add(db_schedule)
     session.commit()
-    session.refresh(db_schedule)
 
     # 2. Add to the running scheduler if enabled
     if db_schedule.enabled:
@@ -39,7 +47,7 @@ async def create_schedule(
 
 
 @router.get("/", response_model=list[WorkflowScheduleRead])
-async def list_schedules(
+def list_schedules(
     user: Annotated[User, Depends(get_current_active_user)],
     session: Annotated[Session, Depends(get_session)],
 ):
@@ -48,7 +56,7 @@ async def list_schedules(
 
 
 @router.get("/{schedule_id}", response_model=WorkflowScheduleRead)
-async def get_schedule(
+def get_schedule(
     schedule_id: int,
     user: Annotated[User, Depends(get_current_active_user)],
     session: Annotated[Session, Depends(get_session)],
@@ -60,7 +68,7 @@ async def get_schedule(
 
 
 @router.patch("/{schedule_id}", response_model=WorkflowScheduleRead)
-async def update_schedule(
+def update_schedule(
     schedule_id: int,
     payload: WorkflowScheduleUpdate,
     user: Annotated[User, Depends(get_current_active_user)],
@@ -78,9 +86,12 @@ async def update_schedule(
 
     session.add(db_schedule)
     session.commit()
-    session.refresh(db_schedule)
 
-    # Sync with the background scheduler
+    # Sync with the background scheduler, which only holds the trigger. Name and inputs are read from
+    # the DB when the job fires, so edits to them need no scheduler round trip
+    if SCHEDULER_FIELDS.isdisjoint(data):
+        return db_schedule
+
     if db_schedule.enabled:
         scheduler.upsert_schedule(db_schedule)
     else:
@@ -90,7 +101,7 @@ async def update_schedule(
 
 
 @router.delete("/{schedule_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_schedule(
+def delete_schedule(
     schedule_id: int,
     user: Annotated[User, Depends(get_current_active_user)],
     session: Annotated[Session, Depends(get_session)],
@@ -4,7 +4,8 @@ from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from myproject_core.configs import Config
-from sqlmodel import Session, select
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session
 
 from ..auth.security import get_password_hash, verify_password
 from ..database import get_session
@@ -22,29 +23,29 @@ async def create_user(
     server_settings: Annotated[Config, Depends(get_server_settings)],
 ):
     """Create a new user.
-    Checks if username already exists, hashes password, and saves to DB.
+    Hashes the password and saves to DB; the unique index on username rejects duplicates.
     """
-    # 1. Check for existing user
-    existing_user = session.exec(select(User).where(User.username == user_in.username)).first()
-
-    if existing_user:
-        raise HTTPException(
-            status_code=400, detail="The user with this username already exists in the system.",
-        )
-
-    # 2. Create the DB record
+    # 1. Create the DB record
+    # Hash in a worker thread; Argon2 is CPU-bound and would otherwise stall the event loop
+    hashed_password = await asyncio.to_thread(get_password_hash, user_in.password)
     db_user = User(
         username=user_in.username,
         email=user_in.email,
-        hashed_password=get_password_hash(user_in.password),  # Hash it!
+        hashed_password=hashed_password,
     )
 
     # Commit first so the database assigns an ID to db_user.id
+    # No SELECT beforehand: the INSERT itself detects an existing username, without a race
     session.add(db_user)
-    session.commit()
-    session.refresh(db_user)
+    try:
+        session.commit()
+    except IntegrityError as e:
+        session.rollback()
+        raise HTTPException(
+            status_code=400, detail="The user with this username or email already exists in the system.",
+        ) from e
 
-    # 3. Create the sandbox directory asynchronously
+    # 2. Create the sandbox directory asynchronously
     server_users_directory = server_settings.path.server_users_directory
 
     # Construct the path: <server_users_directory>/<user_id>
@@ -53,11 +54,10 @@ async def create_user(
     # Use asyncio.to_thread to run the blocking os/pathlib mkdir call in a background thread.
     await asyncio.to_thread(user_dir.mkdir, parents=True, exist_ok=True)
 
-    # 4. Save the directory path back to the user record
+    # 3. Save the directory path back to the user record
     db_user.working_directory = str(user_dir)
     session.add(db_user)
     session.commit()
-    session.refresh(db_user)
 
     return db_user
 
@@ -71,7 +71,7 @@ async def read_users_me(
 
 
 @router.patch("/me", response_model=UserRead)
-async def update_user_me(
+def update_user_me(
     user_update: UserUpdate,
     current_user: Annotated[User, Depends(get_current_active_user)],
     session: Annotated[Session, Depends(get_session)],
@@ -105,8 +105,9 @@ async def update_user_me(
     for key, value in update_data.items():
         setattr(current_user, key, value)
 
-    # 4. Save changes
-    session.add(current_user)
-    session.commit()
-    session.refresh(current_user)
+    # 4. Save changes. The user row is already loaded in this session, so the flush is a single
+    # UPDATE of the changed columns, and an empty update skips the database entirely
+    if update_data:
+        session.add(current_user)
+        session.commit()
     return current_user
@@ -1,9 +1,16 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException, Response
+from myproject_core.schemas import WorkflowManifest
+from pydantic import TypeAdapter
 
 from ..dependencies import WorkflowRegDep
 
 router = APIRouter(prefix="/workflows", tags=["workflows"])
 
+# Serializers built once at import. Dumping straight to JSON bytes skips FastAPI's per-request
+# jsonable_encoder walk over the nested manifests
+_MANIFEST_MAP_ADAPTER = TypeAdapter(dict[str, WorkflowManifest])
+_MANIFEST_ADAPTER = TypeAdapter(WorkflowManifest)
+
 
 @router.get("/")
 async def list_available_workflows(registry: WorkflowRegDep):
@@ -11,8 +18,7 @@ async def list_available_workflows(registry: WorkflowRegDep):
     This helps the frontend dynamically build forms for each workflow.
     """
     manifests = registry.get_all_workflows()
-    # We return the model_dump() so FastAPI can serialize the Pydantic models
-    return manifests
+    return Response(_MANIFEST_MAP_ADAPTER.dump_json(manifests), media_type="application/json")
 
 
 @router.get("/{workflow_id}")
@@ -21,7 +27,5 @@ async def get_workflow_details(workflow_id: str, registry: WorkflowRegDep):
     """
     manifest = registry.get_workflow(workflow_id)
     if not manifest:
-        from fastapi import HTTPException
-
         raise HTTPException(status_code=404, detail="Workflow manifest not found")
-    return manifest.model_dump()
+    return Response(_MANIFEST_ADAPTER.dump_json(manifest), media_type="application/json")
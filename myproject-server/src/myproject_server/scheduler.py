@@ -1,19 +1,21 @@
 import logging
 from datetime import UTC, datetime
+from typing import cast
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from apscheduler.triggers.cron import CronTrigger
 from myproject_core.agent.agent_registry import AgentRegistry
 from myproject_core.configs import get_config
 from myproject_core.configs import settings as server_settings
 from myproject_core.workflow.workflow_engine import WorkflowEngine
 from myproject_core.workflow.workflow_registry import WorkflowRegistry
 from myproject_core.workflow.workflow_workspace import WorkspaceManager
+from sqlalchemy.orm import joinedload
 from sqlmodel import Session, select
 
 from .database import engine as db_engine
 from .models.user import User
 from .models.workflow_schedule import WorkflowSchedule
+from .utils.cron import parse_crontab
 from .utils.workflow_job import add_workflow_job, run_workflow_job
 
 logger = logging.getLogger(__name__)
@@ -32,15 +34,20 @@ class SchedulerManager:
             self.scheduler.shutdown(wait=False)
 
     async def sync_schedules(self):
-        """Initial sync on server start: Loads all enabled schedules for all users."""
+        """Initial sync on server start: Loads all enabled schedules for all users.
+        Runs before start(), so add_job only queues each job and they are all added in one pass.
+        """
         with Session(db_engine) as session:
-            statement = select(WorkflowSchedule).where(WorkflowSchedule.enabled)
-            for schedule in session.exec(statement).all():
+            # Stream rows in batches instead of materializing every schedule at once
+            statement = (
+                select(WorkflowSchedule).where(WorkflowSchedule.enabled).execution_options(yield_per=200)
+            )
+            for schedule in session.exec(statement):
                 self.upsert_schedule(schedule)
 
     def upsert_schedule(self, schedule: WorkflowSchedule):
         job_id = f"sched_{schedule.id}"
-        trigger = CronTrigger.from_crontab(schedule.cron_expression, timezone=schedule.timezone)
+        trigger = parse_crontab(schedule.cron_expression, schedule.timezone)
 
         self.scheduler.add_job(
             self._execute_scheduled_task,
@@ -60,13 +67,19 @@ class SchedulerManager:
         """The core logic: This function sets up the user's specific environment
         just-in-time for the execution.
         """
-        with Session(db_engine) as session:
-            # 1. Get the Schedule and User
-            schedule = session.get(WorkflowSchedule, schedule_id)
-            user = session.get(User, user_id)
-
-            if not schedule or not schedule.enabled or not user:
+        # Nothing is read from the objects after the commit except the new job's ID
+        with Session(db_engine, expire_on_commit=False) as session:
+            # 1. Get the Schedule and its User in one joined query. The jobs collection is left
+            # lazy on purpose: it grows with every run and nothing here reads it
+            schedule = session.exec(
+                select(WorkflowSchedule)
+                .options(joinedload(WorkflowSchedule.user))  # type: ignore
+                .where(WorkflowSchedule.id == schedule_id, WorkflowSchedule.user_id == user_id),
+            ).first()
+
+            if not schedule or not schedule.enabled:
                 return
+            user: User = schedule.user
 
             # 2. RESOLVE USER CONTEXT
             # Get the user's specific directory and config
@@ -94,18 +107,19 @@ class SchedulerManager:
                 user_id=user_id,
                 workflow_id=schedule.workflow_id,
                 manifest=workflow_manifest,
+                session=session,
             )
 
-            if job and job.id:
+            if job:
+                # Insert the job, link it and stamp the schedule in one transaction
                 job.schedule_id = schedule.id
                 schedule.last_run_at = datetime.now(UTC)
-                session.add(job)
                 session.add(schedule)
                 session.commit()
 
                 # 4. Run the job using the USER-SPECIFIC engine and registry
                 await run_workflow_job(
-                    job_id=job.id,
+                    job_id=cast("int", job.id),
                     engine_instance=user_engine,
                     registry_instance=user_registry,
                 )
@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Any
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class ChatSessionCreate(BaseModel):
@@ -10,6 +10,8 @@ class ChatSessionCreate(BaseModel):
 
 
 class ChatSessionRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     agent_id: str
     title: str
@@ -19,6 +21,8 @@ class ChatSessionRead(BaseModel):
 
 
 class ChatMessageRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     payload: dict[str, Any]  # The raw JSON from the core
     created_at: datetime
@@ -33,6 +37,9 @@ class ContextTokensRead(BaseModel):
 
 
 class ChatHistoryRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     session: ChatSessionRead
     messages: list[ChatMessageRead]
-    context_tokens: ContextTokensRead
+    # None for a paged request; token usage always covers the whole history
+    context_tokens: ContextTokensRead | None = None
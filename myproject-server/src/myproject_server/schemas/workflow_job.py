@@ -4,7 +4,40 @@ from typing import Any
 from myproject_core.configs import settings
 from pydantic import BaseModel, ConfigDict, model_validator
 
-from ..models.workflow_job import JobStatus
+from ..models.workflow_job import JobStatus, WorkflowJob
+
+# The prefix we want to hide; resolved once since the inbox root is fixed for the process
+_INBOX_ROOT_PREFIX = str(settings.path.inbox_directory.resolve())
+_SANDBOX_PLACEHOLDER = "[SANDBOX]"
+
+
+def _sanitize(val: Any) -> Any:
+    """Replace the absolute inbox root in every string within val with a relative placeholder.
+    Containers are copied only when something inside them changed, so inputs without internal
+    paths pass through without allocating. Nested values are shared with the ORM object, which
+    is why they are never mutated in place.
+    """
+    if isinstance(val, str):
+        return val.replace(_INBOX_ROOT_PREFIX, _SANDBOX_PLACEHOLDER) if _INBOX_ROOT_PREFIX in val else val
+    if isinstance(val, dict):
+        cleaned_dict: dict | None = None
+        for key, item in val.items():
+            cleaned = _sanitize(item)
+            if cleaned is not item:
+                if cleaned_dict is None:
+                    cleaned_dict = dict(val)
+                cleaned_dict[key] = cleaned
+        return val if cleaned_dict is None else cleaned_dict
+    if isinstance(val, list):
+        cleaned_list: list | None = None
+        for index, item in enumerate(val):
+            cleaned = _sanitize(item)
+            if cleaned is not item:
+                if cleaned_list is None:
+                    cleaned_list = list(val)
+                cleaned_list[index] = cleaned
+        return val if cleaned_list is None else cleaned_list
+    return val
 
 
 class WorkflowJobRead(BaseModel):
@@ -15,7 +48,8 @@ class WorkflowJobRead(BaseModel):
     status: JobStatus
     inputs: dict
     result: dict | None
-    step_status: dict[str, str]
+    # Materialized from WorkflowStepEvent rows by the router
+    step_status: dict[str, str] = {}
     error_message: str | None
     workspace_path: str | None
     created_at: datetime
@@ -23,27 +57,40 @@ class WorkflowJobRead(BaseModel):
 
     @model_validator(mode="after")
     def sanitize_internal_paths(self) -> "WorkflowJobRead":
-        # The prefix we want to hide
-        root_prefix = str(settings.path.inbox_directory.resolve())
-
-        def _clean(val: Any) -> Any:
-            if isinstance(val, str):
-                # Replace absolute path with a relative placeholder
-                return val.replace(root_prefix, "[SANDBOX]")
-            if isinstance(val, dict):
-                return {k: _clean(v) for k, v in val.items()}
-            if isinstance(val, list):
-                return [_clean(i) for i in val]
-            return val
-
-        self.inputs = _clean(self.inputs)
-        if self.error_message:
-            self.error_message = _clean(self.error_message)
+        # _sanitize returns its argument untouched when the prefix is absent, which is the
+        # common case, so only pay for pydantic's __setattr__ when something was replaced
+        inputs = _sanitize(self.inputs)
+        if inputs is not self.inputs:
+            self.inputs = inputs
+        if self.error_message and _INBOX_ROOT_PREFIX in self.error_message:
+            self.error_message = _sanitize(self.error_message)
 
         # Never show the raw workspace_path to the frontend
         self.workspace_path = None
         return self
 
+    @classmethod
+    def from_job(cls, job: WorkflowJob, step_status: dict[str, str]) -> "WorkflowJobRead":
+        """Build the read model from a WorkflowJob row without revalidating it.
+        The row's columns are already typed by SQLModel, so only the path sanitizing above is
+        applied. This keeps list_jobs from running field validation on every row.
+        """
+        error_message = job.error_message
+        if error_message and _INBOX_ROOT_PREFIX in error_message:
+            error_message = _sanitize(error_message)
+        return cls.model_construct(
+            id=job.id,
+            workflow_id=job.workflow_id,
+            status=job.status,
+            inputs=_sanitize(job.inputs),
+            result=job.result,
+            step_status=step_status,
+            error_message=error_message,
+            workspace_path=None,
+            created_at=job.created_at,
+            updated_at=job.updated_at,
+        )
+
 
 class WorkflowRunResponse(BaseModel):
     message: str
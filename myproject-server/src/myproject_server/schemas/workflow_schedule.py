@@ -1,8 +1,9 @@
 from datetime import datetime
 from typing import Any
 
-from apscheduler.triggers.cron import CronTrigger
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from ..utils.cron import parse_crontab
 
 
 class WorkflowScheduleCreate(BaseModel):
@@ -17,7 +18,7 @@ class WorkflowScheduleCreate(BaseModel):
     @classmethod
     def validate_cron(cls, v: str) -> str:
         try:
-            CronTrigger.from_crontab(v)
+            parse_crontab(v)
         except Exception as exc:
             raise ValueError("Invalid cron expression format") from exc
         return v
@@ -32,6 +33,8 @@ class WorkflowScheduleUpdate(BaseModel):
 
 
 class WorkflowScheduleRead(WorkflowScheduleCreate):
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     user_id: int
     last_run_at: datetime | None = None
@@ -0,0 +1,26 @@
+import asyncio
+from collections import deque
+from typing import Any
+
+
+class SSEChannel:
+    """Buffer between one producer and the single SSE client reading it.
+
+    A bounded deque plus an Event is cheaper than asyncio.Queue for this pattern: there is
+    only ever one waiter, and once maxlen is reached appending discards the oldest event,
+    so the producer never blocks.
+    """
+
+    def __init__(self, maxlen: int):
+        self.buf: deque[dict[str, Any]] = deque(maxlen=maxlen)
+        self.ev = asyncio.Event()
+
+    def put(self, message: dict[str, Any]) -> None:
+        self.buf.append(message)
+        self.ev.set()
+
+    async def get(self) -> dict[str, Any]:
+        while not self.buf:
+            self.ev.clear()
+            await self.ev.wait()
+        return self.buf.popleft()
@@ -0,0 +1,12 @@
+import functools
+
+from apscheduler.triggers.cron import CronTrigger
+
+
+@functools.lru_cache(maxsize=256)
+def parse_crontab(cron_expression: str, timezone: str = "UTC") -> CronTrigger:
+    """Parse a crontab once per (expression, timezone).
+    Triggers hold no per-job state, so the cached instance is shared by validation and scheduling.
+    Raises ValueError if the expression is invalid.
+    """
+    return CronTrigger.from_crontab(cron_expression, timezone=timezone)
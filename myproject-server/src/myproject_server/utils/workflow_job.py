@@ -1,3 +1,5 @@
+import os
+from collections.abc import Sequence
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
@@ -17,42 +19,61 @@ async def add_workflow_job(
     user_id: int,
     workflow_id: str,
     manifest: WorkflowManifest,  # <--- Pass the manifest here
+    session: Session | None = None,
 ) -> WorkflowJob | None:
     """Register a workflow job in the database.
     Resolves relative paths to absolute sandbox paths based on the manifest definitions.
+    If a session is given, the job is only added to it and the caller commits it.
     """
-    resolved_inputs = inputs.copy()
+    # Rewritten values go into a copy made on the first change only, so inputs without
+    # relative file paths (the scheduler's common case) are stored as given
+    resolved_inputs: dict[str, Any] | None = None
+    # Plain string checks; building a Path per element only to test absoluteness is wasted work.
+    # The prefix ends in exactly one separator, so relative paths are joined by concatenation
+    inbox_prefix = os.path.join(str(user_inbox), "")
 
     # Iterate through the inputs defined in the manifest
     for input_name, definition in manifest.inputs.items():
         # Check if this specific input was actually provided by the user
-        if input_name not in resolved_inputs or resolved_inputs[input_name] is None:
+        val = inputs.get(input_name)
+        if val is None:
             continue
 
-        val = resolved_inputs[input_name]
-
         # Handle List of Files
         if definition.type == WorkflowInputType.LIST_FILE:
-            if isinstance(val, list):
-                resolved_inputs[input_name] = [
-                    str(user_inbox / f) if not Path(f).is_absolute() else f for f in val
-                ]
+            if not isinstance(val, list) or all(os.path.isabs(f) for f in val):
+                continue
+            resolved = [f if os.path.isabs(f) else inbox_prefix + f for f in val]
 
         # Handle Single File or Directory
         elif definition.type in [WorkflowInputType.FILE, WorkflowInputType.DIR]:
-            if isinstance(val, str):
-                resolved_inputs[input_name] = str(user_inbox / val) if not Path(val).is_absolute() else val
-
-    with Session(db_engine) as session:
-        job = WorkflowJob(
-            workflow_id=workflow_id,
-            user_id=user_id,
-            inputs=resolved_inputs,
-            status=JobStatus.PENDING,
-        )
+            if not isinstance(val, str) or os.path.isabs(val):
+                continue
+            resolved = inbox_prefix + val
+
+        else:
+            continue
+
+        if resolved_inputs is None:
+            resolved_inputs = dict(inputs)
+        resolved_inputs[input_name] = resolved
+
+    job = WorkflowJob(
+        workflow_id=workflow_id,
+        user_id=user_id,
+        inputs=inputs if resolved_inputs is None else resolved_inputs,
+        status=JobStatus.PENDING,
+    )
+    if session is not None:
+        # Joins the caller's transaction instead of opening a second session and commit
         session.add(job)
-        session.commit()
-        session.refresh(job)
+        return job
+
+    # All defaults are client-side and the ID is set on flush, so keep the attributes
+    # loaded after commit instead of re-selecting the row with refresh()
+    with Session(db_engine, expire_on_commit=False) as own_session:
+        own_session.add(job)
+        own_session.commit()
         return job
 
 
@@ -61,10 +82,10 @@ async def run_workflow_job(
     engine_instance: WorkflowEngine,
     registry_instance: WorkflowRegistry,
     inputs: dict[str, Any] | None = None,
-    workflow_callbacks: list[WorkflowCallback] | None = None,
+    workflow_callbacks: Sequence[WorkflowCallback] | None = None,
 ) -> WorkflowJob | None:
     """Run a registered workflow job"""
-    with Session(db_engine) as session:
+    with Session(db_engine, expire_on_commit=False) as session:
         job = session.get(WorkflowJob, job_id)
         if not job:
             return None
@@ -104,5 +125,4 @@ async def run_workflow_job(
             job.updated_at = datetime.now(UTC)
             session.add(job)
             session.commit()
-            session.refresh(job)
         return job
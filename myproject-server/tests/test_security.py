@@ -0,0 +1,60 @@
+"""Unit tests for password verification and its result cache."""
+
+import pytest
+from myproject_server.auth import security
+from myproject_server.auth.security import get_password_hash, verify_password
+
+
+@pytest.fixture(autouse=True)
+def clear_verify_cache():
+    security._verify_cache.clear()
+    yield
+    security._verify_cache.clear()
+
+
+@pytest.fixture
+def count_verifications(monkeypatch):
+    calls: list[str] = []
+    verify = security.password_hash.verify
+
+    def counting_verify(plain_password, hashed_password):
+        calls.append(plain_password)
+        return verify(plain_password, hashed_password)
+
+    monkeypatch.setattr(security.password_hash, "verify", counting_verify)
+    return calls
+
+
+@pytest.fixture(scope="module")
+def hashed():
+    return get_password_hash("correct horse")
+
+
+class TestVerifyPassword:
+    def test_checks_the_password(self, hashed):
+        assert verify_password("correct horse", hashed) is True
+        assert verify_password("wrong horse", hashed) is False
+
+    def test_repeated_attempts_are_served_from_the_cache(self, hashed, count_verifications):
+        for _ in range(3):
+            assert verify_password("wrong horse", hashed) is False
+            assert verify_password("correct horse", hashed) is True
+        assert count_verifications == ["wrong horse", "correct horse"]
+
+    def test_results_are_cached_per_hash(self, hashed, count_verifications):
+        other = get_password_hash("correct horse")
+        assert verify_password("correct horse", hashed) is True
+        assert verify_password("correct horse", other) is True
+        assert len(count_verifications) == 2
+
+    def test_expired_results_are_verified_again(self, hashed, count_verifications, monkeypatch):
+        monkeypatch.setattr(security, "_VERIFY_CACHE_TTL", -1.0)
+        verify_password("correct horse", hashed)
+        verify_password("correct horse", hashed)
+        assert len(count_verifications) == 2
+
+    def test_cache_is_bounded(self, hashed, monkeypatch):
+        monkeypatch.setattr(security, "_VERIFY_CACHE_MAXSIZE", 2)
+        for attempt in ("a", "b", "c"):
+            verify_password(attempt, hashed)
+        assert len(security._verify_cache) == 2
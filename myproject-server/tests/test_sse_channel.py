@@ -0,0 +1,47 @@
+"""Unit tests for the SSEChannel buffer."""
+
+import asyncio
+
+from myproject_server.sse_channel import SSEChannel
+
+
+class TestSSEChannel:
+    def test_messages_are_read_in_order(self):
+        async def main():
+            channel = SSEChannel(maxlen=10)
+            for i in range(3):
+                channel.put({"data": i})
+            return [await channel.get() for _ in range(3)]
+
+        assert asyncio.run(main()) == [{"data": 0}, {"data": 1}, {"data": 2}]
+
+    def test_get_waits_for_put(self):
+        async def main():
+            channel = SSEChannel(maxlen=10)
+            reader = asyncio.create_task(channel.get())
+            await asyncio.sleep(0)
+            assert not reader.done()
+            channel.put({"data": "late"})
+            return await asyncio.wait_for(reader, timeout=1)
+
+        assert asyncio.run(main()) == {"data": "late"}
+
+    def test_full_buffer_drops_the_oldest_message(self):
+        async def main():
+            channel = SSEChannel(maxlen=2)
+            for i in range(4):
+                channel.put({"data": i})
+            return [await channel.get() for _ in range(2)]
+
+        assert asyncio.run(main()) == [{"data": 2}, {"data": 3}]
+
+    def test_reader_waits_again_once_drained(self):
+        async def main():
+            channel = SSEChannel(maxlen=10)
+            channel.put({"data": 1})
+            await channel.get()
+            reader = asyncio.create_task(channel.get())
+            await asyncio.sleep(0)
+            return reader.done()
+
+        assert asyncio.run(main()) is False
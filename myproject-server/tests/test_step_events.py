@@ -0,0 +1,92 @@
+"""Unit tests for workflow step events: folding them into step statuses and the legacy backfill."""
+
+import json
+
+import pytest
+from myproject_server.database import backfill_step_events
+from myproject_server.models.user import User
+from myproject_server.models.workflow_job import WorkflowJob, WorkflowStepEvent
+from myproject_server.models.workflow_schedule import WorkflowSchedule  # noqa: F401
+from myproject_server.routers.jobs import _load_step_statuses
+from sqlalchemy import text
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine, select
+
+
+class TestStepEvents:
+    @pytest.fixture
+    def session(self):
+        engine = create_engine(
+            "sqlite://",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+        SQLModel.metadata.create_all(engine)
+        with Session(engine) as session:
+            user = User(username="alice", email="alice@example.com", hashed_password="x")
+            session.add(user)
+            session.commit()
+            session.refresh(user)
+            session.info["user_id"] = user.id
+            yield session
+        engine.dispose()
+
+    def _add_job(self, session: Session) -> int:
+        job = WorkflowJob(workflow_id="wf", user_id=session.info["user_id"])
+        session.add(job)
+        session.commit()
+        session.refresh(job)
+        assert job.id is not None
+        return job.id
+
+    def test_newest_event_per_step_wins(self, session):
+        job_id = self._add_job(session)
+        other_id = self._add_job(session)
+        session.add_all(
+            [
+                WorkflowStepEvent(job_id=job_id, step_id="fetch", status="running"),
+                WorkflowStepEvent(job_id=job_id, step_id="fetch", status="completed"),
+                WorkflowStepEvent(job_id=job_id, step_id="summarize", status="running"),
+                WorkflowStepEvent(job_id=other_id, step_id="fetch", status="failed"),
+            ],
+        )
+        session.commit()
+
+        statuses = _load_step_statuses(session, [job_id, other_id])
+
+        assert statuses == {
+            job_id: {"fetch": "completed", "summarize": "running"},
+            other_id: {"fetch": "failed"},
+        }
+
+    def test_job_without_events_has_no_steps(self, session):
+        job_id = self._add_job(session)
+        assert _load_step_statuses(session, [job_id]) == {job_id: {}}
+
+    def test_backfill_is_a_no_op_without_the_legacy_column(self, session):
+        self._add_job(session)
+        backfill_step_events(session)
+        assert session.exec(select(WorkflowStepEvent)).all() == []
+
+    def test_backfill_copies_legacy_step_status_once(self, session):
+        job_id = self._add_job(session)
+        empty_id = self._add_job(session)
+        session.execute(text("ALTER TABLE workflowjob ADD COLUMN step_status JSON"))
+        session.execute(
+            text("UPDATE workflowjob SET step_status = :status WHERE id = :id").bindparams(
+                status=json.dumps({"fetch": "completed", "summarize": "failed"}),
+                id=job_id,
+            ),
+        )
+        session.commit()
+
+        backfill_step_events(session)
+        backfill_step_events(session)
+
+        assert _load_step_statuses(session, [job_id, empty_id]) == {
+            job_id: {"fetch": "completed", "summarize": "failed"},
+            empty_id: {},
+        }
+        assert len(session.exec(select(WorkflowStepEvent)).all()) == 2
+        legacy = session.execute(text("SELECT step_status FROM workflowjob WHERE id = :id"), {"id": job_id})
+        assert legacy.scalar() is None
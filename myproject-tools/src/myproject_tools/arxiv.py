@@ -2,6 +2,7 @@ import asyncio
 import re
 import tarfile
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -12,6 +13,11 @@ from .base import BaseTool
 from .pdf import convert_pdf_to_markdown
 from .schema import ToolResult
 
+# Papers fetched at once when a search downloads several; kept low to respect arXiv's rate limits
+ARXIV_FETCH_CONCURRENCY = 4
+# Read size when streaming downloads to disk; large chunks keep the Python-level write loop short
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
 
 def _format_result(
     result: Any,
@@ -66,7 +72,7 @@ def download_paper_pdf(paper_id: str, download_dir: Path, convert_to_markdown: b
             response.raise_for_status()
 
             with open(pdf_path, "wb") as f:
-                f.writelines(response.iter_bytes())
+                f.writelines(response.iter_bytes(chunk_size=DOWNLOAD_CHUNK_SIZE))
 
         convert_pdf_to_markdown(pdf_path=pdf_path, output_dir=download_dir)
 
@@ -99,8 +105,9 @@ def download_paper_source(paper_id: str, download_dir: Path) -> Path | None:
 
     with httpx.stream("GET", url, follow_redirects=True) as response:
         response.raise_for_status()
+        # Raw bytes skip content decoding; tarfile detects gzip itself if the body is still compressed
         with open(archive_path, "wb") as f:
-            f.writelines(response.iter_bytes())
+            f.writelines(response.iter_raw(chunk_size=DOWNLOAD_CHUNK_SIZE))
 
     source_dir = download_dir / paper_id
     source_dir.mkdir(exist_ok=True)
@@ -118,6 +125,10 @@ def download_paper_source(paper_id: str, download_dir: Path) -> Path | None:
         return None
 
 
+# Modern IDs (YYMM.NNNNN) or legacy IDs (subject/YYMMNNN), compiled once since this runs per paper
+_ARXIV_ID_RE = re.compile(r"\d{4}\.\d{4,5}(v\d+)?|[a-z\-]+(?:\.[A-Z]{2})?/\d{7}(v\d+)?", re.IGNORECASE)
+
+
 def extract_arxiv_id(input_str: str) -> str:
     """Extracts an arXiv ID from a URL or a string.
     Supports:
@@ -126,14 +137,7 @@ def extract_arxiv_id(input_str: str) -> str:
     - URLs: https://arxiv.org/abs/2301.12345, https://arxiv.org/pdf/2301.12345.pdf
     - Prefixes: arXiv:2301.12345
     """
-    # Pattern for modern IDs (YYMM.NNNNN)
-    modern_pattern = r"(\d{4}\.\d{4,5}(v\d+)?)"
-    # Pattern for legacy IDs (subject/YYMMNNN)
-    legacy_pattern = r"([a-z\-]+(?:\.[A-Z]{2})?/\d{7}(v\d+)?)"
-
-    # Combined search for both patterns
-    full_pattern = f"({modern_pattern}|{legacy_pattern})"
-    match = re.search(full_pattern, input_str, re.IGNORECASE)
+    match = _ARXIV_ID_RE.search(input_str)
 
     if match:
         return match.group(0)
@@ -243,6 +247,43 @@ def get_paper_details(
         return None
 
 
+def _fetch_paper_summaries(
+    paper_ids: list[str],
+    download_dir: Path | None,
+    download_pdf: bool,
+    download_source: bool,
+) -> list[dict]:
+    """Fetch details (and optional downloads) for several papers in parallel, keeping their order."""
+
+    def fetch(paper_id: str) -> dict | None:
+        return get_paper_details(
+            paper_id=paper_id,
+            download_dir=download_dir,
+            download_pdf=download_pdf,
+            download_source=download_source,
+        )
+
+    # Each paper is independent network I/O, so fetch a few at a time instead of one by one
+    with ThreadPoolExecutor(max_workers=ARXIV_FETCH_CONCURRENCY) as pool:
+        all_details = list(pool.map(fetch, paper_ids))
+
+    results = []
+    for details in all_details:
+        if details:
+            results.append(
+                {
+                    "id": details.get("short_id"),
+                    "title": details.get("title"),
+                    "summary": details.get("summary"),
+                    "authors": details.get("authors"),
+                    "pdf_path": details.get("pdf_path"),
+                    "md_path": details.get("md_path"),
+                }
+            )
+
+    return results
+
+
 def search_papers_arxiv(
     query: str,
     max_results: int = 10,
@@ -269,27 +310,7 @@ def search_papers_arxiv(
     except Exception:
         return []
 
-    results = []
-    for paper_id in paper_ids:
-        details = get_paper_details(
-            paper_id=paper_id,
-            download_dir=download_dir,
-            download_pdf=download_pdf,
-            download_source=download_source,
-        )
-        if details:
-            results.append(
-                {
-                    "id": details.get("short_id"),
-                    "title": details.get("title"),
-                    "summary": details.get("summary"),
-                    "authors": details.get("authors"),
-                    "pdf_path": details.get("pdf_path"),
-                    "md_path": details.get("md_path"),
-                }
-            )
-
-    return results
+    return _fetch_paper_summaries(paper_ids, download_dir, download_pdf, download_source)
 
 
 def search_papers_ddgs(
@@ -324,30 +345,12 @@ def search_papers_ddgs(
         print(f"DDGS search error: {e}")
         return []
 
-    results = []
-    for paper_id in paper_ids:
-        details = get_paper_details(
-            paper_id=paper_id,
-            download_dir=download_dir,
-            download_pdf=download_pdf,
-            download_source=download_source,
-        )
-        if details:
-            results.append(
-                {
-                    "id": details.get("short_id"),
-                    "title": details.get("title"),
-                    "summary": details.get("summary"),
-                    "authors": details.get("authors"),
-                    "pdf_path": details.get("pdf_path"),
-                    "md_path": details.get("md_path"),
-                }
-            )
-
-    return results
+    return _fetch_paper_summaries(paper_ids, download_dir, download_pdf, download_source)
 
 
 class ArxivSearchTool(BaseTool):
+    __slots__ = ()
+
     name = "arxiv_search_tool"
     description = "Search arxiv papers for a given query, download markdown and PDF of the found paper to a directory, and read the markdown files into the clipboard."
     parameters = {
@@ -425,6 +428,8 @@ class ArxivSearchTool(BaseTool):
 
 
 class ArxivPaperDetailTool(BaseTool):
+    __slots__ = ()
+
     name = "arxiv_paper_detail"
     description = (
         "Fetch detailed metadata for a specific arXiv paper by its ID. "
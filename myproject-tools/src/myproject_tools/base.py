@@ -1,3 +1,6 @@
+import functools
+import os
+import stat
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Any
@@ -5,7 +8,56 @@ from typing import Any
 from .schema import ToolResult
 
 
+@functools.lru_cache(maxsize=32)
+def _resolve_cached(path_str: str) -> Path:
+    """Resolve a working directory once per process; it is stable for an agent session,
+    so repeated tool calls skip the readlink/stat walk up the tree.
+    """
+    return Path(path_str).resolve()
+
+
+def _is_within(path_str: str, working_directory: Path) -> bool:
+    """String check that an absolute, normalized path lies inside the resolved working directory."""
+    root = str(_resolve_cached(str(working_directory)))
+    return os.path.commonpath([path_str, root]) == root
+
+
+def _has_symlink_below(base: str, path_str: str) -> bool:
+    """lstat each component of path_str below base, stopping at the first one that cannot be
+    read (missing, or below a regular file). Returns True if any existing component is a symlink.
+    """
+    current = base
+    for part in os.path.relpath(path_str, base).split(os.sep):
+        if part == os.curdir:
+            break
+        current = os.path.join(current, part)
+        try:
+            if stat.S_ISLNK(os.lstat(current).st_mode):
+                return True
+        except OSError:
+            return False
+    return False
+
+
+@functools.cache
+def _build_llm_schema(tool_class: type["BaseTool"], name: str) -> dict[str, Any]:
+    """Tool schemas are class-level constants, so build each one once instead of on every LLM call.
+    The name is part of the key because the registry assigns it after the class is defined.
+    """
+    return {
+        "type": "function",
+        "function": {
+            "name": name,
+            "description": tool_class.description,
+            "parameters": tool_class.parameters,
+        },
+    }
+
+
 class BaseTool(ABC):
+    # Tools keep all their state on the class, so instances need no __dict__
+    __slots__ = ()
+
     # We define these as class attributes with type hints
     # Subclasses can now simple assign 'name = "..."'
     name: str
@@ -17,14 +69,7 @@ class BaseTool(ABC):
         """Execute logic and return a ToolResult data object."""
 
     def to_llm_schema(self) -> dict[str, Any]:
-        return {
-            "type": "function",
-            "function": {
-                "name": self.name,
-                "description": self.description,
-                "parameters": self.parameters,
-            },
-        }
+        return _build_llm_schema(type(self), self.name)
 
     def _validate_path(
         self,
@@ -38,26 +83,37 @@ class BaseTool(ABC):
         """Internal utility to ensure a path is safe and valid.
         Returns a resolved Path object or raises ValueError with a message for the agent.
         """
-        user_path = Path(path_str)
-        # 1. Security: Don't allow absolute paths or escaping the working directory
-        full_path = (working_directory / user_path).absolute()
-
-        if not full_path.is_relative_to(working_directory.resolve()):
+        # 1. Security: Don't allow absolute paths or escaping the working directory.
+        # The lexical check already rejects '..' escapes. Components below the working directory
+        # are lstat'ed, and only a path through a symlink pays for a full realpath, which must
+        # then stay inside the resolved working directory
+        base = os.path.abspath(working_directory)
+        joined = os.path.normpath(os.path.join(base, path_str))
+        if os.path.commonpath([joined, base]) != base or (
+            _has_symlink_below(base, joined) and not _is_within(os.path.realpath(joined), working_directory)
+        ):
             raise ValueError(f"Access denied: '{path_str}' is outside the allowed working directory.")
 
-        # 2. Auto-create directory if requested and should be a directory
-        if should_be_dir and create_if_missing and not full_path.exists():
-            full_path.mkdir(parents=True, exist_ok=True)
+        # 2. One stat serves the existence and type checks below
+        try:
+            mode: int | None = os.stat(joined).st_mode
+        except OSError:
+            mode = None
+
+        # Auto-create directory if requested and should be a directory
+        if should_be_dir and create_if_missing and mode is None:
+            os.makedirs(joined, exist_ok=True)
+            mode = stat.S_IFDIR
 
         # 3. Existence check
-        if must_exist and not full_path.exists():
+        if must_exist and mode is None:
             raise ValueError(f"Path does not exist: '{path_str}'")
 
-        # 3. Type checks
-        if should_be_dir and full_path.exists() and not full_path.is_dir():
+        # 4. Type checks
+        if should_be_dir and mode is not None and not stat.S_ISDIR(mode):
             raise ValueError(f"Expected a directory, but found a file: '{path_str}'")
 
-        if should_be_file and full_path.exists() and not full_path.is_file():
+        if should_be_file and mode is not None and not stat.S_ISREG(mode):
             raise ValueError(f"Expected a file, but found a directory: '{path_str}'")
 
-        return full_path
+        return Path(joined)
@@ -7,6 +7,8 @@ from .schema import ToolResult
 
 
 class ComputeDateRangeTool(BaseTool):
+    __slots__ = ()
+
     name = "compute_date_range"
     description = (
         "Computes the starting and ending date of a time period (day, week, month, quarter, year) "
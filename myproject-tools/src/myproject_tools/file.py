@@ -1,12 +1,66 @@
 import asyncio
+import fnmatch
+import io
+import os
+import re
+import secrets
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
 
 from myproject_tools.base import BaseTool
 from myproject_tools.schema import ToolResult
 
+T = TypeVar("T")
+
+# File tools run their blocking I/O in a pool of their own, so a burst of tool calls does not
+# queue behind (or starve) other work on the event loop's default executor
+FILE_IO_WORKERS = 8
+_io_executor = ThreadPoolExecutor(max_workers=FILE_IO_WORKERS, thread_name_prefix="myproject-tools-io")
+
+
+async def _run_io(func: Callable[[], T]) -> T:
+    return await asyncio.get_running_loop().run_in_executor(_io_executor, func)
+
+
+# Parent directories already created or seen by WriteFileTool, so steady-state writes skip mkdir
+_known_dirs: set[str] = set()
+
+
+def _write_text_atomic(path: Path, content: str) -> None:
+    """Write to a temporary file in the same directory, then rename it over path.
+    A crash mid-write leaves no partially written file behind.
+    """
+    parent = str(path.parent)
+    if parent not in _known_dirs:
+        os.makedirs(parent, exist_ok=True)
+        _known_dirs.add(parent)
+
+    tmp_path = os.path.join(parent, f".{path.name}.{secrets.token_hex(4)}.tmp")
+    try:
+        # Mode "x" creates the file with the usual umask permissions, unlike tempfile's 0600
+        f = open(tmp_path, "x", encoding="utf-8")
+    except FileNotFoundError:
+        # The cached directory was removed since; create it again
+        _known_dirs.discard(parent)
+        os.makedirs(parent, exist_ok=True)
+        _known_dirs.add(parent)
+        f = open(tmp_path, "x", encoding="utf-8")
+
+    try:
+        with f:
+            f.write(content)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
 
 class ReadFileTool(BaseTool):
+    __slots__ = ()
+
     name = "read_file"
     description = (
         "Reads the content of a file and adds it to your clipboard. "
@@ -50,6 +104,8 @@ class ReadFileTool(BaseTool):
 
 
 class ListFilesTool(BaseTool):
+    __slots__ = ()
+
     name = "list_files"
     description = (
         "Lists files and directories in a tree-like structure up to 2 levels deep. "
@@ -67,7 +123,7 @@ class ListFilesTool(BaseTool):
     }
 
     # Directories we should almost always ignore to save tokens and avoid noise
-    IGNORE_DIRS = {".git", "__pycache__", "node_modules", ".venv", "venv", ".pytest_cache", ".vscode"}
+    IGNORE_DIRS = frozenset({".git", "__pycache__", "node_modules", ".venv", "venv", ".pytest_cache", ".vscode"})
 
     async def run(self, working_directory: Path, path: str = ".", **kwargs: Any) -> ToolResult:
         try:
@@ -78,43 +134,57 @@ class ListFilesTool(BaseTool):
             max_items = 250
             truncated = False
 
-            # We use os.walk or rglob? rglob is easier for depth control
-            # But let's build a manual recursive logic to handle IGNORE_DIRS efficiently
-            def build_tree(current_dir: Path, current_depth: int, prefix: str = ""):
-                nonlocal item_count, truncated
-                if current_depth > 2 or item_count >= max_items:
-                    if item_count >= max_items:
-                        truncated = True
-                    return
-
-                # Sort to ensure deterministic output (better for caching)
+            def scan(current_dir: str | Path, prefix: str) -> list[os.DirEntry] | None:
+                # Sort to ensure deterministic output (better for caching).
+                # scandir entries carry the file type from the directory listing, so is_file/is_dir
+                # need no stat call per entry except for symlinks
                 try:
-                    entries = sorted(
-                        current_dir.iterdir(), key=lambda x: (x.is_file(), x.name.lower()),
-                    )
+                    with os.scandir(current_dir) as it:
+                        return sorted(it, key=lambda x: (x.is_file(), x.name.lower()))
                 except PermissionError:
                     tree_lines.append(f"{prefix}└── [Permission Denied]")
-                    return
-
-                for i, entry in enumerate(entries):
-                    if item_count >= max_items:
-                        truncated = True
-                        break
-
-                    if entry.name in self.IGNORE_DIRS:
-                        continue
-
-                    item_count += 1
-                    is_last = i == len(entries) - 1
-                    connector = "└── " if is_last else "├── "
-
-                    tree_lines.append(f"{prefix}{connector}{entry.name}{'/' if entry.is_dir() else ''}")
-
-                    if entry.is_dir():
-                        extension = "    " if is_last else "│   "
-                        build_tree(entry, current_depth + 1, prefix + extension)
-
-            build_tree(root_path, 1)
+                    return None
+
+            # Depth-first walk with an explicit stack of [entries, next index, depth, prefix] frames
+            # instead of one recursive call per directory. A directory's subtree is emitted right
+            # after its own line, as the recursive version did
+            stack: list[list[Any]] = []
+            root_entries = scan(root_path, "")
+            if root_entries is not None:
+                stack.append([root_entries, 0, 1, ""])
+
+            while stack:
+                frame = stack[-1]
+                entries, i, depth, prefix = frame
+                if i == len(entries):
+                    stack.pop()
+                    continue
+                if item_count >= max_items:
+                    truncated = True
+                    break
+                frame[1] = i + 1
+
+                entry = entries[i]
+                if entry.name in self.IGNORE_DIRS:
+                    continue
+
+                item_count += 1
+                is_last = i == len(entries) - 1
+                # Each line is one f-string, which CPython builds in a single allocation
+                line_prefix = prefix + ("└── " if is_last else "├── ")
+
+                if not entry.is_dir():
+                    tree_lines.append(f"{line_prefix}{entry.name}")
+                    continue
+
+                tree_lines.append(f"{line_prefix}{entry.name}/")
+                if item_count >= max_items:
+                    truncated = True
+                elif depth < 2:
+                    child_prefix = prefix + ("    " if is_last else "│   ")
+                    child_entries = scan(entry.path, child_prefix)
+                    if child_entries is not None:
+                        stack.append([child_entries, 0, depth + 1, child_prefix])
 
             if truncated:
                 tree_lines.append("... [List truncated: too many items] ...")
@@ -134,6 +204,8 @@ class ListFilesTool(BaseTool):
 
 
 class WriteFileTool(BaseTool):
+    __slots__ = ()
+
     name = "write_file"
     description = (
         "Creates a NEW file in the working directory. "
@@ -174,13 +246,10 @@ class WriteFileTool(BaseTool):
 
             # 3. Perform I/O in a thread to avoid blocking the event loop
             def perform_write():
-                # Ensure parent directories exist
-                validated_path.parent.mkdir(parents=True, exist_ok=True)
-
-                # Write the content
-                validated_path.write_text(content, encoding="utf-8")
+                # Creates missing parent directories, then writes the content atomically
+                _write_text_atomic(validated_path, content)
 
-            await asyncio.to_thread(perform_write)
+            await _run_io(perform_write)
 
             # 4. Return success
             response_message = "File write operation completed successfully.\nResults:\n"
@@ -199,6 +268,8 @@ class WriteFileTool(BaseTool):
 
 
 class EditFileTool(BaseTool):
+    __slots__ = ()
+
     name = "edit_file"
     description = (
         "Replaces a single specific block of text in a file with new text. "
@@ -237,10 +308,11 @@ class EditFileTool(BaseTool):
             def apply_edit():
                 content = validated_path.read_text(encoding="utf-8")
 
-                # Check for existence
-                occurrence_count = content.count(old_str)
+                # Locate the first match and check that no second one follows, instead of counting
+                # every occurrence and then searching the file again in replace()
+                first = content.find(old_str)
 
-                if occurrence_count == 0:
+                if first < 0:
                     # Provide a helpful error if the model messed up the copy-paste
                     raise ValueError(
                         f"Could not find the old string you specified: {old_str}"
@@ -249,19 +321,20 @@ class EditFileTool(BaseTool):
                         "Write smaller old string could help.",
                     )
 
-                if occurrence_count > 1:
+                end = first + len(old_str)
+                if content.find(old_str, end) >= 0:
                     # Provide a helpful error if the string isn't unique enough
                     raise ValueError(
-                        f"Found {occurrence_count} occurrences of old string in '{file_path}'. "
+                        f"Found {content.count(old_str)} occurrences of old string in '{file_path}'. "
                         "Please include more surrounding lines in old string to make the match unique.",
                     )
 
                 # Perform the replacement
-                new_content = content.replace(old_str, new_str)
+                new_content = content[:first] + new_str + content[end:]
                 validated_path.write_text(new_content, encoding="utf-8")
 
             # Run disk I/O in a separate thread
-            await asyncio.to_thread(apply_edit)
+            await _run_io(apply_edit)
 
             # 3. Return success and trigger a clipboard refresh
             response_message = (
@@ -284,7 +357,55 @@ class EditFileTool(BaseTool):
             )
 
 
+def _match_components(matchers: list[Callable[[str], Any] | None], parts: list[str]) -> bool:
+    """Match path components against per-component glob matchers; None stands for '**'."""
+    if not matchers:
+        return not parts
+    head, rest = matchers[0], matchers[1:]
+    if head is None:
+        return any(_match_components(rest, parts[i:]) for i in range(len(parts) + 1))
+    return bool(parts) and head(parts[0]) is not None and _match_components(rest, parts[1:])
+
+
+def _walk_files(root_path: Path, pattern: str, ignore_dirs: frozenset[str]) -> Iterator[str]:
+    """Yield paths of files under root_path matching a glob pattern, like Path.rglob.
+    Ignored directories are pruned from the walk so their subtrees are never read.
+    """
+    match_tail = os.sep in pattern
+    if match_tail:
+        # rglob matches a pattern containing a separator component by component against the
+        # trailing path below root_path, so '*' never crosses a separator
+        matchers = [None] + [
+            None if part == "**" else re.compile(fnmatch.translate(part)).match
+            for part in pattern.split(os.sep)
+            if part
+        ]
+        root_len = len(os.path.join(root_path, ""))
+    else:
+        match = re.compile(fnmatch.translate(pattern)).match
+    for dirpath, dirnames, filenames in os.walk(root_path):
+        dirnames[:] = [d for d in dirnames if d not in ignore_dirs]
+        if match_tail:
+            rel_dir = dirpath[root_len:]
+            dir_parts = rel_dir.split(os.sep) if rel_dir else []
+        for name in filenames:
+            if match_tail:
+                if _match_components(matchers, [*dir_parts, name]):
+                    yield os.path.join(dirpath, name)
+            elif match(name):
+                yield os.path.join(dirpath, name)
+
+
+def _rel_prefix_len(working_directory: Path) -> int:
+    """Length of the working directory prefix, separator included.
+    Validated search roots lie under it, so walked paths are made relative by slicing.
+    """
+    return len(os.path.join(os.path.abspath(working_directory), ""))
+
+
 class FindFilesTool(BaseTool):
+    __slots__ = ()
+
     name = "find_files"
     description = (
         "Search for files by name pattern (e.g., '*.py', 'test_*.py', 'auth'). "
@@ -306,7 +427,7 @@ class FindFilesTool(BaseTool):
         "required": ["pattern"],
     }
 
-    IGNORE_DIRS = {".git", "__pycache__", "node_modules", ".venv", "venv"}
+    IGNORE_DIRS = frozenset({".git", "__pycache__", "node_modules", ".venv", "venv"})
 
     async def run(
         self, working_directory: Path, pattern: str, search_dir: str = ".", **kwargs: Any,
@@ -318,21 +439,17 @@ class FindFilesTool(BaseTool):
 
             def search():
                 matches = []
+                prefix_len = _rel_prefix_len(working_directory)
                 # Walk through directories, skipping the ignored ones
-                for path in root_path.rglob(pattern):
-                    # Check if any part of the path is in IGNORE_DIRS
-                    if any(part in self.IGNORE_DIRS for part in path.parts):
-                        continue
-
-                    if path.is_file():
-                        # Return path relative to the working directory for the agent's convenience
-                        matches.append(str(path.relative_to(working_directory)))
+                for path in _walk_files(root_path, pattern, self.IGNORE_DIRS):
+                    # Return path relative to the working directory for the agent's convenience
+                    matches.append(path[prefix_len:])
 
                     if len(matches) >= 50:
                         break
                 return matches
 
-            results = await asyncio.to_thread(search)
+            results = await _run_io(search)
 
             if not results:
                 return ToolResult(
@@ -355,6 +472,8 @@ class FindFilesTool(BaseTool):
 
 
 class DeleteFileTool(BaseTool):
+    __slots__ = ()
+
     name = "delete_file"
     description = "Deletes a specific file. Use this for cleanup or removing unnecessary code."
     parameters = {
@@ -378,7 +497,7 @@ class DeleteFileTool(BaseTool):
             def perform_delete():
                 validated_path.unlink()
 
-            await asyncio.to_thread(perform_delete)
+            await _run_io(perform_delete)
 
             return ToolResult(
                 status="success",
@@ -394,6 +513,8 @@ class DeleteFileTool(BaseTool):
 
 
 class MoveFileTool(BaseTool):
+    __slots__ = ()
+
     name = "move_file"
     description = "Moves or renames a file. Can also be used to move a file into a new directory."
     parameters = {
@@ -427,7 +548,7 @@ class MoveFileTool(BaseTool):
                 dst.parent.mkdir(parents=True, exist_ok=True)
                 src.rename(dst)
 
-            await asyncio.to_thread(perform_move)
+            await _run_io(perform_move)
 
             return ToolResult(
                 status="success",
@@ -438,7 +559,93 @@ class MoveFileTool(BaseTool):
             return ToolResult(status="error", tool_response=f"Move failed: {e!s}")
 
 
+# Maximum number of matching lines returned by SearchFileContentTool
+SEARCH_MAX_MATCHES = 100
+
+# Threads reading files for the Python search fallback, and how many files may be queued ahead.
+# A separate pool from _io_executor, since the search itself runs there and waits on these
+SEARCH_WORKERS = 8
+SEARCH_WINDOW = 2 * SEARCH_WORKERS
+_search_executor = ThreadPoolExecutor(max_workers=SEARCH_WORKERS, thread_name_prefix="myproject-tools-search")
+
+# Files up to this size are read whole and rejected with one substring search; larger ones
+# (logs, data dumps) are streamed so SEARCH_WORKERS threads never hold that much text at once
+SEARCH_READ_WHOLE_MAX = 1024 * 1024
+
+
+def _matching_lines(lines: Iterable[str], query: str, rel_path: str) -> list[str]:
+    """Format up to SEARCH_MAX_MATCHES lines containing query as 'rel_path:line: text'."""
+    matches = []
+    for i, line in enumerate(lines, 1):
+        if query in line:
+            matches.append(f"{rel_path}:{i}: {line.strip()}")
+            if len(matches) >= SEARCH_MAX_MATCHES:
+                break
+    return matches
+
+
+def _scan_file(path: str, query: str, rel_path: str) -> list[str]:
+    """Return up to SEARCH_MAX_MATCHES 'rel_path:line: text' matches of query in one file."""
+    try:
+        with open(path, encoding="utf-8", errors="ignore") as f:
+            if os.fstat(f.fileno()).st_size > SEARCH_READ_WHOLE_MAX:
+                # Large files are streamed line by line, so each worker's memory stays flat
+                return _matching_lines(f, query, rel_path)
+            content = f.read()
+    except Exception:
+        return []  # Skip files that can't be read
+
+    # Most files do not contain the query; one substring search rejects them without
+    # iterating their lines in Python. StringIO splits on newlines exactly like the file does
+    if query not in content:
+        return []
+    return _matching_lines(io.StringIO(content), query, rel_path)
+
+
+async def _rg_search(
+    root_path: Path, working_directory: Path, query: str, file_pattern: str, ignore_dirs: frozenset[str],
+) -> tuple[list[str], bool]:
+    """Search file contents with ripgrep, formatting matches like the Python fallback.
+    Raises FileNotFoundError when rg is not installed.
+    """
+    # --hidden/--no-ignore keep the same file set as the Python walk, which does not read .gitignore.
+    # --null ends the path with NUL so paths containing ':' still split correctly, and capping the
+    # columns keeps minified one-line files under the stream reader's line limit
+    if "/" in file_pattern and not file_pattern.startswith("**/"):
+        # rg anchors a glob containing a separator at the search root, while rglob matches it
+        # against the trailing path components at any depth
+        file_pattern = "**/" + file_pattern
+    args = [
+        "rg", "--fixed-strings", "--line-number", "--no-heading", "--with-filename", "--null",
+        "--color=never", "--no-messages", "--hidden", "--no-ignore", "--glob", file_pattern,
+        "--max-columns=1000", "--max-columns-preview",
+    ]
+    for ignored in ignore_dirs:
+        args += ["--glob", f"!{ignored}"]
+    args += ["--", query, str(root_path)]
+
+    proc = await asyncio.create_subprocess_exec(
+        *args, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.DEVNULL,
+    )
+    assert proc.stdout is not None
+    matches: list[str] = []
+    prefix_len = _rel_prefix_len(working_directory)
+    async for raw in proc.stdout:
+        path, _, rest = raw.decode("utf-8", errors="ignore").partition("\0")
+        line_number, _, text = rest.partition(":")
+        matches.append(f"{path[prefix_len:]}:{line_number}: {text.strip()}")
+        if len(matches) >= SEARCH_MAX_MATCHES:
+            # Stop rg once enough matches are collected instead of letting it scan the rest
+            proc.kill()
+            await proc.wait()
+            return matches, True
+    await proc.wait()
+    return matches, False
+
+
 class SearchFileContentTool(BaseTool):
+    __slots__ = ()
+
     name = "search_file_content"
     description = "Searches for a specific string within all files in a directory (recursive)."
     parameters = {
@@ -462,7 +669,7 @@ class SearchFileContentTool(BaseTool):
         "required": ["query"],
     }
 
-    IGNORE_DIRS = {".git", "__pycache__", "node_modules", ".venv", "venv"}
+    IGNORE_DIRS = frozenset({".git", "__pycache__", "node_modules", ".venv", "venv"})
 
     async def run(
         self,
@@ -479,23 +686,35 @@ class SearchFileContentTool(BaseTool):
 
             def perform_search():
                 matches = []
-                for path in root_path.rglob(file_pattern):
-                    if any(part in self.IGNORE_DIRS for part in path.parts) or not path.is_file():
-                        continue
-
-                    try:
-                        with open(path, encoding="utf-8", errors="ignore") as f:
-                            for i, line in enumerate(f, 1):
-                                if query in line:
-                                    rel_path = path.relative_to(working_directory)
-                                    matches.append(f"{rel_path}:{i}: {line.strip()}")
-                                if len(matches) >= 100:
-                                    return matches, True
-                    except Exception:
-                        continue  # Skip files that can't be read
-                return matches, False
-
-            results, truncated = await asyncio.to_thread(perform_search)
+                prefix_len = _rel_prefix_len(working_directory)
+                # Files are read and scanned by the search pool while the walk continues, with a
+                # bounded window of pending files. Results are taken in walk order
+                pending: deque[Future[list[str]]] = deque()
+                try:
+                    for path in _walk_files(root_path, file_pattern, self.IGNORE_DIRS):
+                        pending.append(_search_executor.submit(_scan_file, path, query, path[prefix_len:]))
+                        if len(pending) < SEARCH_WINDOW:
+                            continue
+                        matches.extend(pending.popleft().result())
+                        if len(matches) >= SEARCH_MAX_MATCHES:
+                            return matches[:SEARCH_MAX_MATCHES], True
+                    while pending:
+                        matches.extend(pending.popleft().result())
+                        if len(matches) >= SEARCH_MAX_MATCHES:
+                            return matches[:SEARCH_MAX_MATCHES], True
+                    return matches, False
+                finally:
+                    # Stop scanning files whose results are no longer needed
+                    for future in pending:
+                        future.cancel()
+
+            # ripgrep scans files natively and far faster; the Python loop is only used without it
+            try:
+                results, truncated = await _rg_search(
+                    root_path, working_directory, query, file_pattern, self.IGNORE_DIRS,
+                )
+            except FileNotFoundError:
+                results, truncated = await _run_io(perform_search)
 
             if not results:
                 return ToolResult(
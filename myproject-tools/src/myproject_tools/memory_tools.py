@@ -74,6 +74,8 @@ def _make_memory_entity(
 class RememberThisTool(BaseTool):
     """Store a new memory about the user or their context."""
 
+    __slots__ = ()
+
     name = "remember_this"
     description = (
         "Stores a new memory about the user or their context. "
@@ -191,6 +193,8 @@ class RememberThisTool(BaseTool):
 class SearchMemoriesTool(BaseTool):
     """Search memories by keyword across subject and content."""
 
+    __slots__ = ()
+
     name = "search_memories"
     description = (
         "Search across all memories by keyword. Searches subject and content fields. "
@@ -257,6 +261,8 @@ class SearchMemoriesTool(BaseTool):
 class ListMemoriesTool(BaseTool):
     """List memories with optional filters."""
 
+    __slots__ = ()
+
     name = "list_memories"
     description = (
         "List memories with optional filters. "
@@ -393,6 +399,8 @@ class ListMemoriesTool(BaseTool):
 class GetMemoryTool(BaseTool):
     """Retrieve a specific memory by ID."""
 
+    __slots__ = ()
+
     name = "get_memory"
     description = (
         "Retrieve the full details of a specific memory by its ID. "
@@ -468,6 +476,8 @@ class GetMemoryTool(BaseTool):
 class UpdateMemoryTool(BaseTool):
     """Update a topical memory. This creates a new revision, preserving history via supersession."""
 
+    __slots__ = ()
+
     name = "update_memory"
     description = (
         "Update a topical memory's content. This DOES NOT overwrite in-place — "
@@ -551,6 +561,8 @@ class UpdateMemoryTool(BaseTool):
 class DeleteMemoryTool(BaseTool):
     """Delete a memory by ID."""
 
+    __slots__ = ()
+
     name = "delete_memory"
     description = (
         "Permanently delete a memory. This cannot be undone. "
@@ -613,6 +625,8 @@ class RebuildFtsIndexTool(BaseTool):
     This re-indexes all EventLog and TopicalMemory records into the FTS5 virtual table.
     """
 
+    __slots__ = ()
+
     name = "rebuild_fts_index"
     description = (
         "Rebuild the full-text search index. Use this if searches are not finding existing memories."
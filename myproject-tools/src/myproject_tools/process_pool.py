@@ -0,0 +1,58 @@
+import asyncio
+import multiprocessing
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+class LazyProcessPool:
+    """A shared pool of worker processes for CPU-bound work, created on first use.
+    Workers are spawned, since forking a process that already runs threads is unsafe.
+    """
+
+    __slots__ = ("_executor", "max_workers")
+
+    def __init__(self, max_workers: int):
+        self.max_workers = max_workers
+        self._executor: ProcessPoolExecutor | None = None
+
+    def get(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
+
+    def discard(self, executor: ProcessPoolExecutor) -> None:
+        """Drop a pool that lost a worker; a broken pool rejects all further work.
+        Concurrent callers may see the same failure, so a newer pool is left alone.
+        """
+        if self._executor is executor:
+            self._executor = None
+        executor.shutdown(wait=False)
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """Run fn(*args) in the pool. If a worker died (e.g. killed for memory), the call is
+        retried once in a fresh pool; BrokenProcessPool is raised if that fails as well.
+        """
+        loop = asyncio.get_running_loop()
+        executor = self.get()
+        try:
+            return await loop.run_in_executor(executor, fn, *args)
+        except BrokenProcessPool:
+            self.discard(executor)
+        executor = self.get()
+        try:
+            return await loop.run_in_executor(executor, fn, *args)
+        except BrokenProcessPool:
+            self.discard(executor)
+            raise
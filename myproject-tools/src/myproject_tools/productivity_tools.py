@@ -39,6 +39,8 @@ def _parse_to_utc(date_str: str, is_end_of_day: bool, local_tz: str) -> datetime
 
 
 class SearchTasksTool(BaseTool):
+    __slots__ = ()
+
     name = "search_tasks"
     description = (
         "Search and filter the user's tasks. The results will be pinned to your CLIPBOARD. "
@@ -226,6 +228,8 @@ class SearchTasksTool(BaseTool):
 
 
 class ReadTaskTool(BaseTool):
+    __slots__ = ()
+
     name = "read_task"
     description = (
         "Retrieves the full, detailed record of a specific task, including its description and project links. "
@@ -270,6 +274,8 @@ class ReadTaskTool(BaseTool):
 
 
 class SearchProjectsTool(BaseTool):
+    __slots__ = ()
+
     name = "search_projects"
     description = (
         "Search and filter the user's projects. The results will be pinned to your CLIPBOARD. "
@@ -398,6 +404,8 @@ class SearchProjectsTool(BaseTool):
 
 
 class ReadProjectTool(BaseTool):
+    __slots__ = ()
+
     name = "read_project"
     description = "Retrieves the full details of a specific project and pins it to your CLIPBOARD."
     parameters = {
@@ -430,6 +438,8 @@ class ReadProjectTool(BaseTool):
 
 
 class SearchJournalsTool(BaseTool):
+    __slots__ = ()
+
     name = "search_journals"
     description = (
         "Search and filter the user's journal entries. The results will be pinned to your CLIPBOARD as summaries. "
@@ -554,6 +564,8 @@ class SearchJournalsTool(BaseTool):
 
 
 class ReadJournalTool(BaseTool):
+    __slots__ = ()
+
     name = "read_journal"
     description = (
         "Retrieves the full markdown text of a specific journal entry and pins it to your CLIPBOARD."
@@ -588,6 +600,8 @@ class ReadJournalTool(BaseTool):
 
 
 class CreateTaskTool(BaseTool):
+    __slots__ = ()
+
     name = "create_task"
     description = (
         "Creates a new task in the productivity system and pins it to your CLIPBOARD. "
@@ -671,6 +685,8 @@ class CreateTaskTool(BaseTool):
 
 
 class CreateProjectTool(BaseTool):
+    __slots__ = ()
+
     name = "create_project"
     description = "Creates a new project and pins it to your CLIPBOARD. Projects are used to group related tasks and journals."
     parameters = {
@@ -729,6 +745,8 @@ class CreateProjectTool(BaseTool):
 
 
 class CreateJournalTool(BaseTool):
+    __slots__ = ()
+
     name = "create_journal"
     description = (
         "Creates a new journal entry (daily, weekly, monthly, yearly, project, or general). "
@@ -837,6 +855,8 @@ class CreateJournalTool(BaseTool):
 
 
 class UpdateTasksTool(BaseTool):
+    __slots__ = ()
+
     name = "update_tasks"
     description = (
         "Updates one or more tasks. You can use this to mark tasks as completed, change their deadlines, or reschedule them. "
@@ -954,6 +974,8 @@ class UpdateTasksTool(BaseTool):
 
 
 class UpdateProjectTool(BaseTool):
+    __slots__ = ()
+
     name = "update_project"
     description = "Updates an existing project. Pass an empty string '' to clear optional fields like description or deadline."
     parameters = {
@@ -1022,6 +1044,8 @@ class UpdateProjectTool(BaseTool):
 
 
 class EditJournalTool(BaseTool):
+    __slots__ = ()
+
     name = "edit_journal"
     description = (
         "Replaces a single specific block of text in a journal entry with new text. "
@@ -1,108 +1,95 @@
-from .arxiv import ArxivPaperDetailTool, ArxivSearchTool
+import importlib
+from collections.abc import Callable
+
 from .base import BaseTool
-from .date_tools import ComputeDateRangeTool
-from .file import (
-    DeleteFileTool,
-    EditFileTool,
-    FindFilesTool,
-    ListFilesTool,
-    MoveFileTool,
-    ReadFileTool,
-    SearchFileContentTool,
-    WriteFileTool,
-)
-from .memory_tools import (
-    DeleteMemoryTool,
-    GetMemoryTool,
-    ListMemoriesTool,
-    RebuildFtsIndexTool,
-    RememberThisTool,
-    SearchMemoriesTool,
-    UpdateMemoryTool,
-)
-from .pdf import PdfToMarkdownTool
-from .productivity_tools import (
-    CreateJournalTool,
-    CreateProjectTool,
-    CreateTaskTool,
-    EditJournalTool,
-    ReadJournalTool,
-    ReadProjectTool,
-    ReadTaskTool,
-    SearchJournalsTool,
-    SearchProjectsTool,
-    SearchTasksTool,
-    UpdateProjectTool,
-    UpdateTasksTool,
-)
-from .rss_utils import RssFetchTool
-from .test_tools import MockTestTool
-from .web_fetch import WebPageFetchTool
-from .web_search import NewsSearchTool, WebSearchTool
 
 
 class ToolRegistry:
     def __init__(self):
-        self._tools: dict[str, type[BaseTool]] = {}
+        # Each name maps to a zero-argument factory for the tool. A tool registered by path starts
+        # with a loader that imports it and then replaces itself with the class
+        self._tools: dict[str, Callable[[], BaseTool]] = {}
+        # Snapshot of the registered names, rebuilt on the first lookup after a registration
+        self._names: tuple[str, ...] | None = None
+
+    def register(self, name: str, tool_class: type[BaseTool] | str):
+        """Register a tool class, or its 'module:ClassName' path to import it on first use.
+        Tool modules pull in heavy dependencies (feedparser, trafilatura, ddgs, sqlalchemy...),
+        so the built-in tools are registered by path and only the ones used get imported.
+        """
+        self._names = None
+        if isinstance(tool_class, str):
+            self._tools[name] = self._make_loader(name, tool_class)
+        else:
+            self._tools[name] = self._bind_name(name, tool_class)
 
-    def register(self, name: str, tool_class: type[BaseTool]):
-        """Register a tool instance."""
+    @staticmethod
+    def _bind_name(name: str, tool_class: type[BaseTool]) -> type[BaseTool]:
         # hacky implementation for now to overwrite the tool name
         # The goal here is so that the dictionary key matches the name define in class
         tool_class.name = name
-        self._tools[name] = tool_class
+        return tool_class
+
+    def _make_loader(self, name: str, path: str) -> Callable[[], BaseTool]:
+        def load() -> BaseTool:
+            module_path, class_name = path.split(":")
+            tool_class = self._bind_name(name, getattr(importlib.import_module(module_path), class_name))
+            self._tools[name] = tool_class
+            return tool_class()
+
+        return load
 
     def get_tool(self, name: str) -> BaseTool | None:
         """Look up a tool by name."""
-        tool_class = self._tools.get(name)
-        if not tool_class:
-            return None
-        return tool_class()
+        factory = self._tools.get(name)
+        return factory() if factory else None
 
-    def get_all_tool_names(self) -> list[str]:
-        return list(self._tools.keys())
+    def get_all_tool_names(self) -> tuple[str, ...]:
+        if self._names is None:
+            self._names = tuple(self._tools)
+        return self._names
 
 
 # Global registry instance
 tool_registry = ToolRegistry()
 
-tool_registry.register("test_tool", MockTestTool)
-tool_registry.register("get_arxiv_paper_detail", ArxivPaperDetailTool)
-tool_registry.register("search_arxiv_paper", ArxivSearchTool)
-tool_registry.register("convert_pdf_to_markdown_tool", PdfToMarkdownTool)
-tool_registry.register("fetch_rss_feed", RssFetchTool)
-tool_registry.register("fetch_web_page", WebPageFetchTool)
-tool_registry.register("search_web", WebSearchTool)
-tool_registry.register("search_news", NewsSearchTool)
-tool_registry.register("list_files", ListFilesTool)
-tool_registry.register("read_file", ReadFileTool)
-tool_registry.register("write_file", WriteFileTool)
-tool_registry.register("edit_file", EditFileTool)
-tool_registry.register("find_files", FindFilesTool)
-tool_registry.register("delete_file", DeleteFileTool)
-tool_registry.register("move_or_rename_file", MoveFileTool)
-tool_registry.register("search_file_content", SearchFileContentTool)
-tool_registry.register("search_tasks", SearchTasksTool)
-tool_registry.register("read_task", ReadTaskTool)
-tool_registry.register("search_projects", SearchProjectsTool)
-tool_registry.register("read_project", ReadProjectTool)
-tool_registry.register("search_journals", SearchJournalsTool)
-tool_registry.register("read_journal", ReadJournalTool)
-tool_registry.register("create_task", CreateTaskTool)
-tool_registry.register("create_project", CreateProjectTool)
-tool_registry.register("create_journal", CreateJournalTool)
-tool_registry.register("update_tasks", UpdateTasksTool)
-tool_registry.register("update_project", UpdateProjectTool)
-tool_registry.register("edit_journal", EditJournalTool)
+tool_registry.register("test_tool", "myproject_tools.test_tools:MockTestTool")
+tool_registry.register("get_arxiv_paper_detail", "myproject_tools.arxiv:ArxivPaperDetailTool")
+tool_registry.register("search_arxiv_paper", "myproject_tools.arxiv:ArxivSearchTool")
+tool_registry.register("convert_pdf_to_markdown_tool", "myproject_tools.pdf:PdfToMarkdownTool")
+tool_registry.register("fetch_rss_feed", "myproject_tools.rss_utils:RssFetchTool")
+tool_registry.register("fetch_web_page", "myproject_tools.web_fetch:WebPageFetchTool")
+tool_registry.register("search_web", "myproject_tools.web_search:WebSearchTool")
+tool_registry.register("search_news", "myproject_tools.web_search:NewsSearchTool")
+tool_registry.register("list_files", "myproject_tools.file:ListFilesTool")
+tool_registry.register("read_file", "myproject_tools.file:ReadFileTool")
+tool_registry.register("write_file", "myproject_tools.file:WriteFileTool")
+tool_registry.register("edit_file", "myproject_tools.file:EditFileTool")
+tool_registry.register("find_files", "myproject_tools.file:FindFilesTool")
+tool_registry.register("delete_file", "myproject_tools.file:DeleteFileTool")
+tool_registry.register("move_or_rename_file", "myproject_tools.file:MoveFileTool")
+tool_registry.register("search_file_content", "myproject_tools.file:SearchFileContentTool")
+tool_registry.register("search_tasks", "myproject_tools.productivity_tools:SearchTasksTool")
+tool_registry.register("read_task", "myproject_tools.productivity_tools:ReadTaskTool")
+tool_registry.register("search_projects", "myproject_tools.productivity_tools:SearchProjectsTool")
+tool_registry.register("read_project", "myproject_tools.productivity_tools:ReadProjectTool")
+tool_registry.register("search_journals", "myproject_tools.productivity_tools:SearchJournalsTool")
+tool_registry.register("read_journal", "myproject_tools.productivity_tools:ReadJournalTool")
+tool_registry.register("create_task", "myproject_tools.productivity_tools:CreateTaskTool")
+tool_registry.register("create_project", "myproject_tools.productivity_tools:CreateProjectTool")
+tool_registry.register("create_journal", "myproject_tools.productivity_tools:CreateJournalTool")
+tool_registry.register("update_tasks", "myproject_tools.productivity_tools:UpdateTasksTool")
+tool_registry.register("update_project", "myproject_tools.productivity_tools:UpdateProjectTool")
+tool_registry.register("edit_journal", "myproject_tools.productivity_tools:EditJournalTool")
 # Memory tools
-tool_registry.register("remember_this", RememberThisTool)
-tool_registry.register("search_memories", SearchMemoriesTool)
-tool_registry.register("list_memories", ListMemoriesTool)
-tool_registry.register("get_memory", GetMemoryTool)
-tool_registry.register("update_memory", UpdateMemoryTool)
-tool_registry.register("delete_memory", DeleteMemoryTool)
-tool_registry.register("rebuild_fts_index", RebuildFtsIndexTool)
-tool_registry.register("compute_date_range", ComputeDateRangeTool)
+tool_registry.register("remember_this", "myproject_tools.memory_tools:RememberThisTool")
+tool_registry.register("search_memories", "myproject_tools.memory_tools:SearchMemoriesTool")
+tool_registry.register("list_memories", "myproject_tools.memory_tools:ListMemoriesTool")
+tool_registry.register("get_memory", "myproject_tools.memory_tools:GetMemoryTool")
+tool_registry.register("update_memory", "myproject_tools.memory_tools:UpdateMemoryTool")
+tool_registry.register("delete_memory", "myproject_tools.memory_tools:DeleteMemoryTool")
+tool_registry.register("rebuild_fts_index", "myproject_tools.memory_tools:RebuildFtsIndexTool")
+tool_registry.register("compute_date_range", "myproject_tools.date_tools:ComputeDateRangeTool")
 
 
 def main():
@@ -1,51 +1,330 @@
 import asyncio
+import calendar
+import copy
+import functools
+import io
+import json
+import sqlite3
 import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime, timedelta
+from email.utils import parsedate_to_datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
 
 import feedparser
+import httpx
+from lxml import etree
 
 from .base import BaseTool
 from .schema import ToolResult
 
+# Timeout in seconds for each feed request of a batch fetch
+RSS_FETCH_TIMEOUT = 15
 
-def fetch_single_rss(url: str, since_days: int = 1) -> list[dict[str, Any]]:
-    """Blocking function to fetch and parse a single RSS feed.
-    """
+# Feeds are fetched with httpx but announce themselves as feedparser did, since some servers
+# reject httpx's default "python-httpx" User-Agent
+RSS_HEADERS = {"User-Agent": feedparser.USER_AGENT}
+
+# Dedicated threads for blocking feed fetches and parses, so many feeds don't compete with
+# other to_thread work for the loop's default executor
+RSS_WORKERS = 10
+_rss_executor = ThreadPoolExecutor(max_workers=RSS_WORKERS, thread_name_prefix="myproject-tools-rss")
+
+# Conditional-GET cache: the ETag / Last-Modified validators of each feed plus its parsed entries.
+# An unchanged feed answers 304 and its entries come from here without downloading or parsing it.
+# Cached feeds older than RSS_CACHE_MAX_AGE seconds are fetched in full again
+RSS_CACHE_PATH = Path.home() / ".cache" / "myproject_tools" / "rss.sqlite"
+RSS_CACHE_MAX_AGE = 24 * 60 * 60
+
+
+class _CachedFeed(NamedTuple):
+    etag: str | None
+    modified: str | None
+    entries: list[dict[str, Any]]
+
+
+@functools.cache
+def _cache_db() -> str:
+    """Create the cache database once per process and return its path."""
+    RSS_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with sqlite3.connect(RSS_CACHE_PATH) as conn:
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS feeds ("
+            "url TEXT PRIMARY KEY, etag TEXT, modified TEXT, entries_json TEXT NOT NULL, ts REAL NOT NULL)",
+        )
+    return str(RSS_CACHE_PATH)
+
+
+def _cache_get(url: str) -> _CachedFeed | None:
+    # The cache is only an optimization; any failure just means a full fetch
+    try:
+        with sqlite3.connect(_cache_db(), timeout=5) as conn:
+            row = conn.execute(
+                "SELECT etag, modified, entries_json FROM feeds WHERE url = ? AND ts >= ?",
+                (url, time.time() - RSS_CACHE_MAX_AGE),
+            ).fetchone()
+    except (OSError, sqlite3.Error):
+        return None
+    if row is None:
+        return None
+    return _CachedFeed(row[0], row[1], json.loads(row[2]))
+
+
+def _cache_put(url: str, etag: str | None, modified: str | None, entries: list[dict[str, Any]]) -> None:
+    # Without a validator the server can never answer 304, so there is nothing to cache
+    if not etag and not modified:
+        return
+    try:
+        with sqlite3.connect(_cache_db(), timeout=5) as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO feeds (url, etag, modified, entries_json, ts) VALUES (?, ?, ?, ?, ?)",
+                (url, etag, modified, json.dumps(entries), time.time()),
+            )
+    except (OSError, sqlite3.Error):
+        pass
+
+
+def _feed_entries(feed_data: Any) -> list[dict[str, Any]]:
+    """Extract the entries of a parsed feed, with their publication time as an ISO string."""
     all_entries = []
-    cutoff_date = datetime.now(UTC) - timedelta(days=since_days)
 
-    # feedparser.parse is a blocking network call
-    feed_data: Any = feedparser.parse(url)
     feed_info = feed_data.get("feed", {})
     feed_title = feed_info.get("title", "Unknown Feed")
     entries = feed_data.get("entries", [])
 
     for entry in entries:
         published_parsed = entry.get("published_parsed") or entry.get("updated_parsed")
-        published_dt: datetime | None = None
-
-        if published_parsed:
-            timestamp = time.mktime(published_parsed)
-            published_dt = datetime.fromtimestamp(timestamp, tz=UTC)
-
-        # Include if it's within the time window OR if it has no date (to be safe)
-        if (published_dt and published_dt >= cutoff_date) or not published_parsed:
-            all_entries.append(
-                {
-                    "title": entry.get("title", "No Title"),
-                    "link": entry.get("link", ""),
-                    "summary": entry.get("summary", ""),
-                    "published": published_dt.isoformat() if published_dt else "Unknown",
-                    "feed_title": feed_title,
-                },
-            )
+        # feedparser normalizes dates to a UTC struct_time; timegm reads it as UTC, whereas
+        # time.mktime would apply the local timezone
+        published = (
+            datetime.fromtimestamp(calendar.timegm(published_parsed), tz=UTC).isoformat()
+            if published_parsed
+            else "Unknown"
+        )
+
+        all_entries.append(
+            {
+                "title": entry.get("title", "No Title"),
+                "link": entry.get("link", ""),
+                "summary": entry.get("summary", ""),
+                "published": published,
+                "feed_title": feed_title,
+            },
+        )
 
     return all_entries
 
 
+def _recent_entries(entries: list[dict[str, Any]], since_days: int) -> list[dict[str, Any]]:
+    """Keep the entries published within the last since_days days."""
+    # Every "published" value is a UTC isoformat() string, so they order chronologically as plain
+    # strings and the cutoff needs no datetime parsing per entry
+    cutoff = (datetime.now(UTC).replace(microsecond=0) - timedelta(days=since_days)).isoformat()
+    # Include if it's within the time window OR if it has no date (to be safe)
+    return [entry for entry in entries if entry["published"] >= cutoff or entry["published"] == "Unknown"]
+
+
+# Namespaces of the Atom, RSS 1.0 (RDF) and Dublin Core elements read by the streaming parser
+_ATOM = "{http://www.w3.org/2005/Atom}"
+_RSS1 = "{http://purl.org/rss/1.0/}"
+_DC = "{http://purl.org/dc/elements/1.1/}"
+_XHTML = "{http://www.w3.org/1999/xhtml}"
+_ENTRY_TAGS = frozenset({"item", f"{_ATOM}entry", f"{_RSS1}item"})
+_FEED_TAGS = frozenset({"channel", f"{_ATOM}feed", f"{_RSS1}channel"})
+
+
+def _parse_date(value: str | None) -> datetime | None:
+    """Parse an RFC 822 (RSS pubDate) or ISO 8601 (Atom, dc:date) timestamp to UTC."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        dt = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        try:
+            dt = datetime.fromisoformat(value)
+        except ValueError:
+            return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=UTC)
+    return dt.astimezone(UTC)
+
+
+def _atom_text(elem: etree._Element | None) -> str | None:
+    """Text of an Atom text construct. A type="xhtml" one holds markup in a wrapper div, which is
+    serialized back to an HTML string without the XHTML namespace, as feedparser returns it.
+    """
+    if elem is None or elem.get("type") != "xhtml":
+        return None if elem is None else elem.text
+    div = elem.find(f"{_XHTML}div")
+    if div is None:
+        return elem.text
+    # Copied out of the feed, so the Atom default namespace is not serialized with the markup
+    div = copy.deepcopy(div)
+    for node in div.iter():
+        if isinstance(node.tag, str) and node.tag.startswith(_XHTML):
+            node.tag = node.tag[len(_XHTML):]
+    etree.cleanup_namespaces(div)
+    return (div.text or "") + "".join(etree.tostring(child, encoding="unicode") for child in div)
+
+
+def _parse_rss_streaming(body: bytes) -> Iterator[dict[str, Any]]:
+    """Stream the entries of an RSS 2.0, RSS 1.0 or Atom feed with lxml.
+    Only the fields we keep are read, and each entry is dropped from the tree once read,
+    so memory stays flat however long the feed is. Raises etree.XMLSyntaxError on bad XML.
+    """
+    feed_title = "Unknown Feed"
+    # Entity resolution is disabled: feeds are untrusted input
+    context = etree.iterparse(io.BytesIO(body), events=("end",), resolve_entities=False, no_network=True)
+    for _, elem in context:
+        tag = elem.tag
+        if tag in ("title", f"{_ATOM}title", f"{_RSS1}title"):
+            parent = elem.getparent()
+            if parent is not None and parent.tag in _FEED_TAGS:
+                feed_title = (elem.text or "").strip() or feed_title
+            continue
+        if tag not in _ENTRY_TAGS:
+            continue
+
+        if tag == f"{_ATOM}entry":
+            link = ""
+            for link_elem in elem.iterfind(f"{_ATOM}link"):
+                if link_elem.get("rel", "alternate") == "alternate":
+                    link = link_elem.get("href", "")
+                    break
+            summary = _atom_text(elem.find(f"{_ATOM}summary")) or _atom_text(elem.find(f"{_ATOM}content")) or ""
+            published_dt = _parse_date(elem.findtext(f"{_ATOM}published") or elem.findtext(f"{_ATOM}updated"))
+            title = _atom_text(elem.find(f"{_ATOM}title"))
+        else:
+            ns = _RSS1 if tag == f"{_RSS1}item" else ""
+            link = (elem.findtext(f"{ns}link") or "").strip()
+            summary = elem.findtext(f"{ns}description") or ""
+            published_dt = _parse_date(elem.findtext("pubDate") or elem.findtext(f"{_DC}date"))
+            title = elem.findtext(f"{ns}title")
+
+        yield {
+            "title": title.strip() if title else "No Title",
+            "link": link,
+            "summary": summary.strip(),
+            "published": published_dt.isoformat() if published_dt else "Unknown",
+            "feed_title": feed_title,
+        }
+
+        # Drop the entry and any siblings already read
+        elem.clear()
+        while elem.getprevious() is not None:
+            del elem.getparent()[0]
+
+
+# Summaries only end up as text in the agent's clipboard, so feedparser's HTML sanitizer and
+# relative-URI rewriting are skipped; they are a large share of its parse time. Like the lxml
+# parser's output, titles and summaries are untrusted HTML and must not be rendered as markup
+_FEEDPARSER_OPTIONS: dict[str, Any] = {"sanitize_html": False, "resolve_relative_uris": False}
+
+
+def _parse_feed(body: bytes, use_fast_parser: bool = True) -> list[dict[str, Any]]:
+    """Extract the entries of a downloaded feed body; CPU only, no network.
+    The lxml streaming parser is tried first; feedparser, which tolerates malformed feeds,
+    is the fallback.
+    """
+    if use_fast_parser:
+        try:
+            return list(_parse_rss_streaming(body))
+        except etree.LxmlError:
+            pass
+    return _feed_entries(feedparser.parse(body, **_FEEDPARSER_OPTIONS))
+
+
+def _conditional_headers(cached: _CachedFeed | None) -> dict[str, str]:
+    headers = {}
+    if cached and cached.etag:
+        headers["If-None-Match"] = cached.etag
+    if cached and cached.modified:
+        headers["If-Modified-Since"] = cached.modified
+    return headers
+
+
+def fetch_single_rss(url: str, since_days: int = 1, use_fast_parser: bool = True) -> list[dict[str, Any]]:
+    """Blocking function to fetch and parse a single RSS feed.
+    """
+    cached = _cache_get(url)
+
+    if not use_fast_parser:
+        # feedparser.parse is a blocking network call; it sends the cached validators as
+        # If-None-Match / If-Modified-Since headers
+        if cached:
+            feed_data: Any = feedparser.parse(
+                url, etag=cached.etag, modified=cached.modified, **_FEEDPARSER_OPTIONS,
+            )
+        else:
+            feed_data = feedparser.parse(url, **_FEEDPARSER_OPTIONS)
+
+        if cached and feed_data.get("status") == 304:
+            return _recent_entries(cached.entries, since_days)
+        entries = _feed_entries(feed_data)
+        _cache_put(url, feed_data.get("etag"), feed_data.get("modified"), entries)
+        return _recent_entries(entries, since_days)
+
+    response = httpx.get(
+        url,
+        headers={**RSS_HEADERS, **_conditional_headers(cached)},
+        timeout=RSS_FETCH_TIMEOUT,
+        follow_redirects=True,
+    )
+    if cached and response.status_code == 304:
+        return _recent_entries(cached.entries, since_days)
+    response.raise_for_status()
+    entries = _parse_rss_body(
+        url, response.content, response.headers.get("etag"), response.headers.get("last-modified"),
+    )
+    return _recent_entries(entries, since_days)
+
+
+def _parse_rss_body(url: str, body: bytes, etag: str | None, modified: str | None) -> list[dict[str, Any]]:
+    """Parse an already downloaded feed body and cache its entries; CPU only, no network."""
+    entries = _parse_feed(body)
+    _cache_put(url, etag, modified, entries)
+    return entries
+
+
+async def fetch_many_rss(
+    urls: list[str], since_days: int = 1,
+) -> list[list[dict[str, Any]] | BaseException]:
+    """Fetch several RSS feeds concurrently over one HTTP client.
+    The total latency is that of the slowest feed rather than the sum of all of them.
+    Returns one result per URL, in order: the entries, or the exception raised for that feed.
+    """
+    loop = asyncio.get_running_loop()
+
+    async def fetch(client: httpx.AsyncClient, url: str) -> list[dict[str, Any]]:
+        cached = await loop.run_in_executor(_rss_executor, _cache_get, url)
+        response = await client.get(url, headers=_conditional_headers(cached))
+        if cached and response.status_code == 304:
+            entries = cached.entries
+        else:
+            response.raise_for_status()
+            # Parsing is CPU bound, keep it off the event loop
+            entries = await loop.run_in_executor(
+                _rss_executor,
+                _parse_rss_body,
+                url,
+                response.content,
+                response.headers.get("etag"),
+                response.headers.get("last-modified"),
+            )
+        return _recent_entries(entries, since_days)
+
+    async with httpx.AsyncClient(
+        headers=RSS_HEADERS, timeout=RSS_FETCH_TIMEOUT, follow_redirects=True,
+    ) as client:
+        return await asyncio.gather(*(fetch(client, url) for url in urls), return_exceptions=True)
+
+
 class RssFetchTool(BaseTool):
+    __slots__ = ()
+
     name = "fetch_rss_feed"
     description = (
         "Fetch and parse recent entries from a specific RSS feed URL. "
@@ -55,6 +334,11 @@ class RssFetchTool(BaseTool):
         "type": "object",
         "properties": {
             "url": {"type": "string", "description": "The full URL of the RSS feed."},
+            "urls": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Optional additional RSS feed URLs, fetched together with 'url'.",
+            },
             "since_days": {
                 "type": "integer",
                 "default": 1,
@@ -69,40 +353,76 @@ class RssFetchTool(BaseTool):
         working_directory: Path,
         url: str,
         since_days: int = 1,
+        urls: list[str] | None = None,
         **kwargs: Any,
     ) -> ToolResult:
+        # Several feeds are fetched concurrently in one batch
+        if urls:
+            return await self._run_many([url, *urls], since_days)
+
         # Since this involves a blocking network call, we run it in a separate thread
         try:
-            entries = await asyncio.to_thread(fetch_single_rss, url=url, since_days=since_days)
+            entries = await asyncio.get_running_loop().run_in_executor(
+                _rss_executor, fetch_single_rss, url, since_days,
+            )
         except Exception as e:
-            return ToolResult(
+            return ToolResult.model_construct(
                 status="error", tool_response=f"Failed to fetch RSS feed from {url}: {e!s}",
             )
 
         if not entries:
-            return ToolResult(
+            return ToolResult.model_construct(
                 status="success",
                 tool_response=f"Connected to {url}, but no new entries were found for the last {since_days} day(s).",
             )
 
-        # Format the feed entries for the clipboard
-        formatted_entries = []
-        for entry in entries:
-            item_text = (
-                f"Source: {entry.get('feed_title')}\n"
-                f"Title: {entry.get('title')}\n"
-                f"Published: {entry.get('published')}\n"
-                f"Link: {entry.get('link')}\n"
-                f"Summary: {entry.get('summary')}\n"
-                "---"
-            )
-            formatted_entries.append(item_text)
-
-        return ToolResult(
+        return ToolResult.model_construct(
             status="success",
             tool_response=(
                 f"Successfully fetched {len(entries)} entries from the feed. "
                 "The headlines and summaries have been added to your clipboard."
             ),
-            results_to_add_to_clipboard=formatted_entries,
+            results_to_add_to_clipboard=_format_entries(entries),
+        )
+
+    async def _run_many(self, urls: list[str], since_days: int) -> ToolResult:
+        results = await fetch_many_rss(urls, since_days=since_days)
+
+        entries: list[dict[str, Any]] = []
+        failures: list[str] = []
+        for feed_url, result in zip(urls, results, strict=True):
+            if isinstance(result, BaseException):
+                failures.append(f"{feed_url}: {result!s}")
+                continue
+            entries.extend(result)
+
+        if len(failures) == len(urls):
+            return ToolResult.model_construct(
+                status="error", tool_response="Failed to fetch RSS feeds:\n" + "\n".join(failures),
+            )
+
+        tool_response = (
+            f"Successfully fetched {len(entries)} entries from {len(urls) - len(failures)} feed(s). "
+            "The headlines and summaries have been added to your clipboard."
+            if entries
+            else f"No new entries were found for the last {since_days} day(s)."
+        )
+        if failures:
+            tool_response += "\nFailed to fetch:\n" + "\n".join(failures)
+
+        return ToolResult.model_construct(
+            status="success",
+            tool_response=tool_response,
+            results_to_add_to_clipboard=_format_entries(entries) or None,
         )
+
+
+# Every parsed entry carries all five keys, so the template can index them directly
+_ENTRY_TEMPLATE = (
+    "Source: {feed_title}\nTitle: {title}\nPublished: {published}\nLink: {link}\nSummary: {summary}\n---"
+)
+
+
+def _format_entries(entries: list[dict[str, Any]]) -> list[str]:
+    """Format the feed entries for the clipboard."""
+    return [_ENTRY_TEMPLATE.format_map(entry) for entry in entries]
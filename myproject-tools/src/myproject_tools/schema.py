@@ -1,7 +1,7 @@
 from pathlib import Path
 from typing import Literal
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class TrackedEntity(BaseModel):
@@ -16,6 +16,12 @@ class TrackedEntity(BaseModel):
 
 
 class ToolResult(BaseModel):
+    """Results are built once by a tool and only read afterwards. Tools that build them from
+    trusted values can use ToolResult.model_construct() to skip validation.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
     status: Literal["success", "error"]
 
     # Tool results have three channels
@@ -6,6 +6,8 @@ from .schema import ToolResult
 
 
 class MockTestTool(BaseTool):
+    __slots__ = ()
+
     name = "test_tool"
     description = "A tool for testing the agent's ability to handle success and failure."
     parameters = {
@@ -20,7 +22,7 @@ class MockTestTool(BaseTool):
             # Test exception catching
             raise Exception(f"Simulated crash with input: {input_text}")
 
-        return ToolResult(
+        return ToolResult.model_construct(
             tool_response="Processed input text successfully and added to the clipboard",
             status="success",
             results_to_add_to_clipboard=[f"{input_text}"],
@@ -1,22 +1,107 @@
 import asyncio
+import hashlib
+import importlib.util
+import os
 import random
+from collections import OrderedDict
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from typing import Any
 
-import requests
-import trafilatura
+import httpx
 
 from .base import BaseTool
+from .cache import TTLCache
+from .process_pool import LazyProcessPool
 from .schema import ToolResult
 
+_USER_AGENTS = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
+)
+
+# Browser-like headers sent with every fetch; the User-Agent is picked per request
+_DEFAULT_HEADERS = {
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.5",
+    "Connection": "keep-alive",
+    "Upgrade-Insecure-Requests": "1",
+}
+
 
 def get_random_user_agent() -> str:
-    ua_list = [
-        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
-        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36",
-        "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
-    ]
-    return random.choice(ua_list)
+    return random.choice(_USER_AGENTS)
+
+
+# Connection pool of a fetch client. HTTP/2 multiplexes requests to a host over one connection;
+# it needs the optional h2 package (httpx[http2]), otherwise the client speaks HTTP/1.1
+FETCH_MAX_CONNECTIONS = 100
+FETCH_MAX_KEEPALIVE = 20
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
+
+def new_fetch_client(cookies: dict[str, str] | None = None) -> httpx.AsyncClient:
+    """Create an async client for fetch_page. Callers fetching several pages share one client,
+    so requests to the same host reuse its keep-alive connections.
+    """
+    return httpx.AsyncClient(
+        headers=_DEFAULT_HEADERS,
+        cookies=cookies,
+        follow_redirects=True,
+        http2=_HTTP2,
+        limits=httpx.Limits(
+            max_connections=FETCH_MAX_CONNECTIONS, max_keepalive_connections=FETCH_MAX_KEEPALIVE,
+        ),
+    )
+
+
+# Client used by fetch_page when the caller passes none, so every search and fetch shares one pool.
+# Connections belong to the event loop that opened them, so a new loop gets a new client
+_shared_client: tuple[asyncio.AbstractEventLoop, httpx.AsyncClient] | None = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    global _shared_client
+    loop = asyncio.get_running_loop()
+    if _shared_client is None or _shared_client[0] is not loop or _shared_client[1].is_closed:
+        _shared_client = (loop, new_fetch_client())
+    return _shared_client[1]
+
+
+# Pages are read up to this size; anything beyond is dropped before extraction
+FETCH_MAX_BYTES = 4 * 1024 * 1024
+_TEXT_CONTENT_TYPES = ("text/", "application/xhtml+xml", "application/xml")
+
+# Recent successful plain fetches by URL; pages rarely change within the hour an agent works on them
+PAGE_CACHE_SIZE = 2048
+PAGE_CACHE_TTL = 3600
+_page_cache: TTLCache[dict[str, Any]] = TTLCache(PAGE_CACHE_SIZE, PAGE_CACHE_TTL)
+
+# Recent extractions keyed by a digest of the raw page body. The same page is often fetched again
+# within a session (search results, repeated tool calls), and extraction is the CPU-heavy part
+EXTRACT_CACHE_SIZE = 256
+_extract_cache: OrderedDict[bytes, tuple[str | None, str]] = OrderedDict()
+
+
+def _extract_page(html: str) -> tuple[str | None, str]:
+    """Convert a page to Markdown and read its title; CPU bound, so it runs in the extract pool."""
+    # Imported here rather than at module level: only the extract worker processes need it
+    import trafilatura
+
+    md_content = trafilatura.extract(
+        html, output_format="markdown", include_formatting=True, include_links=True,
+    )
+
+    metadata = trafilatura.extract_metadata(html)
+    title = metadata.title if metadata else "No Title Found"
+    return md_content, title
+
+
+# trafilatura is pure Python and holds the GIL, so extracting in a thread would still stall the
+# event loop while other pages download. Extraction runs in a shared pool of worker processes instead
+EXTRACT_WORKERS = max(1, (os.cpu_count() or 2) // 2)
+_extract_pool = LazyProcessPool(EXTRACT_WORKERS)
 
 
 async def fetch_page(
@@ -26,74 +111,111 @@ async def fetch_page(
     delay_range: tuple = (1, 3),
     headers: dict[str, str] | None = None,
     cookies: dict[str, str] | None = None,
+    client: httpx.AsyncClient | None = None,
 ) -> dict[str, Any]:
     """Asynchronously fetches a URL and converts it to Markdown.
-    Uses asyncio.to_thread to wrap the blocking requests call.
+    The request runs on the event loop; only the Markdown extraction is offloaded to a worker process.
+    Without a client, the fetch uses the module's shared client and its connection pool.
     """
+    # Cookies belong to a client, so a fetch with cookies gets a client of its own
+    if cookies:
+        async with new_fetch_client(cookies) as own_client:
+            return await _fetch_with_retries(own_client, url, timeout, max_retries, delay_range, headers)
+    if client is not None or headers:
+        return await _fetch_with_retries(
+            client or _get_client(), url, timeout, max_retries, delay_range, headers,
+        )
 
-    # Inner blocking function to be offloaded to a thread
-    def _blocking_fetch():
-        session = requests.Session()
-
-        default_headers = {
-            "User-Agent": get_random_user_agent(),
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.5",
-            "Connection": "keep-alive",
-            "Upgrade-Insecure-Requests": "1",
-        }
-
-        if headers:
-            default_headers.update(headers)
-        session.headers.update(default_headers)
+    # Plain fetches through the shared client are answered from recent successful ones
+    page = _page_cache.get(url)
+    if page is None:
+        page = await _fetch_with_retries(_get_client(), url, timeout, max_retries, delay_range, None)
+        if "error" not in page:
+            _page_cache.put(url, page)
+    return dict(page)
 
-        if cookies:
-            session.cookies.update(cookies)
 
-        for attempt in range(max_retries + 1):
-            try:
-                if attempt > 0:
-                    import time
+async def _fetch_with_retries(
+    client: httpx.AsyncClient,
+    url: str,
+    timeout: int,
+    max_retries: int,
+    delay_range: tuple,
+    headers: dict[str, str] | None,
+) -> dict[str, Any]:
+    request_headers = {"User-Agent": get_random_user_agent()}
+    if headers:
+        request_headers.update(headers)
 
-                    time.sleep(random.uniform(*delay_range))
+    for attempt in range(max_retries + 1):
+        try:
+            if attempt > 0:
+                await asyncio.sleep(random.uniform(*delay_range))
 
-                # FIXED: allow_redirects=True (default is True anyway)
-                response = session.get(url, timeout=timeout, allow_redirects=True)
+            async with client.stream("GET", url, timeout=timeout, headers=request_headers) as response:
                 response.raise_for_status()
 
-                md_content = trafilatura.extract(
-                    response.text, output_format="markdown", include_formatting=True, include_links=True,
-                )
-
-                metadata = trafilatura.extract_metadata(response.text)
-                title = metadata.title if metadata else "No Title Found"
+                # Only HTML and other text is worth extracting; skip PDFs, images and archives
+                content_type = response.headers.get("content-type", "")
+                if content_type and not content_type.startswith(_TEXT_CONTENT_TYPES):
+                    return {
+                        "url": url,
+                        "status_code": response.status_code,
+                        "error": f"Unsupported content type: {content_type}",
+                        "content": None,
+                    }
 
-                return {
-                    "url": url,
-                    "status_code": response.status_code,
-                    "title": title,
-                    "content": md_content or None,
-                    "raw_html_len": len(response.text),
-                    "final_url": response.url,
-                }
+                # Read at most FETCH_MAX_BYTES; a truncated page still extracts fine
+                body = bytearray()
+                async for chunk in response.aiter_bytes(65536):
+                    body += chunk
+                    if len(body) >= FETCH_MAX_BYTES:
+                        del body[FETCH_MAX_BYTES:]
+                        break
+                html = body.decode(response.encoding or "utf-8", errors="replace")
 
-            except requests.exceptions.RequestException as e:
-                if attempt == max_retries:
+            key = hashlib.blake2b(body, digest_size=16).digest()
+            cached = _extract_cache.get(key)
+            if cached is not None:
+                _extract_cache.move_to_end(key)
+                md_content, title = cached
+            else:
+                try:
+                    md_content, title = await _extract_pool.run(_extract_page, html)
+                except BrokenProcessPool as e:
                     return {
                         "url": url,
-                        "status_code": getattr(e.response, "status_code", None)
-                        if hasattr(e, "response")
-                        else None,
-                        "error": str(e),
+                        "status_code": response.status_code,
+                        "error": f"Content extraction failed: {e}",
                         "content": None,
                     }
-        return {"url": url, "error": "Max retries reached", "content": None}
+                _extract_cache[key] = (md_content, title)
+                if len(_extract_cache) > EXTRACT_CACHE_SIZE:
+                    _extract_cache.popitem(last=False)
 
-    # Offload the blocking _blocking_fetch to a thread so we can 'await' it
-    return await asyncio.to_thread(_blocking_fetch)
+            return {
+                "url": url,
+                "status_code": response.status_code,
+                "title": title,
+                "content": md_content or None,
+                "raw_html_len": len(html),
+                "final_url": str(response.url),
+            }
+
+        except httpx.HTTPError as e:
+            if attempt == max_retries:
+                return {
+                    "url": url,
+                    "status_code": e.response.status_code if isinstance(e, httpx.HTTPStatusError) else None,
+                    "error": str(e),
+                    "content": None,
+                }
+    return {"url": url, "error": "Max retries reached", "content": None}
 
 
 class WebPageFetchTool(BaseTool):
+    __slots__ = ()
+
     name = "fetch_web_page"
     description = (
         "Fetch a URL from the internet, extract its main text content, "
@@ -128,13 +250,12 @@ class WebPageFetchTool(BaseTool):
         max_retries: int = 2,
         **kwargs: Any,
     ) -> ToolResult:
-        # fetch_page is already async and handles its own thread offloading
         result = await fetch_page(url=url, timeout=timeout, max_retries=max_retries)
 
         # Handle errors from the fetch function
         if "error" in result or not result.get("content"):
             error_msg = result.get("error", "Unknown error or no content found.")
-            return ToolResult(status="error", tool_response=f"Failed to fetch {url}: {error_msg}")
+            return ToolResult.model_construct(status="error", tool_response=f"Failed to fetch {url}: {error_msg}")
 
         # Prepare clipboard content
         page_title = result.get("title", "No Title Found")
@@ -143,7 +264,7 @@ class WebPageFetchTool(BaseTool):
 
         clipboard_text = f"### Web Page: {page_title}\nURL: {final_url}\n---\n\n{md_content}"
 
-        return ToolResult(
+        return ToolResult.model_construct(
             status="success",
             tool_response=(
                 f"Successfully fetched '{page_title}'. "
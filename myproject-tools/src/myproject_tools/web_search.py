@@ -1,16 +1,24 @@
 import asyncio
+import atexit
+import functools
+import os
+import threading
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, replace
+from operator import itemgetter
 from pathlib import Path
-from typing import Any
-
-from ddgs import DDGS
-from pydantic import BaseModel
+from typing import TYPE_CHECKING, Any
 
 from .base import BaseTool
+from .cache import TTLCache
 from .schema import ToolResult
-from .web_fetch import fetch_page
+
+if TYPE_CHECKING:
+    from ddgs import DDGS
 
 
-class SearchResult(BaseModel):
+@dataclass(slots=True)
+class SearchResult:
     title: str
     url: str
     snippet: str
@@ -20,63 +28,244 @@ class SearchResult(BaseModel):
     source: str | None = None
 
 
-async def search_web(query: str, max_results: int = 5, fetch_full: bool = False) -> list[SearchResult]:
-    results = []
+# Optional comma-separated proxies for DDGS. When set, each retry of a rate-limited search goes
+# out through the next proxy. Unset, searches use one client (which honours ddgs' own DDGS_PROXY)
+DDGS_PROXIES = [p.strip() for p in os.environ.get("MYPROJECT_DDGS_PROXIES", "").split(",") if p.strip()]
+
+
+_ddgs_clients: dict[str | None, "DDGS"] = {}
+_ddgs_lock = threading.Lock()
+
+
+def _get_ddgs(proxy: str | None = None) -> "DDGS":
+    """One DDGS client per proxy for all searches, so consecutive searches reuse its HTTP session.
+    ddgs is imported on the first search rather than when the tool module loads. Searches run in
+    worker threads, so creation is locked to keep concurrent first searches on one client.
+    """
+    ddgs = _ddgs_clients.get(proxy)
+    if ddgs is None:
+        with _ddgs_lock:
+            ddgs = _ddgs_clients.get(proxy)
+            if ddgs is None:
+                from ddgs import DDGS
+
+                ddgs = _ddgs_clients[proxy] = DDGS(proxy=proxy)
+                atexit.register(ddgs.__exit__, None, None, None)
+    return ddgs
+
+
+# DDGS searches are blocking network calls, so they run in a thread to keep the event loop free
+def _ddgs_text(query: str, max_results: int, proxy: str | None) -> list[dict[str, Any]]:
+    return list(
+        _get_ddgs(proxy).text(query, region="wt-wt", safesearch="moderate", max_results=max_results),
+    )
+
+
+def _ddgs_news(query: str, max_results: int, proxy: str | None) -> list[dict[str, Any]]:
+    return list(_get_ddgs(proxy).news(query, max_results=max_results))
+
+
+class _LoopSemaphore:
+    """An asyncio.Semaphore per event loop, since a semaphore is bound to the loop it is first used on."""
+
+    __slots__ = ("_limit", "_loop", "_semaphore")
+
+    def __init__(self, limit: int):
+        self._limit = limit
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+
+    def get(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            self._loop, self._semaphore = loop, asyncio.Semaphore(self._limit)
+        return self._semaphore
+
+
+# DuckDuckGo rate-limits bursts of searches. At most DDGS_CONCURRENCY searches run at once, and
+# rate-limited or timed-out ones are retried after 1, 2, 4 and 8 seconds
+DDGS_CONCURRENCY = 8
+DDGS_MAX_RETRIES = 4
+DDGS_BACKOFF = 1.0
+_ddgs_limit = _LoopSemaphore(DDGS_CONCURRENCY)
+
+
+async def _search_with_retry(
+    search: Callable[[str, int, str | None], list[dict[str, Any]]], query: str, max_results: int,
+) -> list[dict[str, Any]]:
+    from ddgs.exceptions import RatelimitException, TimeoutException
+
+    for attempt in range(DDGS_MAX_RETRIES + 1):
+        proxy = DDGS_PROXIES[attempt % len(DDGS_PROXIES)] if DDGS_PROXIES else None
+        try:
+            async with _ddgs_limit.get():
+                return await asyncio.to_thread(search, query, max_results, proxy)
+        except (RatelimitException, TimeoutException):
+            if attempt == DDGS_MAX_RETRIES:
+                raise
+            await asyncio.sleep(DDGS_BACKOFF * 2**attempt)
+    return []
+
+
+async def _search_or_empty(
+    search: Callable[[str, int, str | None], list[dict[str, Any]]], query: str, max_results: int,
+) -> list[dict[str, Any]]:
+    """Run a search, treating a DDGS failure (including "no results") as an empty result list.
+    Anything else is a bug and propagates to the caller.
+    """
+    from ddgs.exceptions import DDGSException
+
     try:
-        with DDGS() as ddgs:
-            search_results = ddgs.text(
-                query,
-                region="wt-wt",
-                safesearch="moderate",
-                max_results=max_results,
-            )
-
-            for r in search_results:
-                # Instantiate the class directly
-                item = SearchResult(
-                    title=r.get("title", ""), url=r.get("href", ""), snippet=r.get("body", ""),
-                )
-
-                if fetch_full:
-                    full_data = await fetch_page(item.url)
-                    item.full_content = full_data.get("content", "")
-
-                results.append(item)
-
-        return results
-    except Exception as e:
+        return await _search_with_retry(search, query, max_results)
+    except DDGSException as e:
         print(f"DDGS Search Error: {e}")
         return []
 
 
+# Upper bound on result pages fetched at once across all searches, so a large max_results or many
+# concurrent searches do not exhaust sockets or flood the upstreams
+FULL_FETCH_CONCURRENCY = int(os.environ.get("MYPROJECT_FETCH_CONCURRENCY", "32"))
+_fetch_limit = _LoopSemaphore(FULL_FETCH_CONCURRENCY)
+
+
+async def _bounded_fetch(url: str) -> dict[str, Any]:
+    # web_fetch pulls in trafilatura, the bulk of this module's import time, and is only needed
+    # when full page content is requested
+    from .web_fetch import fetch_page
+
+    async with _fetch_limit.get():
+        return await fetch_page(url)
+
+
+async def _fetch_full_content(items: list[SearchResult]) -> None:
+    """Fetch every result page concurrently and fill in its full_content; a failed fetch leaves it None."""
+    pages = await asyncio.gather(*(_bounded_fetch(item.url) for item in items), return_exceptions=True)
+    for item, page in zip(items, pages, strict=True):
+        item.full_content = None if isinstance(page, BaseException) else page.get("content", "")
+
+
+# Recent searches by (query, max_results, fetch_full), so a repeated query does not hit DDGS again
+SEARCH_CACHE_SIZE = 256
+SEARCH_CACHE_TTL = 300
+_web_cache: TTLCache[list[SearchResult]] = TTLCache(SEARCH_CACHE_SIZE, SEARCH_CACHE_TTL)
+_news_cache: TTLCache[list[SearchResult]] = TTLCache(SEARCH_CACHE_SIZE, SEARCH_CACHE_TTL)
+
+# Searches in progress, so concurrent callers with the same query share one DDGS request
+_inflight: dict[tuple[str, str, int, bool], asyncio.Task[list[SearchResult]]] = {}
+
+
+def _copy_results(results: list[SearchResult]) -> list[SearchResult]:
+    # Callers may modify the results they get, so the cache hands out copies
+    return [replace(item) for item in results]
+
+
+async def _shared_search(
+    kind: str,
+    cache: TTLCache[list[SearchResult]],
+    search: Callable[[str, int, bool], Awaitable[list[SearchResult]]],
+    query: str,
+    max_results: int,
+    fetch_full: bool,
+) -> list[SearchResult]:
+    """Answer a search from the cache, join an identical search in progress, or run it."""
+    cached = cache.get((query, max_results, fetch_full))
+    if cached is not None:
+        return _copy_results(cached)
+
+    # The search runs as its own task, so cancelling any one caller, the first included, does not
+    # cancel it for the others who joined
+    key = (kind, query, max_results, fetch_full)
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(search(query, max_results, fetch_full))
+        _inflight[key] = task
+        task.add_done_callback(functools.partial(_finish_search, key, cache))
+    return _copy_results(await asyncio.shield(task))
+
+
+def _finish_search(
+    key: tuple[str, str, int, bool], cache: TTLCache[list[SearchResult]], task: asyncio.Task,
+) -> None:
+    if _inflight.get(key) is task:
+        del _inflight[key]
+    if task.cancelled():
+        return
+    # Reading the exception marks it retrieved when every caller has since been cancelled
+    if task.exception() is None and (results := task.result()):
+        _, query, max_results, fetch_full = key
+        cache.put((query, max_results, fetch_full), _copy_results(results))
+
+
+async def search_web(query: str, max_results: int = 5, fetch_full: bool = False) -> list[SearchResult]:
+    return await _shared_search("web", _web_cache, _search_web, query, max_results, fetch_full)
+
+
 async def search_news(query: str, max_results: int = 5, fetch_full: bool = False) -> list[SearchResult]:
-    results = []
+    return await _shared_search("news", _news_cache, _search_news, query, max_results, fetch_full)
+
+
+# DDGS rows carry all of these keys, so they are read in one C-level call. A row missing one
+# falls back to per-key defaults
+_TEXT_FIELDS = itemgetter("title", "href", "body")
+_NEWS_FIELDS = itemgetter("title", "url", "body", "date", "source")  # News rows use 'url', not 'href'
+
+
+def _text_result(r: dict[str, Any]) -> SearchResult:
     try:
-        with DDGS() as ddgs:
-            # await the async call
-            news_results = ddgs.news(query, max_results=max_results)
-
-            for r in news_results:
-                item = SearchResult(
-                    title=r.get("title", ""),
-                    url=r.get("url", ""),  # News results use 'url' instead of 'href'
-                    snippet=r.get("body", ""),
-                    date=r.get("date"),
-                    source=r.get("source"),
-                )
-
-                if fetch_full:
-                    full_data = await fetch_page(item.url)
-                    item.full_content = full_data.get("content", "")
-
-                results.append(item)
-        return results
-    except Exception as e:
-        print(f"DDGS News Error: {e}")
-        return []
+        return SearchResult(*_TEXT_FIELDS(r))
+    except KeyError:
+        return SearchResult(r.get("title", ""), r.get("href", ""), r.get("body", ""))
+
+
+def _news_result(r: dict[str, Any]) -> SearchResult:
+    try:
+        title, url, snippet, date, source = _NEWS_FIELDS(r)
+    except KeyError:
+        title, url, snippet = r.get("title", ""), r.get("url", ""), r.get("body", "")
+        date, source = r.get("date"), r.get("source")
+    return SearchResult(title, url, snippet, date=date, source=source)
+
+
+async def _search_web(query: str, max_results: int, fetch_full: bool) -> list[SearchResult]:
+    search_results = await _search_or_empty(_ddgs_text, query, max_results)
+    results = [_text_result(r) for r in search_results]
+
+    if fetch_full:
+        await _fetch_full_content(results)
+    return results
+
+
+async def _search_news(query: str, max_results: int, fetch_full: bool) -> list[SearchResult]:
+    news_results = await _search_or_empty(_ddgs_news, query, max_results)
+    results = [_news_result(r) for r in news_results]
+
+    if fetch_full:
+        await _fetch_full_content(results)
+    return results
+
+
+def _format_result(r: SearchResult) -> str:
+    """Format a web search result for the clipboard in a single f-string."""
+    full = f"Full Content (Markdown):\n{r.full_content}\n" if r.full_content else ""
+    return f"Title: {r.title}\nURL: {r.url}\nSnippet: {r.snippet}\n{full}---"
+
+
+def _format_news(r: SearchResult) -> str:
+    """Format a news result for the clipboard in a single f-string."""
+    full = f"Full Article Content:\n{r.full_content}\n" if r.full_content else ""
+    return (
+        f"Headline: {r.title}\n"
+        f"Source: {r.source or 'Unknown'}\n"
+        f"Date: {r.date or 'Unknown'}\n"
+        f"URL: {r.url}\n"
+        f"Snippet: {r.snippet}\n"
+        f"{full}---"
+    )
 
 
 class WebSearchTool(BaseTool):
+    __slots__ = ()
+
     name = "web_search"
     description = (
         "Search the internet for a given query. Returns a list of titles, snippets, and URLs. "
@@ -113,13 +302,7 @@ class WebSearchTool(BaseTool):
         if not results:
             return ToolResult(status="success", tool_response=f"No results found for query: {query}")
 
-        formatted_results = []
-        for r in results:
-            entry = f"Title: {r.title}\nURL: {r.url}\nSnippet: {r.snippet}\n"
-            if r.full_content:
-                entry += f"Full Content (Markdown):\n{r.full_content}\n"
-            entry += "---"
-            formatted_results.append(entry)
+        formatted_results = [_format_result(r) for r in results]
 
         return ToolResult(
             status="success",
@@ -129,6 +312,8 @@ class WebSearchTool(BaseTool):
 
 
 class NewsSearchTool(BaseTool):
+    __slots__ = ()
+
     name = "news_search"
     description = (
         "Search for recent news articles. Returns headlines, sources, dates, and snippets. "
@@ -165,19 +350,7 @@ class NewsSearchTool(BaseTool):
         if not results:
             return ToolResult(status="success", tool_response=f"No recent news found for query: {query}")
 
-        formatted_news = []
-        for r in results:
-            entry = (
-                f"Headline: {r.title}\n"
-                f"Source: {r.source or 'Unknown'}\n"
-                f"Date: {r.date or 'Unknown'}\n"
-                f"URL: {r.url}\n"
-                f"Snippet: {r.snippet}\n"
-            )
-            if r.full_content:
-                entry += f"Full Article Content:\n{r.full_content}\n"
-            entry += "---"
-            formatted_news.append(entry)
+        formatted_news = [_format_news(r) for r in results]
 
         return ToolResult(
             status="success",
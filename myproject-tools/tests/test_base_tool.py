@@ -0,0 +1,74 @@
+"""Unit tests for BaseTool path validation."""
+
+import os
+from pathlib import Path
+
+import pytest
+from myproject_tools.base import BaseTool
+from myproject_tools.schema import ToolResult
+
+
+class _NoopTool(BaseTool):
+    name = "noop"
+    description = "Does nothing."
+    parameters = {"type": "object", "properties": {}}
+
+    async def run(self, working_directory: Path, *args, **kwargs) -> ToolResult:
+        return ToolResult(status="success", tool_response="")
+
+
+class TestValidatePath:
+    @pytest.fixture
+    def dirs(self, tmp_path: Path) -> tuple[Path, Path]:
+        root = tmp_path.resolve()
+        workdir = root / "work"
+        outside = root / "outside"
+        workdir.mkdir()
+        outside.mkdir()
+        (workdir / "f.txt").write_text("hello")
+        (outside / "secret.txt").write_text("secret")
+        return workdir, outside
+
+    @pytest.fixture
+    def tool(self):
+        return _NoopTool()
+
+    def test_existing_file_is_returned(self, tool, dirs):
+        workdir, _ = dirs
+        assert tool._validate_path(workdir, "f.txt", should_be_file=True) == workdir / "f.txt"
+
+    def test_dotdot_escape_is_denied(self, tool, dirs):
+        workdir, _ = dirs
+        with pytest.raises(ValueError, match="Access denied"):
+            tool._validate_path(workdir, "../outside/secret.txt")
+        with pytest.raises(ValueError, match="Access denied"):
+            tool._validate_path(workdir, "sub/../../outside")
+
+    def test_absolute_path_outside_is_denied(self, tool, dirs):
+        workdir, outside = dirs
+        with pytest.raises(ValueError, match="Access denied"):
+            tool._validate_path(workdir, str(outside / "secret.txt"))
+
+    def test_symlink_escape_is_denied(self, tool, dirs):
+        workdir, outside = dirs
+        os.symlink(outside, workdir / "link")
+        with pytest.raises(ValueError, match="Access denied"):
+            tool._validate_path(workdir, "link/secret.txt")
+
+    def test_symlink_inside_is_allowed(self, tool, dirs):
+        workdir, _ = dirs
+        os.symlink(workdir / "f.txt", workdir / "alias.txt")
+        assert tool._validate_path(workdir, "alias.txt") == workdir / "alias.txt"
+
+    def test_missing_parent_reports_missing_path(self, tool, dirs):
+        workdir, _ = dirs
+        with pytest.raises(ValueError, match="Path does not exist"):
+            tool._validate_path(workdir, "missing/sub/file.txt")
+        assert (
+            tool._validate_path(workdir, "missing/new.txt", must_exist=False) == workdir / "missing/new.txt"
+        )
+
+    def test_file_used_as_parent_reports_missing_path(self, tool, dirs):
+        workdir, _ = dirs
+        with pytest.raises(ValueError, match="Path does not exist"):
+            tool._validate_path(workdir, "f.txt/sub")
@@ -0,0 +1,99 @@
+"""Unit tests for the file tools module."""
+
+import asyncio
+import shutil
+from pathlib import Path
+
+import pytest
+from myproject_tools import file
+from myproject_tools.file import FindFilesTool, SearchFileContentTool, _rg_search, _scan_file, _walk_files
+
+
+class TestWalkFiles:
+    @pytest.fixture
+    def tree(self, tmp_path: Path) -> Path:
+        root = tmp_path.resolve()
+        for rel in ["src/a.py", "src/b.py", "src/sub/n.py", "src/notes.md", ".git/src/x.py"]:
+            path = root / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("")
+        return root
+
+    def _walk(self, root: Path, pattern: str) -> list[str]:
+        return sorted(
+            str(Path(p).relative_to(root)) for p in _walk_files(root, pattern, frozenset({".git"}))
+        )
+
+    def test_name_pattern_matches_at_any_depth(self, tree):
+        assert self._walk(tree, "*.py") == ["src/a.py", "src/b.py", "src/sub/n.py"]
+
+    def test_separator_pattern_does_not_cross_directories(self, tree):
+        assert self._walk(tree, "src/*.py") == ["src/a.py", "src/b.py"]
+
+    def test_double_star_matches_any_depth(self, tree):
+        assert self._walk(tree, "src/**/*.py") == ["src/a.py", "src/b.py", "src/sub/n.py"]
+
+    @pytest.mark.parametrize("pattern", ["*.py", "src/*.py", "sub/*.py", "src/**/*.py", "**/*.md"])
+    def test_matches_rglob(self, tree, pattern):
+        expected = sorted(
+            str(p.relative_to(tree)) for p in tree.rglob(pattern) if p.is_file() and ".git" not in p.parts
+        )
+        assert self._walk(tree, pattern) == expected
+
+    def test_find_files_tool_uses_component_matching(self, tree):
+        result = asyncio.run(FindFilesTool().run(tree, pattern="src/*.py"))
+        assert result.status == "success"
+        (listing,) = result.results_to_add_to_clipboard
+        header, *paths = listing.split("\n- ")
+        assert header == "Found 2 matches for 'src/*.py':"
+        assert sorted(paths) == ["src/a.py", "src/b.py"]
+
+
+class TestScanFile:
+    @pytest.fixture
+    def log_file(self, tmp_path: Path) -> Path:
+        path = tmp_path / "app.log"
+        path.write_text("start\n  needle one\nmiddle\nneedle two\r\nend")
+        return path
+
+    @pytest.mark.parametrize("read_whole_max", [0, 1024 * 1024], ids=["streamed", "whole"])
+    def test_reports_matching_lines(self, log_file, monkeypatch, read_whole_max):
+        monkeypatch.setattr(file, "SEARCH_READ_WHOLE_MAX", read_whole_max)
+        assert _scan_file(str(log_file), "needle", "app.log") == [
+            "app.log:2: needle one",
+            "app.log:4: needle two",
+        ]
+
+    def test_stops_at_the_match_limit(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(file, "SEARCH_READ_WHOLE_MAX", 0)
+        path = tmp_path / "big.log"
+        path.write_text("needle\n" * (file.SEARCH_MAX_MATCHES + 5))
+        assert len(_scan_file(str(path), "needle", "big.log")) == file.SEARCH_MAX_MATCHES
+
+    def test_unreadable_file_has_no_matches(self, tmp_path):
+        assert _scan_file(str(tmp_path / "missing.log"), "needle", "missing.log") == []
+
+
+@pytest.mark.skipif(shutil.which("rg") is None, reason="ripgrep is not installed")
+class TestRgSearch:
+    @pytest.fixture
+    def tree(self, tmp_path: Path) -> Path:
+        root = tmp_path.resolve()
+        for rel in ["src/y.py", "a/src/x.py", "src/sub/n.py", "src/notes.md", "other.py", ".git/src/z.py"]:
+            path = root / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("needle\n")
+        return root
+
+    @pytest.mark.parametrize("pattern", ["*", "*.py", "src/*.py", "sub/*.py", "src/**/*.py", "**/*.md"])
+    def test_matches_rglob(self, tree, pattern):
+        expected = sorted(
+            f"{p.relative_to(tree)}:1: needle"
+            for p in tree.rglob(pattern)
+            if p.is_file() and ".git" not in p.parts
+        )
+        matches, truncated = asyncio.run(
+            _rg_search(tree, tree, "needle", pattern, SearchFileContentTool.IGNORE_DIRS),
+        )
+        assert not truncated
+        assert sorted(matches) == expected
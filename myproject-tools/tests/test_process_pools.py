@@ -0,0 +1,65 @@
+"""Unit tests for recovering the shared worker pools after a worker dies."""
+
+import asyncio
+import os
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+
+import pytest
+from myproject_tools import pdf, web_fetch
+from myproject_tools.process_pool import LazyProcessPool
+
+
+def _break(pool: LazyProcessPool):
+    executor = pool.get()
+    with pytest.raises(BrokenProcessPool):
+        executor.submit(os._exit, 1).result()
+    return executor
+
+
+class TestLazyProcessPool:
+    @pytest.fixture
+    def pool(self):
+        pool = LazyProcessPool(max_workers=1)
+        yield pool
+        pool.shutdown()
+
+    def test_pool_is_created_once(self, pool):
+        assert pool.get() is pool.get()
+
+    def test_broken_pool_is_replaced_and_retried(self, pool):
+        broken = _break(pool)
+
+        assert asyncio.run(pool.run(divmod, 7, 2)) == (3, 1)
+        assert pool.get() is not broken
+
+    def test_discard_keeps_a_newer_pool(self, pool):
+        broken = _break(pool)
+        pool.discard(broken)
+        newer = pool.get()
+        pool.discard(broken)
+        assert pool.get() is newer
+
+    def test_extraction_recovers_from_a_dead_worker(self, monkeypatch):
+        pool = LazyProcessPool(max_workers=1)
+        monkeypatch.setattr(web_fetch, "_extract_pool", pool)
+        _break(pool)
+        html = "<html><head><title>Hello</title></head><body><p>Some text.</p></body></html>"
+        try:
+            _, title = asyncio.run(web_fetch._extract_pool.run(web_fetch._extract_page, html))
+        finally:
+            pool.shutdown()
+        assert title == "Hello"
+
+    def test_pdf_conversion_recovers_from_a_dead_worker(self, monkeypatch, tmp_path: Path):
+        pytest.importorskip("pymupdf4llm")
+        pool = LazyProcessPool(max_workers=1)
+        monkeypatch.setattr(pdf, "_pdf_pool", pool)
+        broken = _break(pool)
+        try:
+            # A missing file converts to "" in the worker, so this only checks the pool recovery
+            md_text = asyncio.run(pdf.convert_pdf_to_markdown_async(tmp_path / "missing.pdf"))
+            assert pool.get() is not broken
+        finally:
+            pool.shutdown()
+        assert md_text == ""
@@ -0,0 +1,138 @@
+"""Unit tests for the streaming feed parser in rss_utils, checked against feedparser."""
+
+import feedparser
+import httpx
+import pytest
+from myproject_tools import rss_utils
+from myproject_tools.rss_utils import _FEEDPARSER_OPTIONS, _feed_entries, _parse_feed, _parse_rss_streaming
+
+RSS2_FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0" xmlns:dc="http://purl.org/dc/elements/1.1/">
+  <channel>
+    <title>Example News</title>
+    <link>https://example.com/</link>
+    <description>Latest stories</description>
+    <item>
+      <title> First story </title>
+      <link>https://example.com/1</link>
+      <description>&lt;p&gt;Plain &amp;amp; simple&lt;/p&gt;</description>
+      <pubDate>Thu, 01 Oct 2026 10:00:00 +0200</pubDate>
+    </item>
+    <item>
+      <title>Second story</title>
+      <link>https://example.com/2</link>
+      <description><![CDATA[<b>Bold</b> summary]]></description>
+      <dc:date>2026-10-02T08:30:00Z</dc:date>
+    </item>
+    <item>
+      <title>Undated story</title>
+      <link>https://example.com/3</link>
+    </item>
+  </channel>
+</rss>
+"""
+
+RDF_FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+         xmlns="http://purl.org/rss/1.0/"
+         xmlns:dc="http://purl.org/dc/elements/1.1/">
+  <channel rdf:about="https://example.org/">
+    <title>Example RDF</title>
+    <link>https://example.org/</link>
+    <description>An RSS 1.0 feed</description>
+  </channel>
+  <item rdf:about="https://example.org/a">
+    <title>Alpha</title>
+    <link>https://example.org/a</link>
+    <description>First item</description>
+    <dc:date>2026-10-03T12:00:00+00:00</dc:date>
+  </item>
+  <item rdf:about="https://example.org/b">
+    <title>Beta</title>
+    <link>https://example.org/b</link>
+    <description>Second item</description>
+    <dc:date>2026-10-04T06:15:00-05:00</dc:date>
+  </item>
+</rdf:RDF>
+"""
+
+ATOM_FEED = b"""<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <title>Example Atom</title>
+  <id>urn:example:feed</id>
+  <updated>2026-10-05T00:00:00Z</updated>
+  <entry>
+    <title>Text summary</title>
+    <id>urn:example:1</id>
+    <link rel="alternate" href="https://example.net/1"/>
+    <published>2026-10-05T09:00:00Z</published>
+    <updated>2026-10-05T10:00:00Z</updated>
+    <summary>Plain text summary</summary>
+  </entry>
+  <entry>
+    <title type="html">HTML &amp;amp; entities</title>
+    <id>urn:example:2</id>
+    <link rel="self" href="https://example.net/2.atom"/>
+    <link href="https://example.net/2"/>
+    <updated>2026-10-05T11:00:00+01:00</updated>
+    <summary type="html">&lt;p&gt;Escaped &lt;em&gt;markup&lt;/em&gt;&lt;/p&gt;</summary>
+  </entry>
+  <entry>
+    <title>XHTML summary</title>
+    <id>urn:example:3</id>
+    <link href="https://example.net/3"/>
+    <updated>2026-10-05T12:00:00Z</updated>
+    <summary type="xhtml"><div xmlns="http://www.w3.org/1999/xhtml">Intro <p>Some <b>bold</b> text</p> tail</div></summary>
+  </entry>
+  <entry>
+    <title>Content only</title>
+    <id>urn:example:4</id>
+    <link href="https://example.net/4"/>
+    <updated>2026-10-05T13:00:00Z</updated>
+    <content type="xhtml"><div xmlns="http://www.w3.org/1999/xhtml"><p>Body text</p></div></content>
+  </entry>
+</feed>
+"""
+
+
+class TestParseRssStreaming:
+    @pytest.mark.parametrize(
+        "body",
+        [RSS2_FEED, RDF_FEED, ATOM_FEED],
+        ids=["rss2", "rss1-rdf", "atom"],
+    )
+    def test_matches_feedparser(self, body):
+        expected = _feed_entries(feedparser.parse(body, **_FEEDPARSER_OPTIONS))
+        assert list(_parse_rss_streaming(body)) == expected
+
+    def test_atom_xhtml_summary_keeps_markup(self):
+        entries = list(_parse_rss_streaming(ATOM_FEED))
+        assert entries[2]["summary"] == "Intro <p>Some <b>bold</b> text</p> tail"
+        assert entries[3]["summary"] == "<p>Body text</p>"
+
+    def test_malformed_feed_falls_back_to_feedparser(self):
+        body = RSS2_FEED.replace(b"</channel>", b"")
+        entries = _parse_feed(body)
+        assert [entry["link"] for entry in entries] == [
+            "https://example.com/1",
+            "https://example.com/2",
+            "https://example.com/3",
+        ]
+
+
+class TestFetchSingleRss:
+    def test_sends_feedparser_user_agent(self, monkeypatch):
+        sent_headers = {}
+
+        def fake_get(url, headers, **kwargs):
+            sent_headers.update(headers)
+            return httpx.Response(200, content=RSS2_FEED, request=httpx.Request("GET", url))
+
+        monkeypatch.setattr(rss_utils, "_cache_get", lambda url: None)
+        monkeypatch.setattr(rss_utils, "_cache_put", lambda *args: None)
+        monkeypatch.setattr(rss_utils.httpx, "get", fake_get)
+
+        entries = rss_utils.fetch_single_rss("https://example.com/feed.xml", since_days=100000)
+
+        assert sent_headers["User-Agent"] == feedparser.USER_AGENT
+        assert len(entries) == 3
@@ -0,0 +1,84 @@
+"""Unit tests for the shared search path in web_search."""
+
+import asyncio
+
+import pytest
+from myproject_tools import web_search
+from myproject_tools.cache import TTLCache
+from myproject_tools.web_search import SearchResult, _shared_search
+
+
+@pytest.fixture(autouse=True)
+def clear_inflight():
+    web_search._inflight.clear()
+    yield
+    web_search._inflight.clear()
+
+
+class TestSharedSearch:
+    def test_concurrent_identical_searches_run_once(self):
+        calls = 0
+
+        async def search(query, max_results, fetch_full):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return [SearchResult(query, "https://example.com", "snippet")]
+
+        async def main():
+            cache = TTLCache(8, 60)
+            return await asyncio.gather(
+                *(_shared_search("web", cache, search, "q", 5, False) for _ in range(3)),
+            )
+
+        results = asyncio.run(main())
+        assert calls == 1
+        assert [len(r) for r in results] == [1, 1, 1]
+        # Each caller gets its own copies
+        assert results[0][0] is not results[1][0]
+
+    def test_cancelling_the_first_caller_does_not_cancel_the_others(self):
+        async def main():
+            cache = TTLCache(8, 60)
+            release = asyncio.Event()
+            entered = asyncio.Event()
+
+            async def search(query, max_results, fetch_full):
+                entered.set()
+                await release.wait()
+                return [SearchResult(query, "https://example.com", "snippet")]
+
+            leader = asyncio.create_task(_shared_search("web", cache, search, "q", 5, False))
+            await entered.wait()
+            follower = asyncio.create_task(_shared_search("web", cache, search, "q", 5, False))
+            await asyncio.sleep(0)
+
+            leader.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await leader
+
+            release.set()
+            results = await follower
+            return results, cache.get(("q", 5, False))
+
+        results, cached = asyncio.run(main())
+        assert [r.title for r in results] == ["q"]
+        assert cached is not None
+        assert web_search._inflight == {}
+
+    def test_errors_reach_every_caller_and_are_not_cached(self):
+        async def search(query, max_results, fetch_full):
+            await asyncio.sleep(0.01)
+            raise RuntimeError("boom")
+
+        async def main():
+            cache = TTLCache(8, 60)
+            results = await asyncio.gather(
+                *(_shared_search("web", cache, search, "q", 5, False) for _ in range(2)),
+                return_exceptions=True,
+            )
+            return results, cache.get(("q", 5, False))
+
+        results, cached = asyncio.run(main())
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert cached is None